@@ -7,6 +7,7 @@ from core.db.base import Base
 from settings import POSTGRESQL
 
 # import models here
+from imports.models import Import
 from organisations.models import Organisation
 from users.models import User
 
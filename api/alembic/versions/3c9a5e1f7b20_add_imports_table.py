@@ -0,0 +1,39 @@
+"""add_imports_table
+
+Revision ID: 3c9a5e1f7b20
+Revises: d4e7b2a90f31
+Create Date: 2026-10-17 18:12:44.190264
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '3c9a5e1f7b20'
+down_revision = 'd4e7b2a90f31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('imports',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('status', sa.Integer(), nullable=False),
+    sa.Column('format', sa.Integer(), nullable=False),
+    sa.Column('bytes_total', sa.BigInteger(), nullable=False),
+    sa.Column('bytes_loaded', sa.BigInteger(), nullable=False),
+    sa.Column('rows_total', sa.Integer(), nullable=True),
+    sa.Column('rows_imported', sa.Integer(), nullable=True),
+    sa.Column('rows_rejected', sa.Integer(), nullable=True),
+    sa.Column('rejected', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_imports'))
+    )
+
+
+def downgrade():
+    op.drop_table('imports')
@@ -0,0 +1,46 @@
+"""add_fulltext_search_vectors
+
+Revision ID: 5b0e2c7d9a14
+Revises: c195ddb09c83
+Create Date: 2026-10-17 11:02:17.804311
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '5b0e2c7d9a14'
+down_revision = 'c195ddb09c83'
+branch_labels = None
+depends_on = None
+
+# Generated columns need PostgreSQL 12, vectors are maintained by trigger instead
+SEARCH_VECTORS = {
+    'users': ('first_name', 'last_name', 'email'),
+    'organisations': ('name',),
+}
+
+
+def upgrade():
+    for table_name, columns in SEARCH_VECTORS.items():
+        op.add_column(table_name, sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+        op.execute(f"""
+            CREATE TRIGGER {table_name}_search_vector_update
+            BEFORE INSERT OR UPDATE OF {', '.join(columns)} ON {table_name}
+            FOR EACH ROW EXECUTE PROCEDURE
+            tsvector_update_trigger(search_vector, 'pg_catalog.simple', {', '.join(columns)})
+        """)
+        # Fire the trigger for existing rows
+        op.execute(f'UPDATE {table_name} SET {columns[0]} = {columns[0]}')
+        op.create_index(
+            f'ix_{table_name}_search_vector', table_name, ['search_vector'], unique=False, postgresql_using='gin'
+        )
+
+
+def downgrade():
+    for table_name in SEARCH_VECTORS:
+        op.drop_index(f'ix_{table_name}_search_vector', table_name=table_name)
+        op.execute(f'DROP TRIGGER {table_name}_search_vector_update ON {table_name}')
+        op.drop_column(table_name, 'search_vector')
@@ -0,0 +1,29 @@
+"""add_cache_generations
+
+Revision ID: 7b3d9f2e5c61
+Revises: e6a1c3f85d42
+Create Date: 2026-10-17 23:05:12.408113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b3d9f2e5c61'
+down_revision = 'e6a1c3f85d42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Generation of every table, shared by caches of all worker processes, see core.cache
+    op.create_table('cache_generations',
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('generation', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('name', name=op.f('pk_cache_generations'))
+    )
+
+
+def downgrade():
+    op.drop_table('cache_generations')
@@ -0,0 +1,28 @@
+"""add_sorting_expression_indexes
+
+Revision ID: 8f3a61d0c2b7
+Revises: 5b0e2c7d9a14
+Create Date: 2026-10-17 13:25:50.117932
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8f3a61d0c2b7'
+down_revision = '5b0e2c7d9a14'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_users_lower_first_name_id', 'users', [sa.text('lower(first_name)'), 'id'], unique=False)
+    op.create_index('ix_users_lower_last_name_id', 'users', [sa.text('lower(last_name)'), 'id'], unique=False)
+    op.create_index('ix_organisations_lower_name_id', 'organisations', [sa.text('lower(name)'), 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_organisations_lower_name_id', table_name='organisations')
+    op.drop_index('ix_users_lower_last_name_id', table_name='users')
+    op.drop_index('ix_users_lower_first_name_id', table_name='users')
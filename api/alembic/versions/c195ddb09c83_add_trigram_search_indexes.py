@@ -0,0 +1,38 @@
+"""add_trigram_search_indexes
+
+Revision ID: c195ddb09c83
+Revises: 2100cccd5a57
+Create Date: 2026-10-17 09:12:41.318204
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c195ddb09c83'
+down_revision = '2100cccd5a57'
+branch_labels = None
+depends_on = None
+
+TRIGRAM_INDEXES = (
+    ('ix_users_first_name_trgm', 'users', 'first_name'),
+    ('ix_users_last_name_trgm', 'users', 'last_name'),
+    ('ix_users_email_trgm', 'users', 'email'),
+    ('ix_organisations_name_trgm', 'organisations', 'name'),
+)
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for index_name, table_name, column in TRIGRAM_INDEXES:
+        op.create_index(
+            index_name, table_name, [column], unique=False,
+            postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+
+def downgrade():
+    op.drop_index('ix_organisations_name_trgm', table_name='organisations')
+    op.drop_index('ix_users_email_trgm', table_name='users')
+    op.drop_index('ix_users_last_name_trgm', table_name='users')
+    op.drop_index('ix_users_first_name_trgm', table_name='users')
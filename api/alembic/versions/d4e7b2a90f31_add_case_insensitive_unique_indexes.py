@@ -0,0 +1,67 @@
+"""add_case_insensitive_unique_indexes
+
+Revision ID: d4e7b2a90f31
+Revises: 8f3a61d0c2b7
+Create Date: 2026-10-17 15:40:08.562417
+
+Emails of users and names of organisations differing only in case can not both exist once the unique indexes
+are created. The upgrade does not pick which of them to keep, it checks the tables first and aborts listing the
+duplicates. Merge or rename them and run the upgrade again.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4e7b2a90f31'
+down_revision = '8f3a61d0c2b7'
+branch_labels = None
+depends_on = None
+
+UNIQUE_EXPRESSIONS = (
+    ('users', 'email'),
+    ('organisations', 'name'),
+)
+# Duplicate values listed in the error of every table
+MAX_LISTED = 20
+
+
+def check_duplicates():
+    """
+    Abort the upgrade when any table contains values which would violate its unique index.
+
+    Raises:
+        (RuntimeError): Some values of a table are equal when compared case-insensitively
+    """
+    connection = op.get_bind()
+    errors = []
+    for table_name, column in UNIQUE_EXPRESSIONS:
+        rows = connection.execute(sa.text(f"""
+            SELECT lower({column}), array_agg(id ORDER BY id)
+            FROM {table_name}
+            WHERE {column} IS NOT NULL
+            GROUP BY lower({column})
+            HAVING count(*) > 1
+            ORDER BY lower({column})
+        """)).fetchall()
+        if rows:
+            listed = '\n'.join(f'  {value!r}: ids {ids}' for value, ids in rows[:MAX_LISTED])
+            more = f'\n  ... and {len(rows) - MAX_LISTED} more' if len(rows) > MAX_LISTED else ''
+            errors.append(f'{table_name}.{column} has {len(rows)} case-insensitive duplicates:\n{listed}{more}')
+
+    if errors:
+        raise RuntimeError(
+            'Unique indexes can not be created, resolve the duplicates first.\n' + '\n'.join(errors)
+        )
+
+
+def upgrade():
+    check_duplicates()
+    op.create_index('uq_users_lower_email', 'users', [sa.text('lower(email)')], unique=True)
+    op.create_index('uq_organisations_lower_name', 'organisations', [sa.text('lower(name)')], unique=True)
+
+
+def downgrade():
+    op.drop_index('uq_organisations_lower_name', table_name='organisations')
+    op.drop_index('uq_users_lower_email', table_name='users')
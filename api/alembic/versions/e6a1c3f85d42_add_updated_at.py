@@ -0,0 +1,39 @@
+"""add_updated_at
+
+Revision ID: e6a1c3f85d42
+Revises: 3c9a5e1f7b20
+Create Date: 2026-10-17 21:34:08.517293
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6a1c3f85d42'
+down_revision = '3c9a5e1f7b20'
+branch_labels = None
+depends_on = None
+
+TABLES = ('users', 'organisations', 'imports')
+
+
+def upgrade():
+    for table_name in TABLES:
+        op.add_column(table_name, sa.Column(
+            'updated_at',
+            sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            nullable=False
+        ))
+        # Existing rows were not updated since they were created
+        op.execute(f'UPDATE {table_name} SET updated_at = created_at WHERE created_at IS NOT NULL')
+
+    # Serves users of organisation detail and version of the detail
+    op.create_index('ix_users_organisation_id', 'users', ['organisation_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_users_organisation_id', table_name='users')
+    for table_name in TABLES:
+        op.drop_column(table_name, 'updated_at')
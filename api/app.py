@@ -1,26 +1,55 @@
 import falcon
+from falcon.media import JSONHandler
 
 from core.db.session import Session
+from core.json_codec import codec
+from core.middleware.cache import ResponseCacheMiddleware
+from core.middleware.compression import CompressionMiddleware
+from core.middleware.conditional import ConditionalGetMiddleware
 from core.middleware.db import SQLAlchemySessionManager
 from core.middleware.require_json import RequireJSON
 from core.middleware.serializers import SerializerMiddleware
 from core.middleware.version import VersionMiddleware
 from core.serializers.errors import error_serializer
 
-from organisations.api import OrganisationResourceProxy, OrganisationCollectionResourceProxy
-from users.api import UserResourceProxy, UserCollectionResourceProxy
+from imports.api import ImportResourceProxy, UserImportResourceProxy
+from organisations.api import (
+    OrganisationBulkResourceProxy,
+    OrganisationCollectionResourceProxy,
+    OrganisationExportResourceProxy,
+    OrganisationResourceProxy,
+)
+from users.api import (
+    UserBulkResourceProxy,
+    UserCollectionResourceProxy,
+    UserExportResourceProxy,
+    UserResourceProxy,
+)
 
 
 app = falcon.API(middleware=[
+    CompressionMiddleware(),
     RequireJSON(),
     VersionMiddleware(),
     SQLAlchemySessionManager(Session),
+    ResponseCacheMiddleware(),
+    ConditionalGetMiddleware(),
     SerializerMiddleware(),
 ])
 
 app.set_error_serializer(error_serializer)
 
+json_handler = JSONHandler(dumps=codec.dumps, loads=codec.loads)
+app.req_options.media_handlers.update({'application/json': json_handler})
+app.resp_options.media_handlers.update({'application/json': json_handler})
+
+app.add_route('/{api_version}/imports/{object_id}', ImportResourceProxy())
 app.add_route('/{api_version}/organisations/', OrganisationCollectionResourceProxy())
+app.add_route('/{api_version}/organisations/bulk', OrganisationBulkResourceProxy())
+app.add_route('/{api_version}/organisations/export', OrganisationExportResourceProxy())
 app.add_route('/{api_version}/organisations/{object_id}', OrganisationResourceProxy())
 app.add_route('/{api_version}/users/', UserCollectionResourceProxy())
+app.add_route('/{api_version}/users/bulk', UserBulkResourceProxy())
+app.add_route('/{api_version}/users/export', UserExportResourceProxy())
+app.add_route('/{api_version}/users/import', UserImportResourceProxy())
 app.add_route('/{api_version}/users/{object_id}', UserResourceProxy())
@@ -0,0 +1,127 @@
+"""
+Helpers shared by benchmark scripts.
+
+Benchmarks seed a lot of data, they run only against separate database selected by API_ENV=benchmarks.
+"""
+import statistics
+import time
+
+from sqlalchemy_utils import create_database, database_exists
+
+import settings
+from core.db.create_tables import create_all_tables
+from core.db.engine import engine
+
+
+FIRST_NAMES = (
+    'John', 'Hans', 'Holly', 'Zeus', 'Karl', 'Theo', 'Al', 'Argyle', 'Ellis', 'Richard',
+    'Lucy', 'Matt', 'Simon', 'Mai', 'Thomas', 'Stuart', 'Marie', 'Samuel', 'Dwight', 'Carmine',
+)
+
+
+def prepare_database():
+    """
+    Create benchmark database if needed and migrate it to the most recent version.
+
+    Raises:
+        (RuntimeError): Benchmark was not started with API_ENV=benchmarks
+    """
+    if settings.ENVIRONMENT != 'benchmarks':
+        raise RuntimeError('Benchmarks seed a lot of data, run them with API_ENV=benchmarks')
+
+    if not database_exists(engine.url):
+        create_database(engine.url)
+
+    create_all_tables(configure_logger=False)
+
+
+def seed_organisations(connection, organisations_no):
+    """
+    Replace all organisations and users by generated organisations.
+
+    Args:
+        connection (sqlalchemy.engine.Connection): DB connection
+        organisations_no (int): Number of organisations
+    """
+    connection.execute('TRUNCATE users, organisations RESTART IDENTITY CASCADE')
+    connection.execute(
+        """
+        INSERT INTO organisations (name, status, created_at)
+        SELECT 'Organisation ' || initcap(substr(md5(i::text), 1, 10)), 0, now()
+        FROM generate_series(1, %(organisations_no)s) AS i
+        """,
+        organisations_no=organisations_no
+    )
+
+
+def seed_users(users_no, organisations_no=1000):
+    """
+    Fill database with generated organisations and users, nothing is done when data are already there.
+
+    Args:
+        users_no (int): Number of users
+        organisations_no (int): Number of organisations users are spread across
+    """
+    with engine.begin() as connection:
+        if connection.execute('SELECT count(*) FROM users').scalar() == users_no:
+            return
+
+        seed_organisations(connection, organisations_no)
+        connection.execute(
+            """
+            INSERT INTO users (first_name, last_name, email, organisation_id, state, created_at)
+            SELECT
+                (%(first_names)s)[1 + i %% %(first_names_no)s],
+                initcap(substr(md5(i::text), 1, 10)),
+                'user' || i || '@example.com',
+                1 + i %% %(organisations_no)s,
+                0,
+                now()
+            FROM generate_series(1, %(users_no)s) AS i
+            """,
+            first_names=list(FIRST_NAMES),
+            first_names_no=len(FIRST_NAMES),
+            organisations_no=organisations_no,
+            users_no=users_no
+        )
+
+    with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+        connection.execute('VACUUM ANALYZE users')
+        connection.execute('VACUUM ANALYZE organisations')
+
+
+def measure(function, repeat=20):
+    """
+    Call function repeatedly and measure its run time.
+
+    Args:
+        function (callable): Function without arguments
+        repeat (int): Number of calls
+
+    Returns:
+        (float): Median run time in milliseconds
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(timings)
+
+
+def print_results(title, header, rows):
+    """
+    Print benchmark results as a table.
+
+    Args:
+        title (str): Benchmark name
+        header (tuple): Column names
+        rows (list): Table rows, each of them has the same length as header
+    """
+    rows = [tuple(f'{value:.2f}' if isinstance(value, float) else str(value) for value in row) for row in rows]
+    widths = [max(len(str(value)) for value in column) for column in zip(header, *rows)]
+
+    print(f'\n{title}\n')
+    for row in (header, *rows):
+        print('  '.join(str(value).ljust(width) for value, width in zip(row, widths)))
@@ -0,0 +1,145 @@
+"""
+Count DB round trips of requests served in transaction and in autocommit mode, see SQLAlchemySessionManager.
+
+    API_ENV=benchmarks python -m benchmarks.autocommit_reads
+
+Statements are counted by TCP proxy in front of PostgreSQL, so implicit BEGIN and ROLLBACK sent by psycopg2 are
+counted too. Every query message waits for its response, it is one round trip.
+"""
+import socket
+import struct
+import threading
+from copy import copy
+from unittest.mock import patch
+
+from falcon import testing
+from sqlalchemy import create_engine
+
+import settings
+from app import app
+from benchmarks import measure, prepare_database, print_results, seed_users
+from core.db.engine import engine
+from core.db.session import Session
+
+
+USERS_NO = 100000
+REPEAT = 200
+# Startup phase requests answered by single byte, the client sends startup message afterwards
+NEGOTIATION_CODES = (80877103, 80877104)
+
+
+class CountingProxy:
+    """
+    TCP proxy counting simple query messages which clients send to PostgreSQL.
+
+    Clients connect without SSL, the proxy parses frontend messages which follow the startup message.
+    """
+
+    def __init__(self, host, port):
+        self.address = host, port
+        self.queries = 0
+        self.lock = threading.Lock()
+        self.listener = socket.socket()
+        self.listener.bind(('127.0.0.1', 0))
+        self.listener.listen(100)
+        self.port = self.listener.getsockname()[1]
+
+        threading.Thread(target=self.accept, daemon=True).start()
+
+    def accept(self):
+        while True:
+            client, _ = self.listener.accept()
+            server = socket.create_connection(self.address)
+            for connection in (client, server):
+                # Responses forwarded in several packets are not held back until previous ones are acknowledged
+                connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(target=self.forward_queries, args=(client, server), daemon=True).start()
+            threading.Thread(target=self.forward, args=(server, client), daemon=True).start()
+
+    @staticmethod
+    def forward(source, target):
+        data = source.recv(65536)
+        while data:
+            target.sendall(data)
+            data = source.recv(65536)
+
+        target.close()
+
+    def forward_queries(self, client, server):
+        buffer, startup = b'', True
+        data = client.recv(65536)
+        while data:
+            server.sendall(data)
+            buffer += data
+            while True:
+                if startup:
+                    # Startup messages have no type byte
+                    if len(buffer) < 8 or len(buffer) < struct.unpack('!I', buffer[:4])[0]:
+                        break
+                    length, code = struct.unpack('!II', buffer[:8])
+                    startup = code in NEGOTIATION_CODES
+                else:
+                    if len(buffer) < 5 or len(buffer) < 1 + struct.unpack('!I', buffer[1:5])[0]:
+                        break
+                    length = 1 + struct.unpack('!I', buffer[1:5])[0]
+                    if buffer[:1] == b'Q':
+                        with self.lock:
+                            self.queries += 1
+                buffer = buffer[length:]
+
+            data = client.recv(65536)
+
+        server.close()
+
+
+def main():
+    """
+    Seed 100k users and count round trips of reads and of a write with and without autocommit reads.
+    """
+    prepare_database()
+    seed_users(USERS_NO)
+
+    proxy = CountingProxy(engine.url.host, engine.url.port or 5432)
+    url = copy(engine.url)
+    url.host, url.port = '127.0.0.1', proxy.port
+    Session.configure(bind=create_engine(
+        url,
+        pool_size=settings.POSTGRESQL['pool_size'],
+        connect_args={'application_name': settings.POSTGRESQL['application_name'], 'sslmode': 'disable'}
+    ))
+
+    client = testing.TestClient(app, headers={'Accept': 'application/json', 'Content-Type': 'application/json'})
+    first_name, last_name, organisation_id = engine.execute(
+        'SELECT first_name, last_name, organisation_id FROM users WHERE id = 1000'
+    ).first()
+    requests = (
+        ('GET /v2/users/{id}', lambda: client.simulate_get('/v2/users/1000')),
+        ('GET /v2/organisations/{id}', lambda: client.simulate_get('/v2/organisations/10')),
+        ('GET /v2/users?size=100', lambda: client.simulate_get('/v2/users', params={'size': 100})),
+        ('PATCH /v2/users/{id}', lambda: client.simulate_patch('/v2/users/1000', json={
+            'first_name': first_name, 'last_name': last_name, 'organisation_id': organisation_id
+        })),
+    )
+
+    results = []
+    with patch.dict(settings.RESPONSE_CACHE, enabled=False):
+        for name, request in requests:
+            for autocommit_reads in (False, True):
+                with patch.dict(settings.SQLALCHEMY, autocommit_reads=autocommit_reads):
+                    response = request()
+                    assert response.status_code < 300, response.text
+                    queries = proxy.queries
+                    time = measure(request, repeat=REPEAT)
+                    round_trips = (proxy.queries - queries) / REPEAT
+
+                results.append((name, 'autocommit' if autocommit_reads else 'transaction', round_trips, time))
+
+    print_results(
+        f'DB round trips of requests on {USERS_NO} users, median of {REPEAT} requests',
+        ('request', 'reads', 'round trips', 'time [ms]'),
+        results
+    )
+
+
+if __name__ == '__main__':
+    main()
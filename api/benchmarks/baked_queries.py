@@ -0,0 +1,113 @@
+"""
+Compare Python-side overhead of list, detail and exists queries built for every request and cached by bakery.
+
+Time spent in database cursor calls is subtracted, the rest is building, compiling and loading the query.
+
+    API_ENV=benchmarks python -m benchmarks.baked_queries
+"""
+import time
+
+import psycopg2.extensions
+from sqlalchemy import create_engine
+
+from benchmarks import measure, prepare_database, print_results, seed_users
+from core.db.engine import engine
+from core.db.session import Session
+from core.validators import validate_db_checks
+from organisations.validators import organisation_exists
+from users.projections import user_v2
+from users.v2.api import UserCollectionResourceV2
+from users.validators import user_email_unique
+from users.models import User
+
+
+USERS_NO = 100000
+REPEAT = 500
+SCENARIOS = (
+    ('list', {}),
+    ('list search', {'search': ['Hans']}),
+    ('list search ID', {'search': ['12345']}),
+    ('list cursor sorted', {'pagination': 'cursor', 'sorting': '-first_name'}),
+    ('list capped count', {'count': 'capped', 'search': ['example.com']}),
+)
+
+
+class TimingCursor(psycopg2.extensions.cursor):
+    """
+    Cursor measuring time spent in database, rows of server-side cursors are produced while they are fetched.
+    """
+    total = 0
+
+    def timed(method):
+        def call(self, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                TimingCursor.total += time.perf_counter() - start
+
+        return call
+
+    execute = timed(psycopg2.extensions.cursor.execute)
+    fetchone = timed(psycopg2.extensions.cursor.fetchone)
+    fetchmany = timed(psycopg2.extensions.cursor.fetchmany)
+    fetchall = timed(psycopg2.extensions.cursor.fetchall)
+    close = timed(psycopg2.extensions.cursor.close)
+
+
+def measure_overhead(connection, baked, call):
+    """
+    Measure median run time of call without time spent in database, call gets new session every time.
+    """
+    def run():
+        db_session = Session(bind=connection, enable_baked_queries=baked)
+        TimingCursor.total = 0
+        start = time.perf_counter()
+        call(db_session)
+        timings.append((time.perf_counter() - start - TimingCursor.total) * 1000)
+        db_session.close()
+
+    timings = []
+    measure(run, repeat=REPEAT)
+
+    return sorted(timings)[len(timings) // 2]
+
+
+def main():
+    """
+    Seed 100k users and compare queries with bakery disabled and enabled.
+    """
+    prepare_database()
+    seed_users(USERS_NO)
+
+    def list_users(params):
+        def call(db_session):
+            objects, _ = UserCollectionResourceV2().get_objects(
+                db_session, dict({'page': 0, 'size': 10}, **params), projection=user_v2
+            )
+            return [user_v2(row) for row in objects]
+        return call
+
+    calls = [(name, list_users(params)) for name, params in SCENARIOS]
+    calls.append(('detail', lambda db_session: User.get_by_id(db_session, 12345)))
+    calls.append(('exists', lambda db_session: validate_db_checks(
+        {'organisation_id': (organisation_exists, 1), 'email': (user_email_unique, 'nobody@example.com')},
+        db_session=db_session
+    )))
+
+    results = []
+    with create_engine(engine.url, connect_args={'cursor_factory': TimingCursor}).connect() as connection:
+        for name, call in calls:
+            before = measure_overhead(connection, False, call)
+            after = measure_overhead(connection, True, call)
+            results.append((name, before, after, before / after))
+
+    print_results(
+        f'Python-side overhead per call on {USERS_NO} users, median of {REPEAT} runs',
+        ('query', 'built every time [ms]', 'baked [ms]', 'speedup'),
+        results
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Compare creating users one by one with POST /v2/users and at once with POST /v2/users/bulk.
+
+    API_ENV=benchmarks python -m benchmarks.bulk
+"""
+import itertools
+
+from falcon import testing
+
+from app import app
+from benchmarks import FIRST_NAMES, measure, prepare_database, print_results, seed_organisations
+from core.db.engine import engine
+
+
+USERS_NO = 10000
+ORGANISATIONS_NO = 100
+HEADERS = {'Content-Type': 'application/json'}
+
+
+def build_users(run):
+    """
+    Build request bodies of users with emails unique for the given run.
+    """
+    return [
+        {
+            'first_name': FIRST_NAMES[i % len(FIRST_NAMES)],
+            'last_name': f'User {i}',
+            'email': f'user{i}.run{run}@example.com',
+            'organisation_id': 1 + i % ORGANISATIONS_NO,
+        }
+        for i in range(USERS_NO)
+    ]
+
+
+def main():
+    """
+    Create 10k users through the API with both endpoints.
+    """
+    prepare_database()
+    with engine.begin() as connection:
+        seed_organisations(connection, ORGANISATIONS_NO)
+
+    client = testing.TestClient(app)
+    runs = itertools.count()
+
+    def create_one_by_one():
+        for user in build_users(next(runs)):
+            assert client.simulate_post('/v2/users', json=user, headers=HEADERS).status_code == 201
+
+    def create_bulk():
+        assert client.simulate_post('/v2/users/bulk', json=build_users(next(runs)), headers=HEADERS).status_code == 201
+
+    results = [
+        ('POST /v2/users per user', measure(create_one_by_one, repeat=3)),
+        ('POST /v2/users/bulk', measure(create_bulk, repeat=3)),
+    ]
+    results = [(name, timing, results[0][1] / timing) for name, timing in results]
+
+    with engine.begin() as connection:
+        connection.execute('TRUNCATE users RESTART IDENTITY')
+
+    print_results(
+        f'Create {USERS_NO} users, median of 3 runs',
+        ('endpoint', 'time [ms]', 'speedup'),
+        results
+    )
+
+
+if __name__ == '__main__':
+    main()
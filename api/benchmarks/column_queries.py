@@ -0,0 +1,76 @@
+"""
+Compare users and organisations pages loaded as ORM instances and as rows of projected columns.
+
+    API_ENV=benchmarks python -m benchmarks.column_queries
+"""
+import tracemalloc
+
+from benchmarks import measure, prepare_database, print_results, seed_users
+from core.db.engine import engine
+from core.db.session import Session
+from organisations.projections import organisation_v2
+from organisations.v2.api import OrganisationCollectionResourceV2
+from users.projections import user_v2
+from users.v2.api import UserCollectionResourceV2
+
+
+USERS_NO = 100000
+PAGE_SIZE = 1000
+
+
+def load_page(connection, resource, params, projection, columns):
+    """
+    Load and convert one page of objects in a new session, as the collection endpoint does.
+    """
+    db_session = Session(bind=connection)
+    objects, _ = resource.get_objects(db_session, params, projection=projection if columns else None)
+    data = [projection(item) for item in objects]
+    db_session.close()
+
+    return data
+
+
+def peak_memory(function):
+    """
+    Measure peak memory allocated by function in KiB.
+    """
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak / 1024
+
+
+def main():
+    """
+    Seed 100k users and compare 1000-row pages loaded with both approaches.
+    """
+    prepare_database()
+    seed_users(USERS_NO)
+
+    results = []
+    with engine.connect() as connection:
+        for name, resource, projection in (
+            ('users v2', UserCollectionResourceV2(), user_v2),
+            ('organisations v2', OrganisationCollectionResourceV2(), organisation_v2),
+        ):
+            params = {'page': 0, 'size': PAGE_SIZE, 'count': 'capped'}
+            orm, columns = (
+                lambda: load_page(connection, resource, params, projection, columns=False),
+                lambda: load_page(connection, resource, params, projection, columns=True),
+            )
+            assert orm() == columns()
+
+            before, after = measure(orm, repeat=50), measure(columns, repeat=50)
+            results.append((name, before, after, before / after, peak_memory(orm), peak_memory(columns)))
+
+    print_results(
+        f'{PAGE_SIZE}-row page on {USERS_NO} users, median of 50 runs',
+        ('page', 'instances [ms]', 'columns [ms]', 'speedup', 'instances peak [KiB]', 'columns peak [KiB]'),
+        results
+    )
+
+
+if __name__ == '__main__':
+    main()
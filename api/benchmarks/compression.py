@@ -0,0 +1,67 @@
+"""
+Compare CPU time spent on compression of response bodies with bytes saved on the wire at several compression levels.
+
+    API_ENV=benchmarks python -m benchmarks.compression
+"""
+from falcon import testing
+
+from app import app
+from benchmarks import measure, prepare_database, print_results, seed_users
+from core.compression import ENCODINGS
+
+
+USERS_NO = 100000
+REPEAT = 10
+LEVELS = {
+    'gzip': (1, 4, 6, 9),
+    'br': (1, 4, 6, 9, 11),
+}
+# Transfer time is estimated for slow link of mobile clients
+LINK_SPEED = 10 * 1000 * 1000 / 8  # bytes per second
+
+BODIES = (
+    ('GET /v2/users?size=1000', '/v2/users', {'page': 0, 'size': 1000}),
+    ('GET /v2/organisations?size=100', '/v2/organisations', {'page': 0, 'size': 100}),
+    ('GET /v2/users/export?search=John', '/v2/users/export', {'search': 'John'}),
+)
+
+
+def main():
+    """
+    Seed 100k users, take uncompressed bodies of API responses and compress them by every installed encoding.
+    """
+    prepare_database()
+    seed_users(USERS_NO)
+
+    client = testing.TestClient(app, headers={
+        'Accept': 'application/json', 'Content-Type': 'application/json', 'Accept-Encoding': 'identity'
+    })
+
+    results = []
+    for name, path, params in BODIES:
+        data = client.simulate_get(path, params=params).content
+        results.append((name, 'identity', '-', len(data), 1.0, 0.0, len(data) * 1000 / LINK_SPEED))
+
+        for encoding_name, levels in LEVELS.items():
+            for level in levels:
+                try:
+                    encoding = ENCODINGS[encoding_name](level)
+                except ImportError:
+                    print(f'{encoding_name} is not installed')
+                    break
+
+                size = len(encoding.compress(data))
+                time = measure(lambda: encoding.compress(data), repeat=REPEAT)
+                results.append((
+                    name, encoding_name, level, size, len(data) / size, time, time + size * 1000 / LINK_SPEED
+                ))
+
+    print_results(
+        f'Compression of response bodies, median of {REPEAT} runs, transfer over {LINK_SPEED * 8 / 1000000:.0f} Mbit/s',
+        ('body', 'encoding', 'level', 'size [B]', 'ratio', 'compress [ms]', 'compress + transfer [ms]'),
+        results
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Compare latency of polling unchanged resources with full responses and with conditional requests answered by 304.
+
+    API_ENV=benchmarks python -m benchmarks.conditional_get
+"""
+from unittest.mock import patch
+
+from falcon import testing
+
+import settings
+from app import app
+from benchmarks import measure, prepare_database, print_results, seed_users
+
+
+USERS_NO = 100000
+REPEAT = 200
+
+REQUESTS = (
+    ('GET /v2/users?page=0', '/v2/users', {'page': 0, 'size': 100}),
+    ('GET /v2/organisations?page=0', '/v2/organisations', {'page': 0, 'size': 100}),
+    ('GET /v2/users/{id}', '/v2/users/1000', None),
+    ('GET /v2/organisations/{id}', '/v2/organisations/10', None),
+)
+
+
+def main():
+    """
+    Seed 100k users and poll the same resources with and without If-None-Match, response cache is disabled.
+    """
+    prepare_database()
+    seed_users(USERS_NO)
+
+    client = testing.TestClient(app, headers={'Accept': 'application/json', 'Content-Type': 'application/json'})
+
+    def get(path, params, etag=None, status=200):
+        response = client.simulate_get(path, params=params, headers={'If-None-Match': etag} if etag else None)
+        assert response.status_code == status, response.text
+
+        return response
+
+    results = []
+    with patch.dict(settings.RESPONSE_CACHE, enabled=False):
+        for name, path, params in REQUESTS:
+            # Total of collection is counted by the first request only
+            get(path, params)
+            response = get(path, params)
+            etag = response.headers['etag']
+
+            before = measure(lambda: get(path, params), repeat=REPEAT)
+            after = measure(lambda: get(path, params, etag, status=304), repeat=REPEAT)
+            results.append((name, len(response.content), before, after, before / after))
+
+    print_results(
+        f'Polling unchanged resources on {USERS_NO} users, median of {REPEAT} requests',
+        ('request', 'body [B]', '200 [ms]', '304 [ms]', 'speedup'),
+        results
+    )
+
+
+if __name__ == '__main__':
+    main()
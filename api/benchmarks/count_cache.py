@@ -0,0 +1,71 @@
+"""
+Compare time of walking pages of one search with total counted for every page and reused from count cache.
+
+    API_ENV=benchmarks python -m benchmarks.count_cache
+"""
+from unittest.mock import patch
+
+import settings
+from benchmarks import measure, prepare_database, print_results, seed_users
+from core.cache import count_cache
+from core.db.engine import engine
+from core.db.session import Session
+from users.projections import user_v2
+from users.v2.api import UserCollectionResourceV2
+
+
+USERS_NO = 100000
+PAGES_NO = 50
+PAGE_SIZE = 20
+
+
+def walk_pages(connection, resource, params):
+    """
+    Load and convert first pages of search, every page in a new session as the collection endpoint does.
+    """
+    count_cache.clear()
+    totals = []
+    for page in range(PAGES_NO):
+        db_session = Session(bind=connection)
+        objects, meta = resource.get_objects(db_session, dict(params, page=page), projection=user_v2)
+        list(map(user_v2, objects))
+        totals.append(meta['total'])
+        db_session.close()
+
+    return totals
+
+
+def main():
+    """
+    Seed 100k users and compare walking 50 pages of the same search with count cache disabled and enabled.
+    """
+    prepare_database()
+    seed_users(USERS_NO)
+
+    resource = UserCollectionResourceV2()
+    results = []
+    with engine.connect() as connection:
+        for name, params in (
+            ('search, exact count', {'search': ['an'], 'count': 'exact'}),
+            ('search, capped count', {'search': ['an'], 'count': 'capped'}),
+            ('fulltext, exact count', {'search': ['ma'], 'search_mode': 'fulltext', 'count': 'exact'}),
+            ('all users, cursor', {'pagination': 'cursor', 'count': 'exact'}),
+        ):
+            params = dict(params, size=PAGE_SIZE)
+            with patch.dict(settings.COUNT_CACHE, enabled=False):
+                totals = walk_pages(connection, resource, params)
+                before = measure(lambda: walk_pages(connection, resource, params), repeat=5)
+
+            assert walk_pages(connection, resource, params) == totals
+            after = measure(lambda: walk_pages(connection, resource, params), repeat=5)
+            results.append((name, totals[0], before, after, before / after))
+
+    print_results(
+        f'{PAGES_NO} pages of {PAGE_SIZE} users out of {USERS_NO}, median of 5 walks',
+        ('search', 'total', 'counted every page [ms]', 'cached total [ms]', 'speedup'),
+        results
+    )
+
+
+if __name__ == '__main__':
+    main()
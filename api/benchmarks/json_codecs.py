@@ -0,0 +1,77 @@
+"""
+Compare encode and decode speed of installed JSON codecs on realistic payloads, no database is needed.
+
+    API_ENV=benchmarks python -m benchmarks.json_codecs
+"""
+from benchmarks import FIRST_NAMES, measure, print_results
+from core.json_codec import CODECS
+
+
+def build_payloads():
+    """
+    Build payloads shaped as bodies of users endpoints.
+    """
+    users = [
+        {
+            'first_name': FIRST_NAMES[i % len(FIRST_NAMES)],
+            'last_name': f'Grüber {i}',
+            'email': f'user{i}@example.com',
+            'organisation_id': 1 + i % 1000,
+        }
+        for i in range(10000)
+    ]
+
+    return {
+        'GET /v2/users?size=1000': {
+            'total': 1000000,
+            'data': [
+                {
+                    'id': i,
+                    'name': f'{user["first_name"]} {user["last_name"]}',
+                    'email': user['email'],
+                    'state_name': 'ENABLED',
+                }
+                for i, user in enumerate(users[:1000], 1)
+            ],
+        },
+        'POST /v2/users/bulk 10k': users,
+        '422 of /v2/users/bulk 1k': {
+            'title': '422 Unprocessable Entity',
+            'errors': {
+                str(i): {'email': [f'User email {user["email"]} already exists']}
+                for i, user in enumerate(users[:1000])
+            },
+        },
+    }
+
+
+def main():
+    """
+    Measure every installed codec on every payload.
+    """
+    codecs = []
+    for name in CODECS:
+        try:
+            codecs.append(CODECS[name]())
+        except ImportError:
+            print(f'{name} is not installed')
+
+    results = []
+    for payload_name, payload in build_payloads().items():
+        encoded = codecs[-1].dumps(payload)
+        size = len(encoded) / 1024 / 1024
+
+        for codec in codecs:
+            encode = measure(lambda: codec.dumps(payload), repeat=20)
+            decode = measure(lambda: codec.loads(encoded), repeat=20)
+            results.append((payload_name, codec.name, encode, size * 1000 / encode, decode, size * 1000 / decode))
+
+    print_results(
+        'JSON codecs, median of 20 runs',
+        ('payload', 'codec', 'encode [ms]', 'encode [MB/s]', 'decode [ms]', 'decode [MB/s]'),
+        results
+    )
+
+
+if __name__ == '__main__':
+    main()
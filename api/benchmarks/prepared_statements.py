@@ -0,0 +1,77 @@
+"""
+Compare latency of requests with statements parsed and planned for every request and prepared once per connection.
+
+    API_ENV=benchmarks python -m benchmarks.prepared_statements
+"""
+import random
+
+from falcon import testing
+from sqlalchemy import create_engine
+
+from app import app
+from benchmarks import FIRST_NAMES, measure, prepare_database, print_results, seed_users
+from core.db.engine import enable_prepared_statements, engine
+from core.db.session import Session
+
+
+USERS_NO = 100000
+REPEAT = 1000
+ROUNDS = 3
+
+
+def get_user(client):
+    """
+    Request random user.
+    """
+    response = client.simulate_get(f'/v2/users/{random.randint(1, USERS_NO)}')
+    assert response.status_code == 200, response.text
+
+
+def search_users(client):
+    """
+    Request first page of users searched by random first name and sorted by first name.
+    """
+    response = client.simulate_get('/v2/users', params={
+        'search': random.choice(FIRST_NAMES), 'sorting': 'first_name', 'size': 20, 'page': 0, 'count': 'capped',
+    })
+    assert response.status_code == 200, response.text
+
+
+def main():
+    """
+    Seed 100k users and compare requests served by engines with prepared statements disabled and enabled.
+
+    Both engines are new and measured in alternating rounds, the best median of the rounds is reported.
+    """
+    prepare_database()
+    seed_users(USERS_NO)
+
+    client = testing.TestClient(app, headers={'Accept': 'application/json', 'Content-Type': 'application/json'})
+    engines = {
+        prepared: create_engine(engine.url, pool_size=engine.pool.size())
+        for prepared in (False, True)
+    }
+    enable_prepared_statements(engines[True])
+
+    results = []
+    for name, request in (('GET /v2/users/{id}', get_user), ('GET /v2/users?search=...', search_users)):
+        medians = {False: [], True: []}
+        for _ in range(ROUNDS):
+            for prepared, prepared_engine in engines.items():
+                Session.configure(bind=prepared_engine)
+                measure(lambda: request(client), repeat=100)
+                medians[prepared].append(measure(lambda: request(client), repeat=REPEAT))
+
+        before, after = min(medians[False]), min(medians[True])
+        results.append((name, before, after, before / after))
+
+    Session.configure(bind=engine)
+    print_results(
+        f'Requests on {USERS_NO} users, best median of {ROUNDS} rounds of {REPEAT} requests',
+        ('request', 'parsed and planned [ms]', 'prepared [ms]', 'speedup'),
+        results
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Compare per-row cost of Base.convert_object_to_dict and precompiled projections, no database is needed.
+
+    API_ENV=benchmarks python -m benchmarks.projections
+"""
+from benchmarks import FIRST_NAMES, measure, print_results
+from organisations.models import Organisation
+from organisations.projections import organisation_v1, organisation_v2
+from users.models import User
+from users.projections import user_v1, user_v2
+
+
+ROWS_NO = 1000
+
+
+def main():
+    """
+    Convert 1000-row pages of users and organisations with both approaches.
+    """
+    users = [
+        User(
+            id=i,
+            first_name=FIRST_NAMES[i % len(FIRST_NAMES)],
+            last_name=f'User {i}',
+            email=f'user{i}@example.com',
+            organisation_id=1,
+            state=i % 4
+        )
+        for i in range(ROWS_NO)
+    ]
+    organisations = [Organisation(id=i, name=f'Organisation {i}', status=i % 2) for i in range(ROWS_NO)]
+
+    results = []
+    for name, projection, instances in (
+        ('users v1', user_v1, users),
+        ('users v2', user_v2, users),
+        ('organisations v1', organisation_v1, organisations),
+        ('organisations v2', organisation_v2, organisations),
+    ):
+        before = measure(lambda: [item.convert_object_to_dict(projection.keys) for item in instances], repeat=50)
+        after = measure(lambda: [projection(item) for item in instances], repeat=50)
+        results.append((name, before * 1000 / ROWS_NO, after * 1000 / ROWS_NO, before / after))
+
+    print_results(
+        f'Conversion of {ROWS_NO}-row page, median of 50 runs',
+        ('page', 'convert_object_to_dict [us/row]', 'projection [us/row]', 'speedup'),
+        results
+    )
+
+
+if __name__ == '__main__':
+    main()
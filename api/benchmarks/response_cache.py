@@ -0,0 +1,61 @@
+"""
+Compare latency of repeated GET requests served by resources and from response cache.
+
+    API_ENV=benchmarks python -m benchmarks.response_cache
+"""
+from unittest.mock import patch
+
+from falcon import testing
+
+import settings
+from app import app
+from benchmarks import measure, prepare_database, print_results, seed_users
+
+
+USERS_NO = 100000
+REPEAT = 200
+
+REQUESTS = (
+    ('GET /v2/users page', '/v2/users', {'size': 100, 'page': 3, 'sorting': 'last_name'}),
+    ('GET /v2/organisations page', '/v2/organisations', {'size': 100, 'page': 3}),
+    ('GET /v2/users/{id}', '/v2/users/1000', None),
+    ('GET /v2/organisations/{id}', '/v2/organisations/10', None),
+)
+
+
+def main():
+    """
+    Seed 100k users and compare the same request repeated with response cache disabled and enabled.
+    """
+    prepare_database()
+    seed_users(USERS_NO)
+
+    client = testing.TestClient(app, headers={'Accept': 'application/json', 'Content-Type': 'application/json'})
+
+    def get(path, params):
+        response = client.simulate_get(path, params=params)
+        assert response.status_code == 200, response.text
+
+        return response.content
+
+    results = []
+    # Totals reused from count cache would change `total_is_cached` of otherwise equal bodies
+    with patch.dict(settings.COUNT_CACHE, enabled=False):
+        for name, path, params in REQUESTS:
+            with patch.dict(settings.RESPONSE_CACHE, enabled=False):
+                body = get(path, params)
+                before = measure(lambda: get(path, params), repeat=REPEAT)
+
+            assert get(path, params) == body
+            after = measure(lambda: get(path, params), repeat=REPEAT)
+            results.append((name, before, after, before / after))
+
+    print_results(
+        f'Repeated requests on {USERS_NO} users, median of {REPEAT} requests',
+        ('request', 'uncached [ms]', 'cached [ms]', 'speedup'),
+        results
+    )
+
+
+if __name__ == '__main__':
+    main()
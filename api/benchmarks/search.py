@@ -0,0 +1,82 @@
+"""
+Compare search on users collection before and after trigram indexes were added.
+
+    API_ENV=benchmarks python -m benchmarks.search
+"""
+from sqlalchemy import String, cast, or_
+
+from benchmarks import measure, prepare_database, print_results, seed_users
+from core.db.engine import engine
+from core.db.session import Session
+from users.v2.api import UserCollectionResourceV2
+
+
+USERS_NO = 1000000
+TRIGRAM_INDEXES = ('ix_users_first_name_trgm', 'ix_users_last_name_trgm', 'ix_users_email_trgm')
+SEARCHES = (
+    ['a1b2c3'],
+    ['Hans'],
+    ['Hans', 'f00'],
+    ['user12345@'],
+)
+
+
+class LegacyUserCollectionResource(UserCollectionResourceV2):
+    """
+    Users collection with search filters as they were before trigram indexes.
+    """
+
+    def build_query_filters(self, params):
+        return [
+            or_(
+                self.model.last_name.ilike(f'%{search_term.strip()}%'),
+                self.model.first_name.ilike(f'%{search_term.strip()}%'),
+                self.model.email.ilike(f'%{search_term.strip()}%'),
+                cast(self.model.id, String).ilike(f'%{search_term.strip()}%'),
+            )
+            for search_term in params.get('search')
+        ]
+
+
+def run_search(connection, resource, search):
+    """
+    Measure first page of users list filtered by given search terms.
+    """
+    db_session = Session(bind=connection)
+    params = {'search': search, 'page': 0, 'size': 10}
+
+    def get_page():
+        objects, _ = resource.get_objects(db_session, params)
+        return list(objects)
+
+    return measure(get_page, repeat=5)
+
+
+def main():
+    """
+    Seed 1M users and compare search with and without trigram indexes.
+    """
+    prepare_database()
+    seed_users(USERS_NO)
+
+    results = []
+    with engine.connect() as connection:
+        for search in SEARCHES:
+            transaction = connection.begin()
+            for index in TRIGRAM_INDEXES:
+                connection.execute(f'DROP INDEX {index}')
+            before = run_search(connection, LegacyUserCollectionResource(), search)
+            transaction.rollback()
+
+            after = run_search(connection, UserCollectionResourceV2(), search)
+            results.append((' '.join(search), before, after, before / after))
+
+    print_results(
+        f'GET /v2/users/?search=... on {USERS_NO} users, median of 5 runs',
+        ('search', 'before [ms]', 'after [ms]', 'speedup'),
+        results
+    )
+
+
+if __name__ == '__main__':
+    main()
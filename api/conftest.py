@@ -1,6 +1,7 @@
 from pytest import fixture
 from sqlalchemy_utils import database_exists, create_database, drop_database
 
+from core.cache import count_cache, response_cache
 from core.db.create_tables import create_all_tables
 from core.db.engine import engine
 from core.db.session import Session
@@ -53,3 +54,6 @@ def db_transaction():
 
     transaction.rollback()
     connection.close()
+    # Rolled back data do not bump generations of models
+    response_cache.clear()
+    count_cache.clear()
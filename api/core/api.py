@@ -1,9 +1,50 @@
-from sqlalchemy import asc, desc
+import csv
+import io
+import itertools
+import operator
+
+import falcon
+from sqlalchemy import Column, Float, Integer, and_, asc, bindparam, cast, desc, false, func, or_, text, tuple_
+from sqlalchemy.dialects.postgresql import REAL
+from sqlalchemy.orm import Bundle
+from sqlalchemy.sql import visitors
+
+import settings
+from core.cache import count_cache, get_generations
+from core.db.baked import bake_query
+from core.db.session import session_manager
+from core.errors import HTTPError
+from core.json_codec import codec
+from core.projections import compile_projection
+from core.utils import build_etag, build_prefix_tsquery, encode_cursor, is_not_modified
+
+
+# Maximum value of PostgreSQL integer column
+MAX_ID = 2 ** 31 - 1
+# Text search configuration used by triggers maintaining search_vector columns
+FULLTEXT_CONFIG = 'simple'
+# Media types of export formats
+EXPORT_CONTENT_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+# Columns of page objects ETag of collection response is derived from
+VERSION = compile_projection(('id', 'updated_at'))
 
 
 class BaseSortingAPI:
     model = None
     sorting_mapper = None
+    # Default way of counting total, one of exact, estimate or capped
+    count_mode = 'exact'
+    # Maximum number of objects counted in capped mode
+    count_limit = 10000
+    # Number of objects fetched from server-side cursor and sent in one chunk by exports
+    export_batch_size = 1000
+    # Number of objects loaded from page query and sent in one chunk of collection response
+    stream_batch_size = 100
+    # Query parameters `build_filters` reads to build filters, totals of the same values are cached
+    filter_params = ('search_mode', 'search')
 
     def __init__(self):
         name = self.__class__.__name__
@@ -13,37 +54,399 @@ class BaseSortingAPI:
         if self.sorting_mapper is None:
             raise ValueError(f'Sorting mapper on {name} is not defined')
 
-    def get_objects(self, db_session, params):
+    def get_objects(self, db_session, params, projection=None, total=None):
         """
         Retrieve objects of given model base on provided parameters
 
+        When projection is given, only columns it reads are selected and rows are returned instead of model
+        instances, ORM does not construct instances nor track them in identity map.
+
         Args:
             db_session (Session): DB Session object
             params (dict): Query parameters
+            projection (function): Response projection objects are converted with, see core.projections
+            total (dict): Total with its flags already counted for the same parameters, see `get_tagged_objects`
 
         Returns:
-            (tuple): List of filtered, sorted and paginated objects of defined model, total number of all objects
+            (tuple): Iterator over filtered, sorted and paginated objects of defined model, they are loaded
+                from already executed query in batches of `stream_batch_size`. Dict with total number of all
+                objects, flags describing accuracy of total when it was not counted exactly, `total_is_cached`
+                telling whether total was counted by previous request of the same search and `next_cursor` when
+                cursor pagination is used
         """
         page = params.get('page')
         size = params.get('size')
-        sorting = params.get('sorting')
+        cursor = params.get('cursor')
+        filters, sorting = self.build_filters(params)
+        ordering = self.get_ordering(sorting)
+
+        count = params.get('count') or self.count_mode
+        # Total does not depend on pagination, every page of the same search reuses it
+        count_key = self.get_count_key(params, count)
+        generations = None
+        if total is None and settings.COUNT_CACHE['enabled']:
+            generations = get_generations(db_session, (self.model,))
+            total = count_cache.get(count_key, generations)
+            if total is not None:
+                total = {**total, 'total_is_cached': True}
+
+        meta = {}
+        if cursor or params.get('pagination') == 'cursor':
+            paginated_objects, meta['next_cursor'] = self.paginate_result_by_cursor(
+                db_session=db_session,
+                filters=filters,
+                size=size,
+                sorting=sorting,
+                cursor=cursor,
+                projection=projection
+            )
+        elif count == 'exact' and total is None:
+            # Total is fetched together with the page using window function, no extra count query
+            rows = iter(self.bake_query(
+                db_session,
+                lambda query, filters, ordering: self.paginate_result(
+                    query.add_columns(
+                        func.count().over()
+                    ).filter(
+                        *filters
+                    ).order_by(
+                        *ordering
+                    ),
+                    size=size,
+                    page=page
+                ).yield_per(self.stream_batch_size),
+                clauses=(filters, ordering),
+                projection=projection,
+                **self.get_pagination_params(size, page)
+            ))
+            first_row = next(rows, None)
+            paginated_objects = (instance for instance, _ in itertools.chain([first_row] if first_row else [], rows))
+            total = {'total': first_row[1] if first_row else self.count_empty_page(db_session, filters, page)}
+        else:
+            paginated_objects = iter(self.bake_query(
+                db_session,
+                lambda query, filters, ordering: self.paginate_result(
+                    query.filter(*filters).order_by(*ordering),
+                    size=size,
+                    page=page
+                ).yield_per(self.stream_batch_size),
+                clauses=(filters, ordering),
+                projection=projection,
+                **self.get_pagination_params(size, page)
+            ))
+
+        if total is None:
+            total = self.count_objects(db_session, filters, count)
+
+        if 'total_is_cached' not in total:
+            # Total was counted by this call
+            if generations is not None:
+                count_cache.set(count_key, generations, total)
+            total = {**total, 'total_is_cached': False}
+
+        return paginated_objects, {**total, **meta}
+
+    def get_tagged_objects(self, req, resp, params, projection):
+        """
+        Retrieve page of objects with ETag set, or answer with 304 Not Modified when client already has the page.
+
+        The tag is built by `check_not_modified` from a query of page IDs and update times, so the page itself is
+        still loaded lazily and streamed in batches after the headers.
+
+        Args:
+            req (falcon.request.Request): Request object
+            resp (falcon.response.Response): Response object
+            params (dict): Query parameters
+            projection (function): Response projection objects are converted with, see core.projections
+
+        Returns:
+            (tuple): Objects and meta as returned by `get_objects`, None if response is 304 Not Modified
+        """
+        total = self.check_not_modified(req, resp, params)
+        if total is None:
+            return None
+
+        return self.get_objects(req.context.db_session, params, projection=projection, total=total)
+
+    def check_not_modified(self, req, resp, params):
+        """
+        Set ETag of requested page and answer with 304 Not Modified when client already has it.
+
+        Only IDs and update times of page objects are loaded to build the tag. Update time of every object is
+        used rather than the latest one, transactions may commit objects older than the latest one.
+
+        Args:
+            req (falcon.request.Request): Request object
+            resp (falcon.response.Response): Response object
+            params (dict): Query parameters
+
+        Returns:
+            (dict): Total with its flags which should be passed to `get_objects`, None if response is
+                304 Not Modified and page should not be loaded
+        """
+        rows, meta = self.get_objects(req.context.db_session, params, projection=VERSION)
+
+        etag = self.build_page_etag(req, rows, meta)
+        resp.etag = etag
+        if is_not_modified(req, etag):
+            resp.status = falcon.HTTP_304
+            return None
+
+        # Cursor of the next page is found again by the page query
+        meta.pop('next_cursor', None)
+        return meta
+
+    def build_page_etag(self, req, rows, meta):
+        """
+        Build ETag of page from IDs and update times of its objects and from total.
 
-        filters = self.build_query_filters(params)
-        sorting_value = self.get_sorting_parameter(sorting)
-        objects = db_session.query(
-            self.model
-        ).filter(
-            *filters
-        ).order_by(
-            sorting_value
+        Flags telling how total was obtained, e.g. `total_is_cached`, are left out, they change without any
+        change of the listed objects.
+
+        Args:
+            req (falcon.request.Request): Request object
+            rows (iterable): Page rows of `id` and `updated_at`
+            meta (dict): Meta returned by `get_objects`
+
+        Returns:
+            (str): Entity tag without quotes
+        """
+        return build_etag(
+            req.context.get('api_version'),
+            self.model.__tablename__,
+            [(row.id, row.updated_at) for row in rows],
+            meta['total']
         )
-        paginated_objects = self.paginate_result(
-            query=objects,
-            size=size,
-            page=page
-        ).all()
 
-        return paginated_objects, objects.count()
+    def get_entity(self, projection=None):
+        """
+        Get entity selected by object queries
+
+        Args:
+            projection (function): Response projection, see core.projections
+
+        Returns:
+            Defined model, or bundle of columns read by projection and ID when projection is given
+        """
+        if projection is None:
+            return self.model
+
+        # ID is always selected, cursor pagination reads it from the last row
+        columns = dict.fromkeys(('id', *projection.columns))
+
+        return Bundle(
+            self.model.__tablename__, *(getattr(self.model, column) for column in columns), single_entity=True
+        )
+
+    def bake_query(self, db_session, build, clauses=(), projection=None, **params):
+        """
+        Get cached query of defined model, it is built and compiled once per shape of clauses, see core.db.baked
+
+        Args:
+            db_session (Session): DB Session object
+            build (function): Builds query from query of selected entity and groups of clauses
+            clauses (tuple): Groups (lists) of dynamic clauses, e.g. filters and ordering
+            projection (function): Response projection, see `get_entity`
+            **params: Values of bound parameters created by `build`
+
+        Returns:
+            (sqlalchemy.ext.baked.Result): Query result
+        """
+        return bake_query(
+            db_session,
+            lambda session, *clauses: build(session.query(self.get_entity(projection)), *clauses),
+            clauses=clauses,
+            # Batch size is the only other attribute of resource used by built queries
+            key=(self.model, projection, build.__code__, self.stream_batch_size),
+            **params
+        )
+
+    def stream_response(self, resp, response):
+        """
+        Send response in chunks, items of `data` are converted and encoded while they are loaded from the query.
+
+        Body is the same as if `response` was assigned to `resp.media`, it is encoded by the same media handler.
+
+        Args:
+            resp (falcon.response.Response): Response object
+            response (dict): Response data with iterable of items under `data`, which is the last key
+        """
+        handler = resp.options.media_handlers.find_by_media_type(
+            resp.content_type, resp.options.default_media_type
+        )
+        resp.stream = self.encode_response(lambda media: handler.serialize(media, resp.content_type), response)
+
+    def encode_response(self, serialize, response):
+        """
+        Encode response with `data` items serialized in chunks of `stream_batch_size`.
+
+        Args:
+            serialize (callable): Function encoding media to bytes
+            response (dict): Response data with iterable of items under `data`, which is the last key
+
+        Returns:
+            (generator): Encoded chunks
+        """
+        # Encoded response with empty data ends with `[]}`, the rest of encoding is taken from the handler too
+        head = serialize({**response, 'data': []})
+        separator = serialize([0, 0])[2:-2]
+        yield head[:-2]
+
+        items = iter(response['data'])
+        chunk = [serialize(item) for item in itertools.islice(items, self.stream_batch_size)]
+        while chunk:
+            yield separator.join(chunk)
+            chunk = [serialize(item) for item in itertools.islice(items, self.stream_batch_size)]
+            if chunk:
+                yield separator
+
+        yield head[-2:]
+
+    def export_objects(self, params, projection=None):
+        """
+        Iterate over all filtered and sorted objects, they are read from server-side cursor in batches.
+
+        Objects are streamed after the request session is closed, so the export uses its own session.
+
+        Args:
+            params (dict): Query parameters
+            projection (function): Response projection, only columns it reads are selected when it is given
+
+        Returns:
+            (generator): Objects of defined model, or rows of projected columns
+        """
+        filters, sorting = self.build_filters(params)
+
+        with session_manager() as db_session:
+            yield from db_session.query(
+                self.get_entity(projection)
+            ).filter(
+                *filters
+            ).order_by(
+                *self.get_ordering(sorting)
+            ).execution_options(
+                stream_results=True
+            ).yield_per(
+                self.export_batch_size
+            )
+
+    def export(self, resp, params, projection):
+        """
+        Stream all filtered and sorted objects in response, objects are encoded in chunks of `export_batch_size`
+        so memory use does not depend on number of objects.
+
+        Args:
+            resp (falcon.response.Response): Response object
+            params (dict): Query parameters, `format` is one of EXPORT_CONTENT_TYPES
+            projection (function): Conversion of exported objects, see core.projections
+        """
+        resp.content_type = EXPORT_CONTENT_TYPES[params['format']]
+        resp.stream = self.encode_export(
+            self.export_objects(params, projection), params['format'], projection
+        )
+
+    def encode_export(self, objects, export_format, projection):
+        """
+        Encode objects as NDJSON lines or CSV rows with header.
+
+        Args:
+            objects (iterable): Model instances or rows of projected columns
+            export_format (str): One of EXPORT_CONTENT_TYPES
+            projection (function): Conversion of exported objects, see core.projections
+
+        Returns:
+            (generator): Encoded chunks
+        """
+        if export_format == 'csv':
+            lines = self.encode_csv_rows(objects, projection)
+        else:
+            lines = (codec.dumps(projection(instance)) + b'\n' for instance in objects)
+
+        chunk = b''.join(itertools.islice(lines, self.export_batch_size))
+        while chunk:
+            yield chunk
+            chunk = b''.join(itertools.islice(lines, self.export_batch_size))
+
+    @staticmethod
+    def encode_csv_rows(objects, projection):
+        """
+        Encode objects as CSV rows, the first row is header with keys of projection.
+
+        Args:
+            objects (iterable): Model instances or rows of projected columns
+            projection (function): Conversion of exported objects, see core.projections
+
+        Returns:
+            (generator): Encoded rows
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        for values in itertools.chain([projection.keys], (projection(instance).values() for instance in objects)):
+            writer.writerow(values)
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    def build_filters(self, params):
+        """
+        Build filters of requested search mode and sorting which should be used with them
+
+        Args:
+            params (dict): Query parameters
+
+        Returns:
+            (tuple): List of filters to be applied, sorting value
+        """
+        sorting = params.get('sorting')
+
+        if params.get('search_mode') == 'fulltext':
+            filters = self.build_fulltext_filters(params)
+            if filters and not sorting:
+                # Best matches first
+                sorting = '-rank'
+        else:
+            filters = self.build_query_filters(params)
+
+        return filters, sorting
+
+    def get_count_key(self, params, count):
+        """
+        Build key of cached total, it is the same for all pages and sortings of the same search
+
+        Args:
+            params (dict): Query parameters
+            count (str): Count mode, one of exact, estimate or capped
+
+        Returns:
+            (tuple): Model, count mode and normalized values of `filter_params`
+        """
+        values = []
+        for name in self.filter_params:
+            value = params.get(name)
+            if isinstance(value, list):
+                # Filters of all terms are combined, their order and empty terms do not matter
+                value = tuple(sorted({item.strip() for item in value} - {''}))
+            values.append(value)
+
+        return (self.model, count, *values)
+
+    def get_sorting_expression(self, sorting):
+        """
+        Get expression and direction which will be used to order objects
+
+        Args:
+            sorting (str): Sorting value, e.g. -name
+
+        Returns:
+            (tuple): Sorting expression, True if descending order was requested
+        """
+        descending = bool(sorting and sorting.startswith('-'))
+        if descending:
+            sorting = sorting[1:]
+
+        # By default sort by ID
+        return self.sorting_mapper.get(sorting, self.model.id), descending
 
     def get_sorting_parameter(self, sorting):
         """
@@ -55,18 +458,304 @@ class BaseSortingAPI:
         Returns:
             (sqlalchemy.sql.elements.UnaryExpression): Sorting value
         """
-        order = asc
-        if sorting and sorting.startswith('-'):
-            order = desc
-            sorting = sorting[1:]
+        expression, descending = self.get_sorting_expression(sorting)
+        order = desc if descending else asc
 
-        # By default sort by ID
-        return order(self.sorting_mapper.get(sorting, self.model.id))
+        return order(expression)
+
+    def get_ordering(self, sorting):
+        """
+        Get ORDER BY clauses, ID is used as tie-breaker so the order is stable between pages
+
+        Args:
+            sorting (str): Sorting value, e.g. -name
+
+        Returns:
+            (list): Sorting values
+        """
+        expression, descending = self.get_sorting_expression(sorting)
+        if expression is self.model.id:
+            return [self.get_sorting_parameter(sorting)]
+
+        order = desc if descending else asc
+
+        return [order(expression), order(self.model.id)]
+
+    @staticmethod
+    def is_valid_sort_key(expression, key):
+        """
+        Check that sort key decoded from cursor can be compared with sorting expression.
+
+        Args:
+            expression (sqlalchemy.sql.elements.ColumnElement): Sorting expression, see get_sorting_expression
+            key: Sort key value of the last seen object
+
+        Returns:
+            (bool): True if the key is NULL or of the expression type, lowered names are compared with strings
+        """
+        if key is None:
+            return True
+
+        if isinstance(expression.type, Float):
+            return isinstance(key, (int, float))
+
+        if isinstance(expression.type, Integer):
+            return isinstance(key, int)
+
+        return isinstance(key, str)
+
+    def get_seek_filter(self, sorting, key, last_id):
+        """
+        Build filter which selects objects placed after given sort key and ID.
+
+        PostgreSQL puts NULL values last in ascending and first in descending order, nullable
+        sort keys need an extra branch to keep them in the result.
+
+        Args:
+            sorting (str): Sorting value, e.g. -name
+            key: Sort key value of the last seen object
+            last_id (int): ID of the last seen object
+
+        Returns:
+            (sqlalchemy.sql.elements.ClauseElement): Filter to be applied
+        """
+        expression, descending = self.get_sorting_expression(sorting)
+        compare = operator.lt if descending else operator.gt
+
+        if expression is self.model.id:
+            return compare(self.model.id, last_id)
+
+        if key is None:
+            after = and_(expression.is_(None), compare(self.model.id, last_id))
+            return or_(after, expression.isnot(None)) if descending else after
+
+        if isinstance(expression.type, Float):
+            # Compare with the same precision as the sort key, e.g. real values returned by ts_rank
+            key = cast(key, expression.type)
+
+        after = compare(tuple_(expression, self.model.id), tuple_(key, last_id))
+        if not descending and self.is_nullable(expression):
+            return or_(after, expression.is_(None))
+
+        return after
+
+    def build_fulltext_filters(self, params):
+        """
+        Create filter for full-text search over model search_vector column, all search terms are
+        compiled into one tsquery. Matched objects can be sorted by `rank`.
+
+        Args:
+            params (dict): Query params
+
+        Returns:
+            (list): List of filters to be applied
+        """
+        tsquery = build_prefix_tsquery(params.get('search') or [])
+        if tsquery is None:
+            return []
+
+        query = func.to_tsquery(FULLTEXT_CONFIG, tsquery)
+
+        # Resources are created for every request, the mapper is extended only for this one
+        self.sorting_mapper = dict(
+            self.sorting_mapper,
+            rank=func.ts_rank(self.model.search_vector, query, type_=REAL)
+        )
+
+        return [self.model.search_vector.op('@@')(query)]
+
+    def build_id_search_filter(self, search_term):
+        """
+        Build filter matching objects which ID starts with given digits.
+
+        Every prefix is turned into an ID range, e.g. 12 matches 12, 120-129, 1200-1299..., so the
+        primary key index is used instead of casting IDs to text.
+
+        Args:
+            search_term (str): Search term containing only digits
+
+        Returns:
+            (sqlalchemy.sql.elements.ClauseElement): Filter to be applied, false() when no ID can match
+        """
+        try:
+            start = end = int(search_term)
+        except ValueError:
+            return false()
+
+        if search_term != str(start) or start == 0:
+            # IDs do not have leading zeros and start at 1, prefix 0 would never grow into a range
+            return false()
+
+        ranges = [self.model.id == start]
+        start, end = start * 10, end * 10 + 9
+        while start <= MAX_ID:
+            ranges.append(self.model.id.between(start, min(end, MAX_ID)))
+            start, end = start * 10, end * 10 + 9
+
+        return or_(*ranges)
+
+    def paginate_result_by_cursor(self, db_session, filters, size, sorting, cursor, projection=None):
+        """
+        Paginate query result using keyset (seek) method, cost of a page does not depend on its position
+
+        Args:
+            db_session (Session): DB Session object
+            filters (list): Filters to be applied
+            size (int): Desired page size
+            sorting (str): Sorting value, e.g. -name
+            cursor (list): Decoded cursor of the previous page
+            projection (function): Response projection, see `get_entity`
+
+        Returns:
+            (tuple): List of objects, cursor of the next page or None for the last page
+
+        Raises:
+            (HTTPError): Cursor was created for different sorting or its sort key does not fit the sorting
+        """
+        expression, _ = self.get_sorting_expression(sorting)
+
+        seek_filters = []
+        if cursor:
+            cursor_sorting, key, last_id = cursor
+            if cursor_sorting != sorting or not self.is_valid_sort_key(expression, key):
+                raise HTTPError(
+                    status=falcon.HTTP_422,
+                    errors={'cursor': ['Cursor does not match sorting.']}
+                )
+            seek_filters.append(self.get_seek_filter(sorting, key, last_id))
+
+        rows = self.bake_query(
+            db_session,
+            lambda query, filters, seek_filters, ordering, expressions: query.add_columns(
+                *expressions
+            ).filter(
+                *filters, *seek_filters
+            ).order_by(
+                *ordering
+            ).limit(
+                bindparam('limit')
+            ),
+            clauses=(filters, seek_filters, self.get_ordering(sorting), [expression]),
+            projection=projection,
+            limit=size + 1
+        ).all()
+
+        next_cursor = None
+        if len(rows) > size:
+            rows = rows[:size]
+            instance, key = rows[-1]
+            next_cursor = encode_cursor([sorting, key, instance.id])
+
+        return [instance for instance, _ in rows], next_cursor
+
+    def count_objects(self, db_session, filters, count):
+        """
+        Count objects using given count mode
+
+        Args:
+            db_session (Session): DB Session object
+            filters (list): Filters to be applied
+            count (str): Count mode, one of exact, estimate or capped
+
+        Returns:
+            (dict): Total number of objects and flags describing its accuracy
+        """
+        if count == 'capped':
+            total = self.bake_query(
+                db_session,
+                lambda query, filters: query.filter(*filters).limit(bindparam('count_limit')),
+                clauses=(filters,),
+                count_limit=self.count_limit + 1
+            ).count()
+            return {
+                'total': min(total, self.count_limit),
+                'total_is_lower_bound': total > self.count_limit
+            }
+
+        if count == 'estimate':
+            # Planner statistics describe only the whole table
+            total = None if filters else self.estimate_total(db_session)
+            if total is not None:
+                return {'total': total, 'total_is_estimate': True}
+
+            return {'total': self.count_filtered(db_session, filters), 'total_is_estimate': False}
+
+        return {'total': self.count_filtered(db_session, filters)}
+
+    def count_filtered(self, db_session, filters):
+        """
+        Count all objects matching filters
+
+        Args:
+            db_session (Session): DB Session object
+            filters (list): Filters to be applied
+
+        Returns:
+            (int): Total number of objects
+        """
+        return self.bake_query(
+            db_session,
+            lambda query, filters: query.filter(*filters),
+            clauses=(filters,)
+        ).count()
+
+    def estimate_total(self, db_session):
+        """
+        Get number of rows of model table estimated by PostgreSQL planner
+
+        Args:
+            db_session (Session): DB Session object
+
+        Returns:
+            (int): Estimated number of rows or None if the table was not analyzed yet
+        """
+        estimate = db_session.execute(
+            text('SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table_name AS regclass)'),
+            {'table_name': self.model.__tablename__}
+        ).scalar()
+
+        return estimate if estimate and estimate > 0 else None
+
+    def count_empty_page(self, db_session, filters, page):
+        """
+        Count objects when the page is empty and window function did not return total
+
+        Args:
+            db_session (Session): DB Session object
+            filters (list): Filters to be applied
+            page (int): Page number
+
+        Returns:
+            (int): Total number of objects
+        """
+        # First page is empty only when there is nothing to count
+        if page == 0:
+            return 0
+
+        return self.count_filtered(db_session, filters)
+
+    @staticmethod
+    def is_nullable(expression):
+        """
+        Check if expression may evaluate to NULL because of nullable column
+
+        Args:
+            expression (sqlalchemy.sql.elements.ColumnElement): Sorting expression
+
+        Returns:
+            (bool)
+        """
+        if hasattr(expression, '__clause_element__'):
+            expression = expression.__clause_element__()
+
+        return any(
+            element.nullable for element in visitors.iterate(expression, {}) if isinstance(element, Column)
+        )
 
     @staticmethod
     def paginate_result(query, size, page):
         """
-        Paginate query result
+        Paginate query result, limit and offset are bound parameters so cached queries serve all pages
 
         Args:
             query (sqlalchemy.orm.query.Query): Query object
@@ -74,6 +763,22 @@ class BaseSortingAPI:
             page (int): Page number
 
         Returns:
-            (sqlalchemy.orm.query.Query): Paginated query object
+            (sqlalchemy.orm.query.Query): Paginated query object, see `get_pagination_params`
+        """
+        params = BaseSortingAPI.get_pagination_params(size, page)
+
+        return query.limit(bindparam('limit', params['limit'])).offset(bindparam('offset', params['offset']))
+
+    @staticmethod
+    def get_pagination_params(size, page):
+        """
+        Get values of bound parameters of paginated query
+
+        Args:
+            size (int): Desired page size
+            page (int): Page number
+
+        Returns:
+            (dict): Limit and offset
         """
-        return query.slice(size * page, size * (page + 1))
+        return {'limit': size, 'offset': size * page}
@@ -0,0 +1,140 @@
+"""
+In-process caches of GET responses and totals of collections invalidated by writes.
+
+Every model has a generation counter which is bumped by the transaction changing the model, the bump commits or
+rolls back together with the change. Cached
+value remembers generations of models it was computed from and it is not used once any of them changed.
+Counters are rows of `cache_generations` table shared by all worker processes, values are cached in every
+process separately, but a write done by any of them invalidates them all.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import bindparam, event, text
+
+import settings
+from core.db.session import Session
+
+
+GET_GENERATIONS = text(
+    'SELECT name, generation FROM cache_generations WHERE name IN :names'
+).bindparams(bindparam('names', expanding=True))
+# Rows are locked in order of names until the transaction ends, concurrent writers of the same model wait for it
+BUMP_GENERATIONS = text("""
+    INSERT INTO cache_generations (name, generation)
+    SELECT name, 1 FROM unnest(CAST(:names AS varchar[])) AS name ORDER BY name
+    ON CONFLICT (name) DO UPDATE SET generation = cache_generations.generation + 1
+""")
+
+
+class Cache:
+    """
+    Least recently used values, every value expires `ttl` seconds after it was cached.
+    """
+
+    def __init__(self, size, ttl):
+        self.size = size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, model_generations):
+        """
+        Get cached value which is still valid.
+
+        Args:
+            key (tuple): Cache key
+            model_generations (tuple): Current generations of models the value was computed from, see
+                `get_generations`
+
+        Returns:
+            Cached value or None when it is missing, expired or some of the models changed since it was cached
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, cached_generations, value = entry
+            if expires_at < time.monotonic() or cached_generations != model_generations:
+                del self.entries[key]
+                return None
+
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, model_generations, value):
+        """
+        Cache value.
+
+        Args:
+            key (tuple): Cache key
+            model_generations (tuple): Generations of models taken before data were read, see `get_generations`,
+                the value is never used when it was computed from data changed meanwhile
+            value: Cached value
+        """
+        with self.lock:
+            self.entries[key] = time.monotonic() + self.ttl, model_generations, value
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+def get_generations(db_session, models):
+    """
+    Get current generations of given models, models which were never changed have generation 0.
+
+    Args:
+        db_session (Session): DB Session object, generations are read before data in the same session
+        models (tuple): Model classes
+
+    Returns:
+        (tuple): Generation of every model
+    """
+    names = [model.__tablename__ for model in models]
+    generations = dict(db_session.execute(GET_GENERATIONS, {'names': names}).fetchall())
+
+    return tuple(generations.get(name, 0) for name in names)
+
+
+def mark_changed(db_session, *models):
+    """
+    Bump generations of models changed in transaction of the session, every model is bumped once per transaction.
+
+    The bump is a statement of the transaction, readers see the new generation exactly when they see the change.
+
+    Args:
+        db_session (Session): DB Session object
+        *models: Changed model classes
+    """
+    bumped_models = db_session.info.setdefault('bumped_models', set())
+    names = sorted({model.__tablename__ for model in models if model not in bumped_models})
+    if not names:
+        return
+
+    db_session.connection().execute(BUMP_GENERATIONS, names=names)
+    bumped_models.update(models)
+
+
+@event.listens_for(Session, 'after_flush')
+def mark_flushed(db_session, flush_context):
+    # Flush changes also related models, e.g. users of deleted organisation
+    mark_changed(db_session, *{
+        instance.__class__ for instance in (*db_session.new, *db_session.dirty, *db_session.deleted)
+    })
+
+
+@event.listens_for(Session, 'after_commit')
+@event.listens_for(Session, 'after_soft_rollback')
+def forget_bumps(db_session, *args):
+    # Next transaction bumps generations again, rollback of savepoint may have dropped a bump
+    db_session.info.pop('bumped_models', None)
+
+
+response_cache = Cache(settings.RESPONSE_CACHE['size'], settings.RESPONSE_CACHE['ttl'])
+count_cache = Cache(settings.COUNT_CACHE['size'], settings.COUNT_CACHE['ttl'])
@@ -0,0 +1,167 @@
+"""
+Content codings of compressed responses, see core.middleware.compression.
+
+Encodings listed in `settings.COMPRESSION['encodings']` are offered in order of preference, the ones whose library
+is not installed are left out. Every encoding compresses whole bodies and creates compressors of streamed bodies.
+"""
+import zlib
+
+import settings
+
+
+def gzip_compressobj(level):
+    # Header and trailer are written in gzip format when 16 is added to window size
+    return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+class GzipCompressor:
+    """
+    Incremental gzip compressor, `compress` returns compressed data of all chunks given so far and `flush` the end.
+
+    Every chunk is flushed, so the client receives it while the next one is produced. Chunks of streamed responses
+    are several kB large, flushing them costs about 2 % of compressed size.
+    """
+
+    def __init__(self, level):
+        self.compressobj = gzip_compressobj(level)
+
+    def compress(self, data):
+        return self.compressobj.compress(data) + self.compressobj.flush(zlib.Z_SYNC_FLUSH)
+
+    def flush(self):
+        return self.compressobj.flush()
+
+
+class BrotliCompressor:
+    """
+    Incremental brotli compressor with the same interface as GzipCompressor.
+    """
+
+    def __init__(self, brotli, quality):
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data):
+        # Brotli would otherwise keep whole response in its buffers
+        return self.compressor.process(data) + self.compressor.flush()
+
+    def flush(self):
+        return self.compressor.finish()
+
+
+class GzipEncoding:
+    name = 'gzip'
+
+    def __init__(self, level):
+        self.level = level
+
+    def compress(self, data):
+        compressobj = gzip_compressobj(self.level)
+
+        return compressobj.compress(data) + compressobj.flush()
+
+    def compressor(self):
+        return GzipCompressor(self.level)
+
+
+class BrotliEncoding:
+    name = 'br'
+
+    def __init__(self, level):
+        import brotli
+
+        self.brotli = brotli
+        self.level = level
+
+    def compress(self, data):
+        return self.brotli.compress(data, quality=self.level)
+
+    def compressor(self):
+        return BrotliCompressor(self.brotli, self.level)
+
+
+ENCODINGS = {
+    'br': BrotliEncoding,
+    'gzip': GzipEncoding,
+}
+
+
+def get_encodings(names, levels):
+    """
+    Create encodings of installed libraries.
+
+    Args:
+        names (tuple): Encoding names in order of preference, keys of ENCODINGS
+        levels (dict): Compression level of encoding names
+
+    Returns:
+        (dict): Encodings under their names in order of preference
+    """
+    encodings = {}
+    for name in names:
+        try:
+            encodings[name] = ENCODINGS[name](levels[name])
+        except ImportError:
+            continue
+
+    return encodings
+
+
+def parse_accept_encoding(header):
+    """
+    Parse Accept-Encoding header to quality values of content codings.
+
+    Args:
+        header (str): Header value, e.g. `gzip;q=0.8, br`
+
+    Returns:
+        (dict): Quality of lower case coding names, quality of coding with invalid `q` parameter is 0
+    """
+    qualities = {}
+    for item in header.split(','):
+        name, *parameters = (part.strip() for part in item.split(';'))
+        if not name:
+            continue
+
+        quality = 1.0
+        for parameter in parameters:
+            key, _, value = parameter.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        qualities[name.lower()] = quality
+
+    return qualities
+
+
+def negotiate_encoding(header, encodings):
+    """
+    Select encoding of response preferred by client, server preference decides between equally accepted ones.
+
+    Args:
+        header (str): Accept-Encoding header value, None when client did not send it
+        encodings (dict): Available encodings under their names in order of preference, see get_encodings
+
+    Returns:
+        Encoding instance, None when response should be sent as it is
+    """
+    if not header:
+        return None
+
+    qualities = parse_accept_encoding(header)
+    best, best_quality = None, 0.0
+    for name, encoding in encodings.items():
+        quality = qualities.get(name, qualities.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+
+    if qualities.get('identity', 0.0) > best_quality:
+        # Client explicitly prefers uncompressed response
+        return None
+
+    return best
+
+
+encodings = get_encodings(settings.COMPRESSION['encodings'], settings.COMPRESSION['levels'])
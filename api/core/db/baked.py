@@ -0,0 +1,144 @@
+"""
+Cached construction and compilation of ORM queries.
+
+Queries are built and compiled only once per shape of their dynamic clauses (filters, ordering...), values of
+bound parameters found in the clauses are sent as parameters of the cached statement.
+"""
+from sqlalchemy import bindparam
+from sqlalchemy.ext import baked
+from sqlalchemy.sql import visitors
+from sqlalchemy.sql.elements import BindParameter, Cast, TypeClause, _anonymous_label
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.sql.operators import custom_op
+from sqlalchemy.sql.selectable import Selectable
+
+import settings
+
+
+bakery = baked.bakery(size=settings.SQLALCHEMY['baked_queries'])
+
+# Execution options of baked queries, their statements are executed often with the same text
+EXECUTION_OPTIONS = {'prepare': True}
+if settings.PREPARED_STATEMENTS['enabled'] or settings.SQLALCHEMY['autocommit_reads']:
+    # Prepared statements can not be executed by server-side cursors and autocommit connections of reads can not
+    # declare them, results of hot queries are fetched at once
+    EXECUTION_OPTIONS['stream_results'] = False
+
+# Attributes which change SQL rendered for an element besides its class and children
+SHAPE_ATTRIBUTES = ('operator', 'modifier', 'negate', 'name', 'text', 'range_', 'rows')
+
+
+def bake_query(db_session, build, clauses=(), key=(), **params):
+    """
+    Get cached query built by given function.
+
+    Args:
+        db_session (Session): DB Session object
+        build (function): Builds query from session and groups of clauses, its code is part of cache key
+        clauses (tuple): Groups (lists) of clauses passed to `build`, their structure is part of cache key
+        key (tuple): Other values `build` depends on, e.g. model
+        **params: Values of bound parameters created by `build`
+
+    Returns:
+        (sqlalchemy.ext.baked.Result): Query result with parameters set
+    """
+    shape, values, names = describe_clauses(clauses)
+    if shape is None:
+        # Structure of clauses can not be described, query is built every time
+        baked_query = bakery(lambda session: build(session, *clauses).execution_options(**EXECUTION_OPTIONS))
+        baked_query.spoil(full=True)
+        return baked_query(db_session).params(**params)
+
+    baked_query = bakery(
+        lambda session: build(session, *parametrize_clauses(clauses, names)).execution_options(**EXECUTION_OPTIONS),
+        build.__code__,
+        *key,
+        shape
+    )
+
+    return baked_query(db_session).params(**values, **params)
+
+
+def describe_clauses(clauses):
+    """
+    Describe structure of clauses and collect values of their bound parameters.
+
+    Args:
+        clauses (tuple): Groups of clauses
+
+    Returns:
+        (tuple): Hashable shape of clauses or None when they contain elements which can not be described,
+            values of bound parameters by their new names, new names by ID of bound parameters
+    """
+    shape = []
+    values = {}
+    names = {}
+    for group in clauses:
+        shape.append(len(group))
+        for clause in group:
+            for element in visitors.iterate(clause, {}):
+                if isinstance(element, BindParameter):
+                    name = names.get(id(element))
+                    if name is None:
+                        name = names[id(element)] = f'clause_{len(names)}'
+                        values[name] = element.effective_value
+                    shape.append((name, element.type.__class__, element.expanding))
+                elif isinstance(element, Selectable) and not isinstance(element, FunctionElement):
+                    # Subqueries are rendered from many attributes which are not described
+                    return None, None, None
+                else:
+                    shape.append(describe_element(element))
+
+    return tuple(shape), values, names
+
+
+def describe_element(element):
+    """
+    Describe how element is rendered regardless of its children.
+
+    Args:
+        element (sqlalchemy.sql.elements.ClauseElement): Clause element
+
+    Returns:
+        (tuple): Hashable description
+    """
+    description = [element.__class__]
+    for attribute in SHAPE_ATTRIBUTES:
+        value = getattr(element, attribute, None)
+        if isinstance(value, _anonymous_label):
+            # Anonymous labels are unique for every element
+            value = None
+        elif isinstance(value, custom_op):
+            # Custom operators are hashed by identity, e.g. every op('@@') creates new one
+            value = (custom_op, value.opstring, value.precedence, value.is_comparison)
+        description.append(value)
+
+    if isinstance(element, (Cast, TypeClause)):
+        description.append(repr(element.type))
+    if hasattr(element, 'table'):
+        description.append(getattr(element.table, 'name', None))
+
+    return tuple(description)
+
+
+def parametrize_clauses(clauses, names):
+    """
+    Copy clauses with bound parameters replaced by named ones without values.
+
+    Args:
+        clauses (tuple): Groups of clauses
+        names (dict): New names by ID of bound parameters
+
+    Returns:
+        (list): Groups of parametrized clauses
+    """
+    def replace(element):
+        name = names.get(id(element))
+        if name is not None:
+            return bindparam(name, type_=element.type, expanding=element.expanding)
+
+    # Elements shared by several clauses are replaced by the same parameter
+    return [
+        [visitors.replacement_traverse(clause, {}, replace) for clause in group]
+        for group in clauses
+    ]
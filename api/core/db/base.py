@@ -1,10 +1,17 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Integer
+import falcon
+from sqlalchemy import Column, DateTime, Integer, String, bindparam, cast, func, literal, select, text
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import as_declarative, declared_attr
 from sqlalchemy.orm.attributes import flag_modified
 from sqlalchemy.schema import MetaData
 
+from core.cache import mark_changed
+from core.db.baked import bake_query
+from core.errors import HTTPError
+
 
 # Constraint naming convention for alembic
 convention = {
@@ -20,24 +27,57 @@ convention = {
 class Base:
     id = Column(Integer, primary_key=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Changed by every update, rows inserted by plain SQL get it from server default
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=text("timezone('utc', now())")
+    )
+
+    # Maps unique constraint names to field name and message of validation error reported on violation
+    integrity_errors = {}
+    # Relationships whose objects are part of detail responses, their changes change version of the object
+    version_relationships = ()
 
     @declared_attr
     def __tablename__(cls):
         return cls.__name__.lower()
 
-    @staticmethod
-    def _commit(commit, db_session):
+    @classmethod
+    def _commit(cls, commit, db_session, instance=None):
         """
         Commit changes.
 
         Args:
             commit (bool): Indicates wheather to commit session or not
             db_session (Session): DB Session object
+            instance: Model instance which was changed
+
+        Raises:
+            (HTTPError): Change violates one of the constraints listed in `integrity_errors`
         """
-        if commit:
-            db_session.commit()
-        else:
-            db_session.flush()
+        # Failed flush expires instance, keep values needed for error messages
+        values = {field: getattr(instance, field) for field, _ in cls.integrity_errors.values()} if instance else {}
+        # Generations bumped in the writing transaction stop serving cached responses once it commits, see core.cache
+        mark_changed(db_session, cls)
+
+        try:
+            if commit:
+                db_session.commit()
+            else:
+                db_session.flush()
+        except IntegrityError as err:
+            constraint_name = getattr(getattr(err.orig, 'diag', None), 'constraint_name', None)
+            if instance is None or constraint_name not in cls.integrity_errors:
+                raise
+
+            field, message = cls.integrity_errors[constraint_name]
+            raise HTTPError(
+                status=falcon.HTTP_422,
+                errors={field: [message.format(values[field])]}
+            ) from err
 
     @classmethod
     def create(cls, db_session, commit=True, **kwargs):
@@ -55,9 +95,44 @@ class Base:
         instance = cls(**kwargs)
 
         db_session.add(instance)
-        cls._commit(commit, db_session)
+        cls._commit(commit, db_session, instance)
         return instance
 
+    @classmethod
+    def bulk_create(cls, db_session, items, commit=True, chunk_size=1000):
+        """
+        Create objects with multi-row INSERT ... RETURNING statements, one round trip per chunk of items.
+
+        Args:
+            db_session (Session): DB Session object
+            items (list): Keyword arguments to model class constructor, all of them with the same keys
+            commit (bool): Indicates whether to commit session or not
+            chunk_size (int): Maximum number of rows inserted by one statement
+
+        Returns:
+            (list): Newly created model objects in the order of items, they are not added to the session
+
+        Raises:
+            (falcon.HTTPConflict): Conflicting object was created by another request meanwhile
+        """
+        # Deferred columns, e.g. search vectors, are not needed in responses
+        columns = [prop.columns[0] for prop in cls.__mapper__.column_attrs if not prop.deferred]
+
+        rows = []
+        try:
+            for start in range(0, len(items), chunk_size):
+                rows.extend(db_session.execute(
+                    cls.__table__.insert().values(items[start:start + chunk_size]).returning(*columns)
+                ))
+        except IntegrityError as err:
+            raise falcon.HTTPConflict(
+                description='Data were changed by another request, try again'
+            ) from err
+
+        cls._commit(commit, db_session)
+
+        return [cls(**dict(row)) for row in rows]
+
     def convert_object_to_dict(self, keys):
         """
         Create dict with object attribute, values as key and value.
@@ -118,14 +193,14 @@ class Base:
             setattr(instance, name, value)
 
         db_session.add(instance)
-        self._commit(commit, db_session)
+        self._commit(commit, db_session, instance)
 
         return instance
 
     @classmethod
     def get_by_id(cls, db_session, pk):
         """
-        Get object by primary key
+        Get object by primary key, lookup query is built and compiled once per model
 
         Args:
             db_session (Session): DB Session object
@@ -134,7 +209,53 @@ class Base:
         Returns:
             Model instance or None
         """
-        return db_session.query(cls).get(pk)
+        return bake_query(db_session, lambda session: session.query(cls), key=(cls,)).get(pk)
+
+    @classmethod
+    def get_version(cls, db_session, pk):
+        """
+        Get version of object and of related objects listed in `version_relationships`, full rows are not loaded
+
+        Args:
+            db_session (Session): DB Session object
+            pk (int): Primary key
+
+        Returns:
+            (tuple): Update time of object and digest of update times of every relationship, or None if object
+                does not exist
+        """
+        return bake_query(
+            db_session,
+            lambda session: session.query(
+                cls.updated_at,
+                *(cls.get_relationship_version(name) for name in cls.version_relationships)
+            ).filter(
+                cls.id == bindparam('pk')
+            ),
+            key=(cls,),
+            pk=pk
+        ).first()
+
+    @classmethod
+    def get_relationship_version(cls, name):
+        """
+        Build subquery digesting IDs and update times of objects related through relationship.
+
+        Args:
+            name (str): Relationship name
+
+        Returns:
+            (sqlalchemy.sql.selectable.ScalarSelect): Subquery correlated with the object
+        """
+        relationship = getattr(cls, name).property
+        related = relationship.mapper.class_
+        row_version = cast(related.id, String) + literal(':') + cast(related.updated_at, String)
+
+        return select([
+            func.md5(func.string_agg(row_version, aggregate_order_by(literal(','), related.id)))
+        ]).where(
+            relationship.primaryjoin
+        ).as_scalar()
 
     @classmethod
     def delete_by_id(cls, db_session, instance_id, commit=True):
@@ -6,6 +6,7 @@ from alembic.config import Config
 from settings import POSTGRESQL
 
 # import models here
+from imports.models import Import
 from organisations.models import Organisation
 from users.models import User
 
@@ -1,11 +1,199 @@
-from sqlalchemy import create_engine
+import itertools
+import re
+import time
+from collections import OrderedDict
+
+import psycopg2
+import psycopg2.errors
+from sqlalchemy import create_engine, event
 
 import settings
 
 
+# Named pyformat parameters rendered by psycopg2 dialect and escaped percent signs
+PARAMETER = re.compile(r'%\((\w+)\)s|%%')
+# Names of prepared statements are never reused, e.g. after statements of old schema were deallocated
+STATEMENT_NUMBERS = itertools.count(1)
+
+
 engine = create_engine(
     "{engine}://{username}:{password}@{host}:{port}/{db_name}".format(**settings.POSTGRESQL),
     pool_size=settings.POSTGRESQL["pool_size"],
     connect_args={"application_name": settings.POSTGRESQL["application_name"]},
     echo=settings.SQLALCHEMY["debug"],
 )
+
+
+class PreparedStatements:
+    """
+    Server-side prepared statements of one pooled connection.
+
+    Statements executed with `prepare` execution option (see core.db.baked) are prepared on their first execution
+    and executed by name afterwards, PostgreSQL parses and plans them only once per connection. Prepared
+    statements outlive transactions, they are deallocated when schema version changes.
+    """
+
+    def __init__(self, schema_version):
+        self.schema_version = schema_version
+        self.checked_at = time.monotonic()
+        self.statements = OrderedDict()
+        # Set when PostgreSQL refused to execute prepared statement planned for old schema
+        self.invalidated = False
+
+    def get(self, cursor, statement):
+        """
+        Get name of prepared statement, the statement is prepared when it is executed for the first time.
+
+        Args:
+            cursor (psycopg2.extensions.cursor): Cursor executing the statement
+            statement (str): Statement with named pyformat parameters
+
+        Returns:
+            (tuple): Name of prepared statement or None when it can not be prepared, names of its parameters
+        """
+        if statement in self.statements:
+            self.statements.move_to_end(statement)
+            return self.statements[statement]
+
+        parameters = []
+
+        def to_positional(match):
+            if match.group(1) is None:
+                return '%'
+            if match.group(1) not in parameters:
+                parameters.append(match.group(1))
+            return f'${parameters.index(match.group(1)) + 1}'
+
+        name = f'prepared_{next(STATEMENT_NUMBERS)}'
+        try:
+            self.execute(cursor, f'PREPARE {name} AS {PARAMETER.sub(to_positional, statement)}')
+        except psycopg2.Error:
+            # E.g. type of parameter can not be inferred, the statement is always executed as it is
+            name = None
+
+        self.statements[statement] = name, parameters
+        if len(self.statements) > settings.PREPARED_STATEMENTS['cache_size']:
+            _, (evicted, _) = self.statements.popitem(last=False)
+            if evicted is not None:
+                self.execute(cursor, f'DEALLOCATE {evicted}')
+
+        return name, parameters
+
+    @staticmethod
+    def execute(cursor, statement):
+        """
+        Execute statement without parameters, failure does not abort transaction of the connection.
+
+        Args:
+            cursor (psycopg2.extensions.cursor): Cursor of the connection
+            statement (str): Statement
+        """
+        if cursor.connection.autocommit:
+            cursor.execute(statement)
+            return
+
+        cursor.execute('SAVEPOINT prepared_statements')
+        try:
+            cursor.execute(statement)
+        except psycopg2.Error:
+            cursor.execute('ROLLBACK TO SAVEPOINT prepared_statements')
+            raise
+        finally:
+            cursor.execute('RELEASE SAVEPOINT prepared_statements')
+
+
+def get_schema_version(dbapi_connection):
+    """
+    Get revision of the last applied migration, transaction started by the query is ended.
+
+    Args:
+        dbapi_connection (psycopg2.extensions.connection): DBAPI connection
+
+    Returns:
+        (str): Alembic revision or None when migrations were not applied
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("SELECT to_regclass('alembic_version') IS NOT NULL")
+        if not cursor.fetchone()[0]:
+            return None
+
+        cursor.execute('SELECT version_num FROM alembic_version')
+        row = cursor.fetchone()
+        return row[0] if row else None
+    finally:
+        cursor.close()
+        if not dbapi_connection.autocommit:
+            dbapi_connection.rollback()
+
+
+def enable_prepared_statements(engine):
+    """
+    Execute hot statements of given engine as server-side prepared statements.
+
+    Prepared statements are deallocated on checkout of connection when alembic revision changed since they
+    were prepared, the revision is checked at most once per `schema_check_interval` seconds.
+
+    Args:
+        engine (sqlalchemy.engine.Engine): Engine using psycopg2 dialect
+    """
+    @event.listens_for(engine, 'connect')
+    def connect(dbapi_connection, connection_record):
+        connection_record.info['prepared_statements'] = PreparedStatements(get_schema_version(dbapi_connection))
+
+    @event.listens_for(engine, 'checkout')
+    def checkout(dbapi_connection, connection_record, connection_proxy):
+        prepared = connection_record.info.get('prepared_statements')
+        if prepared is None:
+            # Connection was created before prepared statements were enabled
+            connect(dbapi_connection, connection_record)
+            return
+
+        if (
+            not prepared.invalidated and
+            time.monotonic() - prepared.checked_at < settings.PREPARED_STATEMENTS['schema_check_interval']
+        ):
+            return
+
+        schema_version = get_schema_version(dbapi_connection)
+        if schema_version == prepared.schema_version and not prepared.invalidated:
+            prepared.checked_at = time.monotonic()
+            return
+
+        cursor = dbapi_connection.cursor()
+        cursor.execute('DEALLOCATE ALL')
+        cursor.close()
+        dbapi_connection.rollback()
+        connection_record.info['prepared_statements'] = PreparedStatements(schema_version)
+
+    @event.listens_for(engine, 'before_cursor_execute', retval=True)
+    def execute_prepared(connection, cursor, statement, parameters, context, executemany):
+        # Server-side cursors are declared with DECLARE ... CURSOR FOR, which can not execute prepared statement
+        if executemany or context is None or not context.execution_options.get('prepare') or cursor.name:
+            return statement, parameters
+
+        prepared = connection.info.get('prepared_statements')
+        if prepared is None:
+            return statement, parameters
+
+        name, names = prepared.get(cursor, statement)
+        if name is None:
+            return statement, parameters
+
+        if not names:
+            return f'EXECUTE {name}', parameters
+
+        return f'EXECUTE {name} ({", ".join(f"%({parameter})s" for parameter in names)})', parameters
+
+    @event.listens_for(engine, 'handle_error')
+    def invalidate(exception_context):
+        connection = exception_context.connection
+        prepared = connection.info.get('prepared_statements') if connection is not None else None
+        error = exception_context.original_exception
+        if prepared is not None and isinstance(error, psycopg2.errors.FeatureNotSupported):
+            # E.g. cached plan must not change result type, statements are deallocated on next checkout
+            prepared.invalidated = True
+
+
+if settings.PREPARED_STATEMENTS['enabled']:
+    enable_prepared_statements(engine)
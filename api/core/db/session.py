@@ -1,6 +1,9 @@
 from contextlib import contextmanager
 
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import Pool
 
 import settings
 from core.db.engine import engine
@@ -26,3 +29,21 @@ def session_manager():
     finally:
         db_session.close()
 
+
+@event.listens_for(Session, 'after_begin')
+def begin_autocommit(db_session, transaction, connection):
+    """
+    Switch connection of session marked by `autocommit` info to autocommit mode before its first statement.
+
+    psycopg2 then sends neither BEGIN before the first statement nor ROLLBACK when the session is closed, switching
+    the mode is not a round trip. Connection the session was bound to, e.g. of test transaction, is used as it is.
+    """
+    if db_session.info.get('autocommit') and isinstance(db_session.bind, Engine):
+        connection.connection.connection.autocommit = True
+
+
+@event.listens_for(Pool, 'checkin')
+def end_autocommit(dbapi_connection, connection_record):
+    # Next session using the connection is transactional unless it asks for autocommit too
+    if dbapi_connection is not None and dbapi_connection.autocommit:
+        dbapi_connection.autocommit = False
@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, unique
 
 
 class BaseEnum(Enum):
@@ -21,3 +21,20 @@ class BaseEnum(Enum):
             (list): Contains all available values for the enum
         """
         return [status.value for status in cls]
+
+    @classmethod
+    def names(cls):
+        """
+        Get table mapping values to names, e.g. for response projections
+
+        Returns:
+            (dict): Name of every value
+        """
+        return {status.value: status.name for status in cls}
+
+
+@unique
+class SearchTermType(BaseEnum):
+    ID = 0
+    EMAIL = 1
+    TEXT = 2
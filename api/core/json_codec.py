@@ -0,0 +1,78 @@
+"""
+JSON codec used to parse request bodies and to encode responses and errors.
+
+The first installed library listed in `settings.JSON['codecs']` is used, standard library is the fallback.
+All codecs encode to UTF-8 bytes and accept non-string keys, e.g. item indexes of bulk validation errors.
+"""
+import json
+
+import settings
+
+
+class StdlibCodec:
+    name = 'json'
+
+    def dumps(self, obj):
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+
+        self.orjson = orjson
+
+    def dumps(self, obj):
+        return self.orjson.dumps(obj, option=self.orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data):
+        return self.orjson.loads(data)
+
+
+class UjsonCodec:
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+
+        self.ujson = ujson
+
+    def dumps(self, obj):
+        return self.ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode('utf-8')
+
+    def loads(self, data):
+        return self.ujson.loads(data)
+
+
+CODECS = {
+    'orjson': OrjsonCodec,
+    'ujson': UjsonCodec,
+    'json': StdlibCodec,
+}
+
+
+def get_codec(names):
+    """
+    Create codec of the first installed library.
+
+    Args:
+        names (tuple): Codec names in order of preference, keys of CODECS
+
+    Returns:
+        Codec instance, StdlibCodec when none of the libraries is installed
+    """
+    for name in names:
+        try:
+            return CODECS[name]()
+        except ImportError:
+            continue
+
+    return StdlibCodec()
+
+
+codec = get_codec(settings.JSON['codecs'])
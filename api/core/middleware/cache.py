@@ -0,0 +1,95 @@
+import falcon
+
+import settings
+from core.cache import get_generations, response_cache
+from core.utils import is_not_modified
+
+
+class CachingStream:
+    """
+    Response stream which caches the body when the server has sent all of it.
+    """
+
+    def __init__(self, stream, cache, key, model_generations, content_type, etag):
+        self.stream = stream
+        self.cache = cache
+        self.key = key
+        self.model_generations = model_generations
+        self.content_type = content_type
+        self.etag = etag
+
+    def __iter__(self):
+        chunks = []
+        for chunk in self.stream:
+            chunks.append(chunk)
+            yield chunk
+
+        self.cache.set(self.key, self.model_generations, (self.content_type, self.etag, b''.join(chunks)))
+
+    def close(self):
+        if hasattr(self.stream, 'close'):
+            self.stream.close()
+
+
+class ResponseCacheMiddleware:
+    """
+    Serve GET requests of resources declaring `cache_models` from cache, see core.cache.
+
+    Resources list all models their responses are built from, e.g. users of organisation detail. Generations of
+    the models are read through DB session of the request, cached response is served after that single query.
+    """
+
+    def __init__(self, cache=response_cache):
+        self.cache = cache
+
+    def process_resource(self, req, resp, resource, params):
+        models = getattr(resource, 'cache_models', None)
+        if req.method != 'GET' or not models or not settings.RESPONSE_CACHE['enabled']:
+            return
+
+        key = self.get_key(req, resource, params)
+        # Generations are taken before data are loaded, response built from data changed meanwhile is never served
+        model_generations = get_generations(req.context.db_session, models)
+        cached = self.cache.get(key, model_generations)
+        if cached is not None:
+            content_type, etag, data = cached
+            resp.etag = etag
+            if etag and is_not_modified(req, etag):
+                resp.status = falcon.HTTP_304
+            else:
+                resp.content_type, resp.data = content_type, data
+            resp.complete = True
+            return
+
+        req.context.response_cache = key, model_generations
+
+    def process_response(self, req, resp, resource, req_succeeded):
+        if not req_succeeded or resp.status != falcon.HTTP_200 or 'response_cache' not in req.context:
+            return
+
+        key, model_generations = req.context.response_cache
+        # Tag is stored without quotes, as resources set it
+        etag = resp.etag.strip('"') if resp.etag else None
+        if resp.stream is not None:
+            resp.stream = CachingStream(resp.stream, self.cache, key, model_generations, resp.content_type, etag)
+        else:
+            self.cache.set(key, model_generations, (resp.content_type, etag, resp.data))
+
+    @staticmethod
+    def get_key(req, resource, params):
+        """
+        Build cache key of request.
+
+        Args:
+            req (falcon.request.Request): Request object
+            resource: Resource handling the request
+            params (dict): URI template field values, e.g. object_id
+
+        Returns:
+            (tuple): Resource, API version, object ID and query parameters in order of their names
+        """
+        query = tuple(sorted(
+            (name, tuple(value) if isinstance(value, list) else value) for name, value in req.params.items()
+        ))
+
+        return resource.__class__, req.context.get('api_version'), params.get('object_id'), query
@@ -0,0 +1,65 @@
+import falcon
+
+import settings
+from core.compression import encodings, negotiate_encoding
+
+
+class CompressingStream:
+    """
+    Response stream which compresses chunks of another stream while the server sends them.
+    """
+
+    def __init__(self, stream, compressor):
+        self.stream = stream
+        self.compressor = compressor
+
+    def __iter__(self):
+        for chunk in self.stream:
+            compressed = self.compressor.compress(chunk)
+            if compressed:
+                yield compressed
+
+        yield self.compressor.flush()
+
+    def close(self):
+        if hasattr(self.stream, 'close'):
+            self.stream.close()
+
+
+class CompressionMiddleware:
+    """
+    Compress response bodies in encoding negotiated by Accept-Encoding header, see core.compression.
+
+    Bodies smaller than `settings.COMPRESSION['min_size']` are sent as they are, streamed bodies are compressed
+    chunk by chunk as they are sent. The middleware is the first one, so it compresses responses served from cache
+    too and cached bodies are not compressed.
+    """
+
+    def __init__(self, encodings=encodings):
+        self.encodings = encodings
+
+    def process_response(self, req, resp, resource, req_succeeded):
+        if not settings.COMPRESSION['enabled'] or req.method == 'HEAD' or resp.status in (
+            falcon.HTTP_204, falcon.HTTP_304
+        ) or resp.get_header('Content-Encoding'):
+            return
+
+        resp.append_header('Vary', 'Accept-Encoding')
+        encoding = negotiate_encoding(req.get_header('Accept-Encoding'), self.encodings)
+        if encoding is None:
+            return
+
+        if resp.stream is not None:
+            resp.stream = CompressingStream(resp.stream, encoding.compressor())
+        else:
+            data = resp.body.encode('utf-8') if isinstance(resp.body, str) else resp.body or resp.data
+            if data is None or len(data) < settings.COMPRESSION['min_size']:
+                return
+
+            resp.body = None
+            resp.data = encoding.compress(data)
+
+        resp.set_header('Content-Encoding', encoding.name)
+        if resp.etag and not resp.etag.startswith('W/'):
+            # Compressed body is another representation, its tag is equal to the uncompressed one only weakly
+            resp.etag = f'W/{resp.etag}'
@@ -0,0 +1,31 @@
+import falcon
+
+from core.utils import build_etag, is_not_modified
+
+
+class ConditionalGetMiddleware:
+    """
+    Set ETag of instance details and answer GET request with 304 Not Modified when client already has them.
+
+    Resources of single instance declare its model in `etag_model`. The tag is derived from version of the
+    instance (see `Base.get_version`), the instance is not loaded to answer 304. Collections tag their pages
+    themselves, see `BaseSortingAPI.get_tagged_objects`.
+    """
+
+    def process_resource(self, req, resp, resource, params):
+        model = getattr(resource, 'etag_model', None)
+        object_id = params.get('object_id')
+        if req.method != 'GET' or model is None or not (object_id and object_id.isascii() and object_id.isdigit()):
+            # Invalid ID is reported by the resource
+            return
+
+        version = model.get_version(req.context.db_session, object_id)
+        if version is None:
+            # Missing instance is reported by the resource
+            return
+
+        etag = build_etag(req.context.get('api_version'), model.__tablename__, *version)
+        resp.etag = etag
+        if is_not_modified(req, etag):
+            resp.status = falcon.HTTP_304
+            resp.complete = True
@@ -1,7 +1,35 @@
+import settings
+
+
+class SessionClosingStream:
+    """
+    Response stream which closes DB session when the server has sent it, objects of streamed responses
+    are loaded through the session after the responder returned.
+    """
+
+    def __init__(self, stream, db_session):
+        self.stream = stream
+        self.db_session = db_session
+
+    def __iter__(self):
+        return iter(self.stream)
+
+    def close(self):
+        if hasattr(self.stream, 'close'):
+            self.stream.close()
+
+        self.db_session.close()
+
+
 class SQLAlchemySessionManager:
     """
     Create a session for every request and close it when the request ends.
+
+    Sessions of safe methods run statements in autocommit mode, so reads do not pay BEGIN and ROLLBACK round trips,
+    see core.db.session. Every statement of READ COMMITTED transaction reads its own snapshot anyway, reads see
+    the same data. Connection is checked out of the pool on the first query, requests without queries do not use any.
     """
+    safe_methods = ('GET', 'HEAD')
 
     def __init__(self, Session):
         self.db_session = Session
@@ -10,7 +38,11 @@ class SQLAlchemySessionManager:
         if req.method == 'OPTIONS':
             return
 
-        req.context['db_session'] = self.db_session()
+        db_session = self.db_session()
+        if req.method in self.safe_methods and settings.SQLALCHEMY['autocommit_reads']:
+            db_session.info['autocommit'] = True
+
+        req.context['db_session'] = db_session
 
     def process_response(self, req, resp, resource, req_succeeded):
         if req.method == 'OPTIONS':
@@ -19,4 +51,8 @@ class SQLAlchemySessionManager:
         if hasattr(req.context, 'db_session'):
             if not req_succeeded:
                 req.context.db_session.rollback()
-            req.context.db_session.close()
+
+            if req_succeeded and resp.stream is not None:
+                resp.stream = SessionClosingStream(resp.stream, req.context.db_session)
+            else:
+                req.context.db_session.close()
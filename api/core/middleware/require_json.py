@@ -1,7 +1,11 @@
 import falcon
 
+from core.utils import parse_media_type
+
 
 class RequireJSON:
+    # Media types of request bodies accepted unless resource declares its own `content_types`
+    content_types = ('application/json',)
 
     def process_request(self, req, resp):
         if not req.client_accepts_json:
@@ -10,7 +14,14 @@ class RequireJSON:
                 href='http://docs.examples.com/api/json'
             )
 
-        if req.method in ('POST', 'PUT') and not req.content_type or 'application/json' not in req.content_type:
+    def process_resource(self, req, resp, resource, params):
+        if req.method not in ('POST', 'PUT'):
+            return
+
+        content_types = getattr(resource, 'content_types', self.content_types)
+        # Parameters, e.g. charset, do not matter, media type has to match exactly
+        req.context.media_type = parse_media_type(req.content_type)
+        if req.context.media_type not in content_types:
             raise falcon.HTTPUnsupportedMediaType(
                 'This API only supports requests encoded as JSON.',
                 href='http://docs.examples.com/api/json'
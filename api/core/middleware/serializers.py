@@ -1,8 +1,8 @@
 import falcon
-import json
 from marshmallow import ValidationError
 
 from core.errors import HTTPError
+from core.json_codec import codec
 
 
 class SerializerMiddleware:
@@ -13,8 +13,10 @@ class SerializerMiddleware:
             return
         else:
             req_data = req.stream.read(req.content_length)
+            # Validators query the database through the session of the request
+            context = {'db_session': getattr(req.context, 'db_session', None)}
 
             try:
-                req.context.serializer = serializer().load(data=json.loads(req_data))
+                req.context.serializer = serializer(context=context).load(data=codec.loads(req_data))
             except ValidationError as err:
                 raise HTTPError(status=falcon.HTTP_422, errors=err.messages)
@@ -0,0 +1,90 @@
+"""
+Response projections, conversions of model instances to response dicts compiled once when module is imported.
+
+They replace `Base.convert_object_to_dict`, which looks up every key of every row with `hasattr` and `getattr`.
+Projections read only columns listed in their `columns` attribute, so they convert rows selected by column
+queries (see `BaseSortingAPI.get_objects`) as well as model instances.
+"""
+import string
+
+
+def compile_projection(keys, **translated):
+    """
+    Compile function converting model instance to dict with given keys.
+
+    Source of the function is generated the same way as `collections.namedtuple` or `dataclasses` do it,
+    so attributes are read directly as in hand written code. Translated values (e.g. names of enum values)
+    are looked up in precomputed tables instead of calling properties, values computed by model properties
+    are built from format template of their columns, e.g. '{first_name} {last_name}'.
+
+    Args:
+        keys (tuple): Response keys, they are also names of read attributes unless they are translated
+        **translated: Maps response key to tuple of attribute name and dict translating its values, or to
+            format template of attributes
+
+    Returns:
+        (function): Projection taking model instance and returning response dict, its `keys` attribute
+            contains response keys and `columns` attribute names of read attributes
+
+    Raises:
+        (ValueError): Key or attribute is not a valid identifier
+    """
+    namespace = {}
+    items = []
+    columns = []
+    for index, key in enumerate(keys):
+        if not key.isidentifier():
+            raise ValueError(f'Invalid projection key {key}')
+
+        source = translated.get(key, (key, None))
+        if isinstance(source, str):
+            template, attributes = compile_template(source)
+            items.append(f'{key!r}: {template}')
+            columns.extend(attributes)
+            continue
+
+        attribute, table = source
+        if not attribute.isidentifier():
+            raise ValueError(f'Invalid projection key {key}')
+
+        columns.append(attribute)
+        if table is None:
+            items.append(f'{key!r}: instance.{attribute}')
+        else:
+            namespace[f'table_{index}'] = table
+            items.append(f'{key!r}: table_{index}[instance.{attribute}]')
+
+    projection = eval(f'lambda instance: {{{", ".join(items)}}}', namespace)
+    projection.keys = tuple(keys)
+    projection.columns = tuple(dict.fromkeys(columns))
+
+    return projection
+
+
+def compile_template(template):
+    """
+    Compile format template into f-string expression reading attributes of `instance`.
+
+    Args:
+        template (str): Format template with plain attribute names as fields, e.g. '{first_name} {last_name}'
+
+    Returns:
+        (tuple): Source of f-string expression, names of read attributes
+
+    Raises:
+        (ValueError): Field is not a plain attribute name
+    """
+    parts = []
+    attributes = []
+    for literal, field, format_spec, conversion in string.Formatter().parse(template):
+        parts.append(literal.replace('{', '{{').replace('}', '}}'))
+        if field is None:
+            continue
+
+        if not field.isidentifier() or format_spec or conversion:
+            raise ValueError(f'Invalid projection template {template}')
+
+        attributes.append(field)
+        parts.append(f'{{instance.{field}}}')
+
+    return f'f{"".join(parts)!r}', attributes
@@ -1,11 +1,47 @@
-from marshmallow import fields, validate, validates_schema, Schema
+# Imported first, otherwise the submodule would shadow `marshmallow.fields` in this namespace
+from core.serializers.fields import Cursor
+from marshmallow import fields, pre_load, validate, validates_schema, Schema
 from marshmallow.exceptions import ValidationError
 
+from core.validators import validate_db_checks, validate_db_checks_many
+
 
 class BaseSchema(Schema):
+    # Maps field names to database checks (e.g. core.validators.InstanceExists) resolved in one query
+    db_checks = {}
+
     class Meta:
         strict = True
 
+    @property
+    def db_session(self):
+        """
+        DB Session of the request passed in schema context by SerializerMiddleware, None outside of requests.
+        """
+        return self.context.get('db_session')
+
+    @validates_schema(pass_many=True, skip_on_field_errors=False)
+    def check_db_fields(self, data, many, **kwargs):
+        """
+        Run database checks of all valid fields at once, lists of items are checked with one query per field.
+
+        Args:
+            data (dict): Serialized data passed in the request
+            many (bool): Data is a list of items
+        """
+        if many:
+            validate_db_checks_many(data, self.db_checks, db_session=self.db_session)
+            return
+
+        validate_db_checks(
+            {
+                field: (check, data[field])
+                for field, check in self.db_checks.items()
+                if data.get(field) is not None
+            },
+            db_session=self.db_session
+        )
+
 
 class StrictSchema(BaseSchema):
 
@@ -23,15 +59,51 @@ class StrictSchema(BaseSchema):
             raise ValidationError('Unknown field', list(unknown))
 
 
+class BaseBulkSchema(BaseSchema):
+    """
+    Schema of a list of items created at once, every item is validated by fields of the schema.
+    """
+    max_items = 10000
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, many=True, **kwargs)
+
+    @pre_load(pass_many=True)
+    def check_items_number(self, data, many, **kwargs):
+        """
+        Reject too long lists before their items are validated
+
+        Args:
+            data (list): Raw input data passed in the request
+        """
+        if isinstance(data, list) and len(data) > self.max_items:
+            raise ValidationError(f'Longer than maximum length {self.max_items}.')
+
+        return data
+
+
 class BaseSearchSortGetRequestSchema(BaseSchema):
     search = fields.List(
         fields.String(),
         required=False,
         missing=[]
     )
+    search_mode = fields.Str(
+        missing='pattern',
+        required=False,
+        validate=validate.OneOf(('pattern', 'fulltext'))
+    )
     sorting = fields.Str(required=False)
 
 
+class BaseExportRequestSchema(BaseSchema):
+    format = fields.Str(
+        missing='ndjson',
+        required=False,
+        validate=validate.OneOf(('ndjson', 'csv'))
+    )
+
+
 class BasePaginatedRequestSchema(BaseSchema):
     size = fields.Int(
         missing=10,
@@ -43,3 +115,13 @@ class BasePaginatedRequestSchema(BaseSchema):
         required=False,
         validate=validate.Range(min=0)
     )
+    pagination = fields.Str(
+        missing='offset',
+        required=False,
+        validate=validate.OneOf(('offset', 'cursor'))
+    )
+    cursor = Cursor(required=False)
+    count = fields.Str(
+        required=False,
+        validate=validate.OneOf(('exact', 'estimate', 'capped'))
+    )
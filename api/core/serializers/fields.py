@@ -1,5 +1,7 @@
 from marshmallow import fields, utils
 
+from core.utils import decode_cursor
+
 
 class Date(fields.Date):
 
@@ -13,3 +15,36 @@ class Date(fields.Date):
             return utils.from_iso_date(value, use_dateutil=False)
         except (AttributeError, TypeError, ValueError):
             self.fail('invalid')
+
+
+class Cursor(fields.String):
+    """
+    Opaque keyset pagination cursor, see `core.utils.encode_cursor`.
+    """
+    default_error_messages = {'invalid': 'Not a valid cursor.'}
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        """
+        Deserialize cursor string into list of sorting, last seen sort key and ID.
+
+        Cursors are not signed, so types of decoded values are checked before they reach the seek filter.
+        """
+        value = super()._deserialize(value, attr, data, **kwargs)
+        try:
+            values = decode_cursor(value)
+        except ValueError:
+            raise self.make_error('invalid')
+
+        if len(values) != 3:
+            raise self.make_error('invalid')
+
+        sorting, key, last_id = values
+        if sorting is not None and not isinstance(sorting, str):
+            raise self.make_error('invalid')
+        # bool is a subclass of int, but JSON true is not a valid sort key or ID
+        if key is not None and (isinstance(key, bool) or not isinstance(key, (str, int, float))):
+            raise self.make_error('invalid')
+        if isinstance(last_id, bool) or not isinstance(last_id, int):
+            raise self.make_error('invalid')
+
+        return values
@@ -0,0 +1,36 @@
+import json
+from functools import partial
+from unittest import TestCase
+
+from falcon.media import JSONHandler
+
+from users.v2.api import UserCollectionResourceV2
+
+
+class EncodeResponseTestCase(TestCase):
+    def setUp(self):
+        self.resource = UserCollectionResourceV2()
+        self.resource.stream_batch_size = 2
+
+    def encode(self, handler, response):
+        serialize = partial(handler.serialize, content_type='application/json')
+
+        return b''.join(self.resource.encode_response(serialize, dict(response, data=iter(response['data']))))
+
+    def test_same_body_as_media(self):
+        handler = JSONHandler()
+        responses = (
+            {'total': 0, 'data': []},
+            {'total': 1, 'next_cursor': None, 'data': [{'id': 1, 'name': 'Hans Grüber'}]},
+            {'total': 5, 'total_is_estimate': True, 'data': [{'id': i} for i in range(5)]},
+        )
+
+        for response in responses:
+            with self.subTest(response=response):
+                self.assertEqual(self.encode(handler, response), handler.serialize(response, 'application/json'))
+
+    def test_compact_handler(self):
+        handler = JSONHandler(dumps=partial(json.dumps, separators=(',', ':')))
+        response = {'total': 3, 'data': [{'id': i} for i in range(3)]}
+
+        self.assertEqual(self.encode(handler, response), b'{"total":3,"data":[{"id":0},{"id":1},{"id":2}]}')
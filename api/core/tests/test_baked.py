@@ -0,0 +1,102 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from sqlalchemy.orm import Query
+
+from core.db.baked import describe_clauses
+from core.tests.base import BaseDBTestCase
+from organisations.models import Organisation
+from users.models import User
+from users.v2.api import UserCollectionResourceV2
+
+
+class DescribeClausesTestCase(TestCase):
+    def describe(self, search, sorting=None):
+        resource = UserCollectionResourceV2()
+        filters, sorting = resource.build_filters({'search': search, 'sorting': sorting})
+
+        return describe_clauses((filters, resource.get_ordering(sorting)))
+
+    def test_same_shape_for_different_values(self):
+        for first, second in (
+            (['Hans'], ['John']),
+            (['hans@example.com'], ['john@example.com']),
+            (['12'], ['15']),
+            (['Hans', '12'], ['John', '15']),
+        ):
+            with self.subTest(first=first, second=second):
+                first_shape, first_values, _ = self.describe(first)
+                second_shape, second_values, _ = self.describe(second)
+
+                self.assertEqual(first_shape, second_shape)
+                self.assertNotEqual(first_values, second_values)
+
+    def test_different_shape_for_different_structure(self):
+        shapes = [
+            self.describe(['Hans'])[0],
+            self.describe(['hans@example.com'])[0],
+            self.describe(['12'])[0],
+            self.describe(['123'])[0],
+            self.describe(['012'])[0],
+            self.describe(['Hans', 'John'])[0],
+            self.describe(['Hans'], sorting='first_name')[0],
+            self.describe(['Hans'], sorting='-first_name')[0],
+            self.describe(['Hans'], sorting='last_name')[0],
+        ]
+
+        self.assertEqual(len(set(shapes)), len(shapes))
+
+    def test_shared_parameter_has_one_name(self):
+        resource = UserCollectionResourceV2()
+        filters, sorting = resource.build_filters({'search': ['hans'], 'search_mode': 'fulltext'})
+
+        _, values, _ = describe_clauses((filters, resource.get_ordering(sorting)))
+
+        self.assertEqual(sorted(values.values()), ["'hans':*", 'simple'])
+
+
+class BakedQueryTestCase(BaseDBTestCase):
+    def setUp(self):
+        super().setUp()
+        organisation = Organisation.create(db_session=self.db_session, name='Die Hard')
+        for first_name in ('John', 'Hans', 'Holly'):
+            User.create(
+                db_session=self.db_session,
+                first_name=first_name,
+                last_name='McClane',
+                email=f'{first_name.lower()}@example.com',
+                organisation_id=organisation.id
+            )
+        self.db_session.expunge_all()
+        self.resource = UserCollectionResourceV2()
+
+    @staticmethod
+    def count_compilations():
+        return patch.object(Query, '_compile_context', autospec=True, side_effect=Query._compile_context)
+
+    def get_names(self, params):
+        objects, meta = self.resource.get_objects(self.db_session, dict(params, page=0, size=10))
+
+        # Ordering differs between search modes
+        return sorted(user.first_name for user in objects), meta['total']
+
+    def test_query_built_once_per_shape(self):
+        for params in ({'count': 'exact'}, {'count': 'capped'}, {'pagination': 'cursor'}, {'search_mode': 'fulltext'}):
+            with self.subTest(params=params):
+                self.assertEqual(self.get_names(dict(params, search=['Hans'])), (['Hans'], 1))
+
+                with self.count_compilations() as compile_context:
+                    self.assertEqual(self.get_names(dict(params, search=['Holly'])), (['Holly'], 1))
+                    self.assertEqual(self.get_names(dict(params, search=['McClane'])), (['Hans', 'Holly', 'John'], 3))
+
+                self.assertEqual(compile_context.call_count, 0)
+
+    def test_get_by_id_built_once(self):
+        user_ids = [user.id for user in self.db_session.query(User)]
+        self.db_session.expunge_all()
+        User.get_by_id(self.db_session, 0)
+
+        with self.count_compilations() as compile_context:
+            self.assertEqual([User.get_by_id(self.db_session, user_id).id for user_id in user_ids], user_ids)
+
+        self.assertEqual(compile_context.call_count, 0)
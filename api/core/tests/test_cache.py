@@ -0,0 +1,173 @@
+import multiprocessing
+from unittest import TestCase
+from unittest.mock import patch
+
+from falcon import HTTP_201, HTTP_204, HTTP_304, HTTP_404
+
+from core.cache import Cache, get_generations, mark_changed, response_cache
+from core.db.session import session_manager
+from imports.models import Import
+from organisations.models import Organisation
+from users.models import User
+from users.tests.test_api import BaseUserTestCase
+
+
+class CacheTestCase(TestCase):
+    def test_least_recently_used_evicted(self):
+        cache = Cache(size=2, ttl=10)
+        for key in ('a', 'b'):
+            cache.set(key, (1,), key)
+
+        self.assertEqual(cache.get('a', (1,)), 'a')
+        cache.set('c', (1,), 'c')
+
+        self.assertEqual([cache.get(key, (1,)) for key in ('a', 'b', 'c')], ['a', None, 'c'])
+
+    def test_expired(self):
+        cache = Cache(size=2, ttl=10)
+        with patch('core.cache.time.monotonic', return_value=100):
+            cache.set('a', (1,), 'a')
+
+        with patch('core.cache.time.monotonic', return_value=109):
+            self.assertEqual(cache.get('a', (1,)), 'a')
+
+        with patch('core.cache.time.monotonic', return_value=111):
+            self.assertIsNone(cache.get('a', (1,)))
+
+    def test_changed_model_not_served(self):
+        cache = Cache(size=2, ttl=10)
+        cache.set('a', (1, 1), 'a')
+
+        self.assertIsNone(cache.get('a', (1, 2)))
+        # Entry of old generations is dropped
+        self.assertIsNone(cache.get('a', (1, 1)))
+
+
+def commit_change(*models):
+    """
+    Commit change of given models in a new session, run by another process.
+    """
+    with session_manager() as db_session:
+        mark_changed(db_session, *models)
+
+
+class GenerationsTestCase(BaseUserTestCase):
+    def get_generations(self, *models):
+        return get_generations(self.db_session, models)
+
+    def test_bumped_once_in_writing_transaction(self):
+        generations = self.get_generations(Organisation, User)
+
+        organisation = self.create_organisation()
+        self.assertEqual(self.get_generations(Organisation, User), (generations[0] + 1, generations[1]))
+
+        # Bump is a statement of the transaction writing the change
+        User.create(self.db_session, commit=False, organisation_id=organisation.id, email='john@example.com')
+        self.assertEqual(self.get_generations(Organisation, User), (generations[0] + 1, generations[1] + 1))
+
+        User.create(self.db_session, commit=False, organisation_id=organisation.id, email='jane@example.com')
+        self.db_session.commit()
+        self.assertEqual(self.get_generations(Organisation, User), (generations[0] + 1, generations[1] + 1))
+
+    def test_not_bumped_when_transaction_rolls_back(self):
+        generations = self.get_generations(Organisation)
+
+        Organisation.create(self.db_session, commit=False, name='Die Hard')
+        # Bump is rolled back together with the change
+        self.db_session.rollback()
+        self.db_session.commit()
+
+        self.assertEqual(self.get_generations(Organisation), generations)
+
+    def test_related_model_bumped(self):
+        organisation = self.create_organisation()
+        self.create_user(organisation.id)
+        generations = self.get_generations(User)
+
+        # Users of deleted organisation are detached from it
+        Organisation.delete_by_id(self.db_session, organisation.id)
+
+        self.assertEqual(self.get_generations(User), (generations[0] + 1,))
+
+    def test_bumped_by_another_process(self):
+        cache = Cache(size=2, ttl=10)
+        cache.set('a', self.get_generations(Import), 'a')
+        self.assertEqual(cache.get('a', self.get_generations(Import)), 'a')
+
+        # Change is committed by another worker process outside of test transaction
+        process = multiprocessing.get_context('spawn').Process(target=commit_change, args=(Import,))
+        process.start()
+        process.join(timeout=30)
+
+        self.assertEqual(process.exitcode, 0)
+        self.assertIsNone(cache.get('a', self.get_generations(Import)))
+
+
+class ResponseCacheApiTestCase(BaseUserTestCase):
+    def setUp(self):
+        super().setUp()
+        self.organisation = self.create_organisation()
+        self.user = self.create_user(self.organisation.id)
+
+    def test_collection_served_from_cache(self):
+        response = self.request_get('/v2/users', params={'size': 10, 'page': 0})
+
+        with patch('users.v2.api.UserCollectionResourceV2.get_objects', side_effect=AssertionError('Not cached')):
+            # Order of query parameters does not matter
+            cached = self.request_get('/v2/users', params={'page': 0, 'size': 10})
+
+        self.assertEqual(cached.json, response.json)
+        self.assertEqual(cached.headers['content-type'], 'application/json')
+
+    def test_detail_served_from_cache(self):
+        path = f'/v2/users/{self.user.id}'
+        response = self.request_get(path)
+
+        with patch.object(User, 'get_version', side_effect=AssertionError('Not cached')):
+            cached = self.request_get(path)
+            not_modified = self.request_get(path, status=HTTP_304, headers={'If-None-Match': response.headers['etag']})
+
+        self.assertEqual((cached.json, cached.headers['etag']), (response.json, response.headers['etag']))
+        self.assertEqual((not_modified.content, not_modified.headers['etag']), (b'', response.headers['etag']))
+
+    def test_versions_cached_separately(self):
+        v1, v2 = self.request_get('/v1/users').json, self.request_get('/v2/users').json
+
+        self.assertEqual((self.request_get('/v1/users').json, self.request_get('/v2/users').json), (v1, v2))
+        self.assertNotEqual(v1, v2)
+
+    def test_collection_not_served_after_create(self):
+        self.request_get('/v2/users')
+
+        self.request_post('/v2/users', status=HTTP_201, body={
+            'first_name': 'Holly',
+            'last_name': 'Gennero',
+            'email': 'holly@example.com',
+            'organisation_id': self.organisation.id,
+        })
+
+        self.assertEqual(self.request_get('/v2/users').json['total'], 2)
+
+    def test_detail_not_served_after_update_of_related_model(self):
+        path = f'/v2/users/{self.user.id}'
+        self.request_get(path)
+
+        self.request_patch(f'/v2/organisations/{self.organisation.id}', status=HTTP_204, body={
+            'name': 'Nakatomi', 'status': 0
+        })
+
+        self.assertEqual(self.request_get(path).json['organisation'], 'Nakatomi')
+
+    def test_detail_not_served_after_delete(self):
+        path = f'/v2/organisations/{self.organisation.id}'
+        self.assertEqual(len(self.request_get(path).json['users']), 1)
+
+        self.request_delete(f'/v2/users/{self.user.id}')
+
+        self.assertEqual(self.request_get(path).json['users'], [])
+        self.request_get(f'/v2/users/{self.user.id}', status=HTTP_404)
+
+    def test_error_not_cached(self):
+        self.request_get(f'/v2/users/{self.user.id + 1}', status=HTTP_404)
+
+        self.assertEqual(response_cache.entries, {})
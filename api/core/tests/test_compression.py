@@ -0,0 +1,134 @@
+import gzip
+import json
+from unittest import TestCase
+from unittest.mock import patch
+
+from falcon import HTTP_304
+
+import settings
+from core.compression import GzipEncoding, get_encodings, negotiate_encoding
+from users.tests.test_api import BaseUserTestCase
+
+
+# Page of all users is larger than threshold of compressed bodies
+PARAMS = {'size': 20}
+
+
+class NegotiateEncodingTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.br, self.gzip = object(), object()
+        self.encodings = {'br': self.br, 'gzip': self.gzip}
+
+    def test_negotiate_encoding(self):
+        cases = (
+            (None, None),
+            ('', None),
+            ('gzip', 'gzip'),
+            ('gzip, deflate, br', 'br'),
+            ('br;q=0.5, gzip', 'gzip'),
+            ('GZIP;Q=0.8', 'gzip'),
+            ('*', 'br'),
+            ('*, br;q=0', 'gzip'),
+            ('gzip;q=0, br;q=0', None),
+            ('gzip;q=invalid', None),
+            ('deflate', None),
+            ('identity, gzip;q=0.5', None),
+        )
+        names = {None: None, 'br': self.br, 'gzip': self.gzip}
+
+        for header, expected in cases:
+            with self.subTest(header=header):
+                self.assertIs(negotiate_encoding(header, self.encodings), names[expected])
+
+    def test_missing_library_skipped(self):
+        with patch.dict('sys.modules', {'brotli': None}):
+            encodings = get_encodings(('br', 'gzip'), {'br': 4, 'gzip': 6})
+
+        self.assertEqual(list(encodings), ['gzip'])
+
+    def test_streamed_gzip_equals_whole(self):
+        encoding = GzipEncoding(6)
+        data = b'{"id": 1, "name": "John McClane"}\n' * 1000
+
+        compressor = encoding.compressor()
+        streamed = b''.join([compressor.compress(data[:100]), compressor.compress(data[100:]), compressor.flush()])
+
+        self.assertEqual(gzip.decompress(streamed), data)
+        self.assertEqual(gzip.decompress(encoding.compress(data)), data)
+
+
+class CompressionApiTestCase(BaseUserTestCase):
+    def setUp(self):
+        super().setUp()
+        organisation = self.create_organisation()
+        self.users = [
+            self.create_user(organisation.id, first_name=f'John{i}', email=f'john{i}@example.com') for i in range(20)
+        ]
+
+    def test_collection_compressed(self):
+        plain = self.request_get('/v2/users', params=PARAMS, headers={'Accept-Encoding': 'identity'})
+        compressed = self.request_get('/v2/users', params=PARAMS, headers={'Accept-Encoding': 'gzip, deflate'})
+
+        self.assertNotIn('content-encoding', plain.headers)
+        self.assertEqual(compressed.headers['content-encoding'], 'gzip')
+        self.assertEqual(compressed.headers['vary'], 'Accept-Encoding')
+        self.assertEqual(int(compressed.headers['content-length']), len(compressed.content))
+        self.assertLess(len(compressed.content), len(plain.content))
+        self.assertEqual(json.loads(gzip.decompress(compressed.content)), plain.json)
+
+    def test_brotli_preferred(self):
+        try:
+            import brotli
+        except ImportError:
+            self.skipTest('brotli is not installed')
+
+        plain = self.request_get('/v2/users', params=PARAMS, headers={'Accept-Encoding': 'identity'})
+        compressed = self.request_get('/v2/users', params=PARAMS, headers={'Accept-Encoding': 'gzip, br'})
+
+        self.assertEqual(compressed.headers['content-encoding'], 'br')
+        self.assertEqual(json.loads(brotli.decompress(compressed.content)), plain.json)
+
+    def test_small_body_not_compressed(self):
+        response = self.request_get(f'/v2/users/{self.users[0].id}', headers={'Accept-Encoding': 'gzip'})
+
+        self.assertNotIn('content-encoding', response.headers)
+        self.assertEqual(response.headers['vary'], 'Accept-Encoding')
+        self.assertEqual(response.json['id'], self.users[0].id)
+
+    def test_export_stream_compressed(self):
+        plain = self.request_get('/v2/users/export', headers={'Accept-Encoding': 'identity'})
+        compressed = self.request_get('/v2/users/export', headers={'Accept-Encoding': 'gzip'})
+
+        self.assertEqual(compressed.headers['content-encoding'], 'gzip')
+        self.assertNotIn('content-length', compressed.headers)
+        self.assertEqual(gzip.decompress(compressed.content), plain.content)
+
+    def test_cached_response_compressed_per_request(self):
+        compressed = self.request_get('/v2/users', params=PARAMS, headers={'Accept-Encoding': 'gzip'})
+        cached = self.request_get('/v2/users', params=PARAMS, headers={'Accept-Encoding': 'identity'})
+        cached_compressed = self.request_get('/v2/users', params=PARAMS, headers={'Accept-Encoding': 'gzip'})
+
+        # Page is streamed when it is not cached, cached body is compressed at once
+        self.assertNotIn('content-length', compressed.headers)
+        self.assertEqual(int(cached_compressed.headers['content-length']), len(cached_compressed.content))
+        self.assertEqual(gzip.decompress(cached_compressed.content), gzip.decompress(compressed.content))
+        self.assertEqual(json.loads(gzip.decompress(compressed.content)), cached.json)
+
+    def test_compressed_etag_weak(self):
+        with patch.dict(settings.RESPONSE_CACHE, enabled=False), patch.dict(settings.COUNT_CACHE, enabled=False):
+            plain = self.request_get('/v2/users', params=PARAMS, headers={'Accept-Encoding': 'identity'})
+            compressed = self.request_get('/v2/users', params=PARAMS, headers={'Accept-Encoding': 'gzip'})
+            not_modified = self.request_get(
+                '/v2/users', params=PARAMS, status=HTTP_304, headers={'If-None-Match': compressed.headers['etag']}
+            )
+
+        self.assertEqual(compressed.headers['etag'], f'W/{plain.headers["etag"]}')
+        self.assertEqual(not_modified.content, b'')
+
+    def test_disabled(self):
+        with patch.dict(settings.COMPRESSION, enabled=False):
+            response = self.request_get('/v2/users', params=PARAMS, headers={'Accept-Encoding': 'gzip'})
+
+        self.assertNotIn('content-encoding', response.headers)
+        self.assertEqual(len(response.json['data']), 20)
@@ -0,0 +1,69 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from falcon import Request, testing
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_INTRANS
+from sqlalchemy import create_engine
+
+import settings
+from core.db.engine import engine
+from core.db.session import Session
+from core.middleware.db import SQLAlchemySessionManager
+
+
+class AutocommitSessionTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.engine = create_engine(engine.url, pool_size=1)
+        self.addCleanup(self.engine.dispose)
+        # Sessions are not bound to connection of test transaction, they check out connections of the engine
+        self.session_manager = SQLAlchemySessionManager(lambda: Session(bind=self.engine))
+
+    def start_request(self, method):
+        req = Request(testing.create_environ(method=method))
+        self.session_manager.process_resource(req, None, None, {})
+
+        return req.context.db_session
+
+    @staticmethod
+    def get_transaction_status(db_session):
+        db_session.execute('SELECT 1')
+        dbapi_connection = db_session.connection().connection.connection
+        status = dbapi_connection.get_transaction_status()
+        db_session.close()
+
+        return status, dbapi_connection
+
+    def test_read_without_transaction(self):
+        db_session = self.start_request('GET')
+        # Connection is checked out by the first query
+        self.assertEqual(self.engine.pool.checkedout(), 0)
+
+        status, dbapi_connection = self.get_transaction_status(db_session)
+
+        self.assertEqual(status, TRANSACTION_STATUS_IDLE)
+        # Pooled connection is transactional again
+        self.assertFalse(dbapi_connection.autocommit)
+        self.assertEqual(self.get_transaction_status(self.start_request('POST')), (
+            TRANSACTION_STATUS_INTRANS, dbapi_connection
+        ))
+
+    def test_write_in_transaction(self):
+        for method in ('POST', 'PATCH', 'PUT', 'DELETE'):
+            with self.subTest(method=method):
+                status, _ = self.get_transaction_status(self.start_request(method))
+                self.assertEqual(status, TRANSACTION_STATUS_INTRANS)
+
+    def test_autocommit_reads_disabled(self):
+        with patch.dict(settings.SQLALCHEMY, autocommit_reads=False):
+            status, _ = self.get_transaction_status(self.start_request('GET'))
+
+        self.assertEqual(status, TRANSACTION_STATUS_INTRANS)
+
+    def test_connection_in_transaction_used_as_is(self):
+        # Session of tests is bound to connection of test transaction
+        db_session = Session(info={'autocommit': True})
+        status, dbapi_connection = self.get_transaction_status(db_session)
+
+        self.assertEqual(status, TRANSACTION_STATUS_INTRANS)
+        self.assertFalse(dbapi_connection.autocommit)
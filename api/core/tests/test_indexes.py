@@ -0,0 +1,80 @@
+"""
+    Check that sorting and lookup queries are served by indexes
+"""
+from sqlalchemy import exists, func
+from sqlalchemy.dialects import postgresql
+
+from core.tests.base import BaseDBTestCase
+from organisations.models import Organisation
+from organisations.v1.api import OrganisationCollectionResourceV1
+from organisations.v2.api import OrganisationCollectionResourceV2
+from users.v1.api import UserCollectionResourceV1
+from users.v2.api import UserCollectionResourceV2
+
+
+RESOURCES = (
+    OrganisationCollectionResourceV1,
+    OrganisationCollectionResourceV2,
+    UserCollectionResourceV1,
+    UserCollectionResourceV2,
+)
+
+
+class IndexUsageTestCase(BaseDBTestCase):
+    def setUp(self):
+        super().setUp()
+        # Tables are almost empty in tests, make planner pick an index whenever there is one
+        self.db_session.execute('SET LOCAL enable_seqscan = off')
+        self.db_session.execute('SET LOCAL enable_sort = off')
+
+    def explain(self, query):
+        """
+        Get query plan of given ORM query.
+        """
+        statement = query.statement.compile(dialect=postgresql.dialect(), compile_kwargs={'literal_binds': True})
+
+        return '\n'.join(row[0] for row in self.db_session.execute(f'EXPLAIN {statement}'))
+
+    def assert_index_scan(self, query):
+        plan = self.explain(query)
+        self.assertIn('Index', plan)
+        self.assertNotIn('Seq Scan', plan)
+        self.assertNotIn('Sort', plan)
+
+    def test_sorting_keys_use_index(self):
+        for resource_class in RESOURCES:
+            resource = resource_class()
+            for key in (None, *resource.sorting_mapper):
+                for sorting in (key, f'-{key}' if key else None):
+                    with self.subTest(resource=resource_class.__name__, sorting=sorting):
+                        query = self.db_session.query(resource.model).order_by(*resource.get_ordering(sorting))
+                        self.assert_index_scan(resource.paginate_result(query, size=10, page=0))
+
+    def test_sorting_keys_seek_use_index(self):
+        for resource_class in RESOURCES:
+            resource = resource_class()
+            for key in resource.sorting_mapper:
+                for sorting in (key, f'-{key}'):
+                    with self.subTest(resource=resource_class.__name__, sorting=sorting):
+                        query = self.db_session.query(
+                            resource.model
+                        ).filter(
+                            resource.get_seek_filter(sorting, 'a' if key != 'id' else 1, 1)
+                        ).order_by(
+                            *resource.get_ordering(sorting)
+                        ).limit(10)
+                        self.assert_index_scan(query)
+
+    def test_unique_organisation_name_lookup_uses_index(self):
+        query = self.db_session.query(
+            exists().where(func.lower(Organisation.name) == func.lower('Die Hard'))
+        )
+        self.assert_index_scan(query)
+
+    def test_organisation_version_uses_index(self):
+        query = self.db_session.query(
+            Organisation.updated_at, Organisation.get_relationship_version('users')
+        ).filter(
+            Organisation.id == 1
+        )
+        self.assert_index_scan(query)
@@ -0,0 +1,51 @@
+import json
+import sys
+from unittest import TestCase
+from unittest.mock import patch
+
+from core.json_codec import CODECS, StdlibCodec, UjsonCodec, get_codec
+
+
+class JSONCodecTestCase(TestCase):
+    def get_codecs(self):
+        codecs = []
+        for name in CODECS:
+            try:
+                codecs.append(CODECS[name]())
+            except ImportError:
+                continue
+
+        return codecs
+
+    def test_codecs_are_compatible(self):
+        media = {
+            'total': 1,
+            'next_cursor': None,
+            'data': [{'id': 1, 'name': 'Hans Grüber', 'email': 'hans@example.com', 'state_name': 'ENABLED'}],
+            'errors': {0: {'url': ['http://example.com/ is not valid']}},
+        }
+        expected = json.loads(json.dumps(media))
+
+        for codec in self.get_codecs():
+            with self.subTest(codec=codec.name):
+                encoded = codec.dumps(media)
+
+                self.assertIsInstance(encoded, bytes)
+                self.assertDictEqual(json.loads(encoded), expected)
+                self.assertIn('Grüber'.encode(), encoded)
+                self.assertIn(b'http://example.com/', encoded)
+                self.assertDictEqual(codec.loads(encoded), expected)
+                self.assertDictEqual(codec.loads(encoded.decode()), expected)
+
+    def test_first_installed_codec_is_used(self):
+        with patch.dict(sys.modules, {'orjson': None, 'ujson': None}):
+            self.assertIsInstance(get_codec(('orjson', 'ujson')), StdlibCodec)
+            self.assertIsInstance(get_codec(('orjson', 'json')), StdlibCodec)
+
+        with patch.dict(sys.modules, {'orjson': None}):
+            try:
+                import ujson  # noqa
+            except ImportError:
+                self.skipTest('ujson is not installed')
+
+            self.assertIsInstance(get_codec(('orjson', 'ujson', 'json')), UjsonCodec)
@@ -0,0 +1,83 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, event, text
+
+import settings
+from core.db.engine import enable_prepared_statements, engine
+from core.db.session import Session
+from users.models import User
+
+
+class PreparedStatementsTestCase(TestCase):
+    def setUp(self):
+        self.engine = create_engine(engine.url, pool_size=1)
+        enable_prepared_statements(self.engine)
+        self.addCleanup(self.engine.dispose)
+
+        self.statements = []
+        event.listen(self.engine, 'after_cursor_execute', self.collect_statement)
+
+    def collect_statement(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @staticmethod
+    def get_prepared(connection):
+        return [name for name, in connection.execute('SELECT name FROM pg_prepared_statements ORDER BY name')]
+
+    def get_user(self, user_id):
+        with self.engine.connect() as connection:
+            db_session = Session(bind=connection)
+            user = User.get_by_id(db_session, user_id)
+            db_session.close()
+
+            return user, self.get_prepared(connection)
+
+    def test_statement_prepared_once(self):
+        user, [name] = self.get_user(0)
+        self.assertIsNone(user)
+        self.assertEqual(self.get_user(-1), (None, [name]))
+
+        self.assertEqual(
+            [statement for statement in self.statements if 'FROM users' in statement or 'EXECUTE' in statement],
+            [f'EXECUTE {name} (%(param_1)s)', f'EXECUTE {name} (%(param_1)s)']
+        )
+
+    def test_statement_which_can_not_be_prepared(self):
+        statement = text('SELECT CAST(:value AS text) = :value').execution_options(prepare=True)
+
+        with self.engine.connect() as connection:
+            transaction = connection.begin()
+            with patch('core.db.engine.PARAMETER') as parameter:
+                # Prepared statement gets invalid SQL
+                parameter.sub.return_value = 'SELECT FROM'
+                self.assertTrue(connection.execute(statement, value='1').scalar())
+
+            self.assertTrue(connection.execute(statement, value='1').scalar())
+            self.assertEqual(self.get_prepared(connection), [])
+            transaction.rollback()
+
+    def test_statements_deallocated_after_migration(self):
+        _, [name] = self.get_user(0)
+
+        with engine.connect() as connection, patch.dict(settings.PREPARED_STATEMENTS, schema_check_interval=0):
+            revision = connection.execute('SELECT version_num FROM alembic_version').scalar()
+            connection.execute("UPDATE alembic_version SET version_num = 'next'")
+            try:
+                _, [new_name] = self.get_user(0)
+                self.assertNotEqual(new_name, name)
+                self.assertEqual(self.engine.pool.checkedin(), 1)
+            finally:
+                connection.execute('UPDATE alembic_version SET version_num = %s', revision)
+
+        self.assertEqual(len([statement for statement in self.statements if statement.startswith('EXECUTE')]), 2)
+
+    def test_cache_size(self):
+        with self.engine.connect() as connection, patch.dict(settings.PREPARED_STATEMENTS, cache_size=2):
+            names = []
+            for value in range(3):
+                statement = text(f'SELECT {value}').execution_options(prepare=True)
+                self.assertEqual(connection.execute(statement).scalar(), value)
+                names.extend(set(self.get_prepared(connection)) - set(names))
+
+            self.assertEqual(set(self.get_prepared(connection)), set(names[1:]))
@@ -0,0 +1,43 @@
+from unittest import TestCase
+
+from core.projections import compile_projection
+from organisations.enums import OrganisationStatus
+from organisations.models import Organisation
+from organisations.projections import organisation_detail_v1, organisation_detail_v2, organisation_v1, organisation_v2
+from users.enums import UserState
+from users.models import User
+from users.projections import user_v1, user_v2
+
+
+class ProjectionTestCase(TestCase):
+    def test_same_result_as_convert_object_to_dict(self):
+        users = [
+            User(id=i, first_name='John', last_name='McClane', email='john@example.com', state=state)
+            for i, state in enumerate(UserState.values())
+        ] + [User(id=-1, first_name=None, last_name='{Gruber}', email='hans@example.com', state=0)]
+        organisations = [
+            Organisation(id=i, name='Die Hard', status=status, enable_user_login=False)
+            for i, status in enumerate(OrganisationStatus.values())
+        ]
+        projections = (
+            (user_v1, users),
+            (user_v2, users),
+            (organisation_v1, organisations),
+            (organisation_detail_v1, organisations),
+            (organisation_v2, organisations),
+            (organisation_detail_v2, organisations),
+        )
+
+        for projection, instances in projections:
+            for instance in instances:
+                with self.subTest(keys=projection.keys, id=instance.id):
+                    self.assertDictEqual(projection(instance), instance.convert_object_to_dict(projection.keys))
+
+    def test_invalid_key(self):
+        with self.assertRaises(ValueError):
+            compile_projection(('id', 'name}; import os'))
+
+    def test_invalid_template(self):
+        for template in ('{first_name.__class__}', '{first_name!r}', '{name:>10}', '{}'):
+            with self.subTest(template=template), self.assertRaises(ValueError):
+                compile_projection(('id', 'name'), name=template)
@@ -0,0 +1,21 @@
+from falcon import HTTP_200, HTTP_415
+
+from users.tests.test_api import BaseUserTestCase
+
+
+class RequireJSONTestCase(BaseUserTestCase):
+    def test_get_without_content_type(self):
+        response = self.simulate_get('/v2/users', headers={'Accept': 'application/json'})
+
+        self.assertEqual(response.status, HTTP_200)
+
+    def test_get_with_other_content_type(self):
+        self.request_get('/v2/users', headers={'Content-Type': 'text/plain'})
+
+    def test_post_without_content_type(self):
+        response = self.simulate_post('/v2/users', headers={'Accept': 'application/json'}, body='{}')
+
+        self.assertEqual(response.status, HTTP_415)
+
+    def test_post_with_other_content_type(self):
+        self.request_post('/v2/users', body={}, status=HTTP_415, headers={'Content-Type': 'text/plain'})
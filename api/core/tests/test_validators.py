@@ -0,0 +1,50 @@
+import pytest
+from marshmallow import ValidationError
+from sqlalchemy import event
+
+from core.tests.base import BaseDBTestCase
+from core.validators import InstanceExists, validate_db_checks
+from organisations.models import Organisation
+from users.models import User
+
+
+class ValidateDBChecksTestCase(BaseDBTestCase):
+    def setUp(self):
+        super().setUp()
+        self.organisation = Organisation.create(db_session=self.db_session, name='Die Hard')
+
+        self.statements = []
+        connection = self.db_session.connection()
+        event.listen(connection, 'before_cursor_execute', self.count_statement)
+        self.addCleanup(event.remove, connection, 'before_cursor_execute', self.count_statement)
+
+    def count_statement(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def test_all_checks_in_one_query(self):
+        with pytest.raises(ValidationError) as err:
+            validate_db_checks(
+                {
+                    'organisation_id': (InstanceExists(Organisation), self.organisation.id),
+                    'user_id': (InstanceExists(User), 0),
+                    'manager_id': (InstanceExists(User), -1),
+                },
+                db_session=self.db_session
+            )
+
+        self.assertEqual(len(self.statements), 1)
+        self.assertDictEqual(
+            err.value.messages,
+            {
+                'user_id': ['User with given ID (0) does not exist'],
+                'manager_id': ['User with given ID (-1) does not exist'],
+            }
+        )
+
+    def test_valid_checks(self):
+        validate_db_checks(
+            {'organisation_id': (InstanceExists(Organisation), self.organisation.id)},
+            db_session=self.db_session
+        )
+
+        self.assertEqual(len(self.statements), 1)
@@ -1,5 +1,10 @@
+import hashlib
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from math import isnan
 
+from core.enums import SearchTermType
+
 
 def api_version_to_float(version):
     """
@@ -23,3 +28,124 @@ def api_version_to_float(version):
         return None
 
     return result
+
+
+def encode_cursor(values):
+    """
+    Encode keyset pagination values into an opaque, URL safe cursor.
+
+    Args:
+        values (list): JSON serializable values identifying the last returned row
+
+    Returns:
+        (str): Opaque cursor
+    """
+    data = json.dumps(values, separators=(',', ':')).encode()
+    return urlsafe_b64encode(data).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Decode cursor created by `encode_cursor`.
+
+    Args:
+        cursor (str): Opaque cursor
+
+    Returns:
+        (list): Values identifying the last returned row
+
+    Raises:
+        (ValueError): Cursor is malformed
+    """
+    try:
+        values = json.loads(urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (TypeError, ValueError) as err:
+        raise ValueError('Malformed cursor') from err
+
+    if not isinstance(values, list):
+        raise ValueError('Malformed cursor')
+
+    return values
+
+
+def parse_media_type(content_type):
+    """
+    Get media type of Content-Type header without its parameters.
+
+    Args:
+        content_type (str): Header value, e.g. `text/csv; charset=utf-8`, None when client did not send it
+
+    Returns:
+        (str): Lower case media type, e.g. `text/csv`, None when header is missing or empty
+    """
+    if not content_type:
+        return None
+
+    return content_type.split(';', 1)[0].strip().lower() or None
+
+
+def get_search_term_type(search_term):
+    """
+    Classify search term, so it is compared only with columns it can match.
+
+    Args:
+        search_term (str): Stripped search term
+
+    Returns:
+        (SearchTermType): ID for ASCII numbers, EMAIL for terms containing "@" and TEXT for everything else
+    """
+    # str.isdigit accepts also digits of other scripts and superscripts, e.g. "²", which int() rejects
+    if search_term.isascii() and search_term.isdigit():
+        return SearchTermType.ID
+
+    if '@' in search_term:
+        return SearchTermType.EMAIL
+
+    return SearchTermType.TEXT
+
+
+def build_prefix_tsquery(search_terms):
+    """
+    Compile search terms into text of a single tsquery, every word of every term has to match as a prefix.
+
+    Args:
+        search_terms (list): Search terms
+
+    Returns:
+        (str): tsquery text, e.g. 'john':* & 'mccl':*, or None if there are no words to search for
+    """
+    words = [word for search_term in search_terms for word in search_term.split()]
+    if not words:
+        return None
+
+    return ' & '.join(
+        "'{}':*".format(word.replace('\\', '\\\\').replace("'", "''")) for word in words
+    )
+
+
+def build_etag(*parts):
+    """
+    Build strong entity tag of response from values the response is built from.
+
+    Args:
+        *parts: Values with stable repr, e.g. API version and update times of objects
+
+    Returns:
+        (str): Entity tag without quotes
+    """
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+def is_not_modified(req, etag):
+    """
+    Check if client already has response with given entity tag.
+
+    Args:
+        req (falcon.request.Request): Request object
+        etag (str): Entity tag of the response
+
+    Returns:
+        (bool): True if `If-None-Match` header lists the tag or `*`
+    """
+    # If-None-Match uses weak comparison, weak tags of the same value match too
+    return any(tag == '*' or tag == etag for tag in req.if_none_match or ())
@@ -3,6 +3,7 @@ import sqlalchemy
 
 from marshmallow import ValidationError
 
+from core.db.baked import bake_query
 from core.db.session import session_manager
 
 
@@ -25,21 +26,201 @@ def validate_object_id(req, resp, resource, params, model_class):
         raise falcon.HTTPBadRequest(f'Invalid {model_class.__name__} ID')
 
 
-def validate_instance_of_model_exists_by_id(model, instance_id):
+class InstanceExists:
     """
-    Validates if instance of given model with provided ID exists.
+    Database check that instance of given model with provided ID exists.
+
+    Checks are resolved by `validate_db_checks`, all checks of a request are sent in one query.
+    """
+
+    def __init__(self, model):
+        self.model = model
+
+    def clause(self, instance_id):
+        """
+        Build expression which is true when the value is valid.
+
+        Args:
+            instance_id: Instance ID or bound parameter
+
+        Returns:
+            (sqlalchemy.sql.selectable.Exists): Check expression
+        """
+        return sqlalchemy.exists().where(self.model.id == instance_id)
+
+    def error(self, instance_id):
+        """
+        Build error message for invalid value.
+
+        Args:
+            instance_id (int): Instance ID
+
+        Returns:
+            (str): Error message
+        """
+        return f'{self.model.__name__} with given ID ({instance_id}) does not exist'
+
+    def find_invalid(self, db_session, instance_ids):
+        """
+        Find values which fail the check with one query for all of them.
+
+        Args:
+            db_session (Session): DB Session object
+            instance_ids (set): Instance IDs
+
+        Returns:
+            (set): IDs of instances which do not exist
+        """
+        existing = {
+            instance_id for instance_id, in db_session.query(self.model.id).filter(self.model.id.in_(instance_ids))
+        }
+
+        return set(instance_ids) - existing
+
+
+class UniqueCaseInsensitive:
+    """
+    Database check that no instance has the same value in given column, letter case is ignored.
+
+    Values are compared in lower case so the check is served by unique index on lower(column).
+    """
+    # Values repeated in one request are reported as well
+    unique = True
+
+    def __init__(self, column, message):
+        self.column = column
+        self.message = message
+
+    def clause(self, value):
+        """
+        Build expression which is true when the value is valid.
+
+        Args:
+            value: Checked value or bound parameter
+
+        Returns:
+            (sqlalchemy.sql.elements.UnaryExpression): Check expression
+        """
+        return ~sqlalchemy.exists().where(sqlalchemy.func.lower(self.column) == sqlalchemy.func.lower(value))
+
+    def error(self, value):
+        """
+        Build error message for invalid value.
+
+        Args:
+            value (str): Checked value
+
+        Returns:
+            (str): Error message
+        """
+        return self.message.format(value)
+
+    def find_invalid(self, db_session, values):
+        """
+        Find values which fail the check with one query for all of them.
+
+        Args:
+            db_session (Session): DB Session object
+            values (set): Checked values
+
+        Returns:
+            (set): Values already used by existing instances
+        """
+        existing = {
+            value.lower() for value, in db_session.query(self.column).filter(
+                sqlalchemy.func.lower(self.column).in_({value.lower() for value in values})
+            )
+        }
+
+        return {value for value in values if value.lower() in existing}
+
+    @staticmethod
+    def key(value):
+        """
+        Get value used to find duplicates within one request.
+        """
+        return value.lower()
+
+
+def validate_db_checks(checks, db_session=None):
+    """
+    Resolve database checks of several fields with one SELECT of EXISTS subqueries.
+
+    The query is built and compiled once per combination of checks, values are sent as its parameters.
 
     Args:
-        model (class): Model class
-        instance_id (int): Instance ID
+        checks (dict): Maps field names to tuple of check (e.g. InstanceExists) and value
+        db_session (Session): DB Session object of the request, new session is opened when not provided
 
     Raises:
-        (ValidationError): Instance with provided ID of given model does not exist
+        (ValidationError): Messages of failed checks by field name
     """
-    with session_manager() as db_session:
-        exists = db_session.query(
-            sqlalchemy.exists().where(model.id == instance_id)
-        ).scalar()
+    if not checks:
+        return
+
+    if db_session is None:
+        with session_manager() as db_session:
+            return validate_db_checks(checks, db_session)
+
+    fields = tuple((field, check) for field, (check, _) in checks.items())
+    results = bake_query(
+        db_session,
+        lambda session: session.query(*[check.clause(sqlalchemy.bindparam(field)) for field, check in fields]),
+        key=(fields,),
+        **{field: value for field, (_, value) in checks.items()}
+    ).one()
+
+    errors = {
+        field: [check.error(value)]
+        for (field, (check, value)), valid in zip(checks.items(), results)
+        if not valid
+    }
+    if errors:
+        raise ValidationError(errors)
+
+
+def validate_db_checks_many(items, checks, db_session=None):
+    """
+    Resolve database checks of a list of items, every check runs one query for values of all items.
+
+    Args:
+        items (list): Serialized items
+        checks (dict): Maps field names to check, e.g. InstanceExists
+        db_session (Session): DB Session object of the request, new session is opened when not provided
+
+    Raises:
+        (ValidationError): Messages of failed checks by item index and field name
+    """
+    if not checks or not items:
+        return
+
+    if db_session is None:
+        with session_manager() as db_session:
+            return validate_db_checks_many(items, checks, db_session)
+
+    errors = {}
+    for field, check in checks.items():
+        values = {item[field] for item in items if item.get(field) is not None}
+        if not values:
+            continue
+
+        invalid = check.find_invalid(db_session, values)
+        seen = set()
+        for index, item in enumerate(items):
+            value = item.get(field)
+            if value is None:
+                continue
+
+            if getattr(check, 'unique', False):
+                # Only the first occurrence of a value within the request may be created
+                key = check.key(value)
+                duplicated = key in seen
+                seen.add(key)
+            else:
+                duplicated = False
+
+            if duplicated or value in invalid:
+                errors.setdefault(index, {})[field] = [check.error(value)]
 
-        if not exists:
-            raise ValidationError(f'{model.__name__} with given ID ({instance_id}) does not exist')
+    if errors:
+        raise ValidationError(errors)
@@ -0,0 +1,19 @@
+"""
+Gunicorn configuration.
+
+    gunicorn --config gunicorn.conf.py app:app
+"""
+
+
+def on_starting(server):
+    # Imports loaded by threads of previous workers were lost with them
+    from core.db.engine import engine
+    from imports.jobs import fail_interrupted_imports
+    # Relationships of user model are resolved once all models are imported, the app is not loaded in master
+    import organisations.models  # noqa: F401
+
+    failed = fail_interrupted_imports()
+    if failed:
+        server.log.warning('Marked %s interrupted imports as failed', failed)
+    # Workers must not inherit connections of the master
+    engine.dispose()
@@ -0,0 +1,63 @@
+import falcon
+
+from core.hooks import get_instance
+from core.validators import validate_object_id
+from imports.jobs import IMPORT_FORMATS
+from imports.models import Import
+from imports.v2.api import ImportResourceV2, UserImportResourceV2
+
+
+class UserImportResourceProxy:
+    """
+    UserImportResource proxy. Imports are available since version 2
+    """
+    content_types = tuple(IMPORT_FORMATS)
+
+    def on_post(self, req, resp):
+        """
+        Post proxy
+
+        Args:
+            req (falcon.request.Request): Request object
+            resp (falcon.response.Response): Response object
+
+        Raises:
+            (HTTPNotFound): Version 1 does not support imports
+        """
+        version = req.context['version']
+        if version == 1:
+            raise falcon.HTTPNotFound()
+
+        elif version == 2:
+            controller = UserImportResourceV2()
+
+        controller.on_post(req, resp)
+
+
+@falcon.before(validate_object_id, Import)
+@falcon.before(get_instance, Import)
+class ImportResourceProxy:
+    """
+    ImportResource proxy. Imports are available since version 2
+    """
+
+    def on_get(self, req, resp, object_id):
+        """
+        Get Proxy
+
+        Args:
+            req (falcon.request.Request): Request object
+            resp (falcon.response.Response): Response object
+            object_id: (int): Object instance ID
+
+        Returns:
+            (falcon.response.Response): Import progress and result
+        """
+        version = req.context['version']
+        if version == 1:
+            raise falcon.HTTPNotFound()
+
+        elif version == 2:
+            controller = ImportResourceV2()
+
+        controller.on_get(req, resp, object_id)
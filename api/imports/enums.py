@@ -0,0 +1,19 @@
+from enum import unique
+
+from core.enums import BaseEnum
+
+
+@unique
+class ImportStatus(BaseEnum):
+    PENDING = 0
+    LOADING = 1
+    VALIDATING = 2
+    MERGING = 3
+    COMPLETED = 4
+    FAILED = 5
+
+
+@unique
+class ImportFormat(BaseEnum):
+    CSV = 0
+    NDJSON = 1
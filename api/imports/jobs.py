@@ -0,0 +1,396 @@
+"""
+Background loading of user imports.
+
+Request only spools uploaded file to disk. Worker thread streams the file into temporary staging table with
+COPY, validates all rows with set-based statements and merges valid rows into users, memory use does not
+depend on file size.
+"""
+import csv
+import glob
+import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import psycopg2
+from sqlalchemy import text
+
+import settings
+from core.cache import mark_changed
+from core.db.session import session_manager
+from imports.enums import ImportFormat, ImportStatus
+from imports.models import Import
+from users.enums import UserState
+from users.models import User
+
+
+logger = logging.getLogger(__name__)
+
+executor = ThreadPoolExecutor(max_workers=settings.IMPORTS['workers'], thread_name_prefix='imports')
+
+# Spooled files are named by this prefix, files left by stopped server are found by it
+SPOOL_PREFIX = 'import-'
+# Statuses of imports which are still running
+UNFINISHED_STATUSES = (ImportStatus.PENDING, ImportStatus.LOADING, ImportStatus.VALIDATING, ImportStatus.MERGING)
+
+# Media types of accepted files
+IMPORT_FORMATS = {
+    'text/csv': ImportFormat.CSV,
+    'application/x-ndjson': ImportFormat.NDJSON,
+}
+USER_FIELDS = ('first_name', 'last_name', 'email', 'organisation_id')
+
+VALIDATE_USERS = r"""
+UPDATE {table} AS staging
+SET errors = checked.errors
+FROM (
+    SELECT row_no, jsonb_strip_nulls(jsonb_build_object(
+        'first_name', CASE
+            WHEN coalesce(first_name, '') = '' THEN jsonb_build_array(:missing)
+            WHEN length(first_name) > 128 THEN jsonb_build_array(:too_long)
+        END,
+        'last_name', CASE
+            WHEN coalesce(last_name, '') = '' THEN jsonb_build_array(:missing)
+            WHEN length(last_name) > 128 THEN jsonb_build_array(:too_long)
+        END,
+        'email', CASE
+            WHEN coalesce(email, '') = '' THEN jsonb_build_array(:missing)
+            WHEN length(email) > 128 THEN jsonb_build_array(:too_long)
+            WHEN email !~ '^[^@\s]+@[^@\s]+\.[^@\s]+$' THEN jsonb_build_array(:invalid_email)
+            WHEN email_no > 1 OR EXISTS (SELECT 1 FROM users WHERE lower(users.email) = lower(rows.email))
+                THEN jsonb_build_array('User email ' || email || ' already exists')
+        END,
+        'organisation_id', CASE
+            WHEN coalesce(organisation_id, '') = '' THEN jsonb_build_array(:missing)
+            WHEN organisation_id !~ '^\s*\d{{1,9}}\s*$' THEN jsonb_build_array(:invalid_integer)
+            WHEN NOT EXISTS (SELECT 1 FROM organisations WHERE organisations.id = rows.organisation_id::integer)
+                THEN jsonb_build_array(
+                    'Organisation with given ID (' || btrim(organisation_id) || ') does not exist'
+                )
+        END
+    )) AS errors
+    FROM (
+        -- Only the first occurrence of an email within the file may be imported
+        SELECT *, row_number() OVER (PARTITION BY lower(email) ORDER BY row_no) AS email_no
+        FROM {table}
+    ) AS rows
+) AS checked
+WHERE checked.row_no = staging.row_no AND checked.errors <> '{{}}'
+"""
+
+# Emails committed by other transactions after validation conflict at merge, their rows are rejected as well
+MERGE_USERS = """
+WITH merged AS (
+    INSERT INTO users (first_name, last_name, email, organisation_id, state, created_at)
+    SELECT first_name, last_name, email, organisation_id::integer, :state, :created_at
+    FROM {table}
+    WHERE errors IS NULL
+    ORDER BY row_no
+    ON CONFLICT ((lower(email))) DO NOTHING
+    RETURNING lower(email) AS email
+), conflicted AS (
+    UPDATE {table} AS staging
+    SET errors = jsonb_build_object('email', jsonb_build_array('User email ' || staging.email || ' already exists'))
+    WHERE staging.errors IS NULL AND NOT EXISTS (SELECT 1 FROM merged WHERE merged.email = lower(staging.email))
+)
+SELECT count(*) FROM merged
+"""
+
+
+class InvalidImportFile(Exception):
+    """
+    File can not be imported at all, e.g. CSV header does not match user fields.
+    """
+
+
+class ImportTooLarge(Exception):
+    """
+    Uploaded file is larger than `settings.IMPORTS['max_size']`.
+    """
+
+
+class ProgressFile:
+    """
+    File wrapper which stores number of bytes read by COPY in the import from time to time.
+    """
+
+    def __init__(self, file, import_id):
+        self.file = file
+        self.import_id = import_id
+        self.bytes_loaded = self.bytes_reported = file.tell()
+
+    def read(self, size=-1):
+        data = self.file.read(size)
+        self.bytes_loaded += len(data)
+
+        if self.bytes_loaded - self.bytes_reported >= settings.IMPORTS['progress_interval']:
+            update_import(self.import_id, bytes_loaded=self.bytes_loaded)
+            self.bytes_reported = self.bytes_loaded
+
+        return data
+
+
+def spool(stream, max_size):
+    """
+    Save request body to temporary file chunk by chunk.
+
+    Args:
+        stream: Request body stream, e.g. falcon.request.Request.bounded_stream
+        max_size (int): Maximum size of the file in bytes
+
+    Returns:
+        (tuple): Path of the file, its size in bytes
+
+    Raises:
+        (ImportTooLarge): Body is larger than `max_size`, the file is removed
+    """
+    file = tempfile.NamedTemporaryFile(prefix=SPOOL_PREFIX, dir=settings.IMPORTS['spool_dir'], delete=False)
+    try:
+        with file:
+            chunk = stream.read(settings.IMPORTS['chunk_size'])
+            while chunk:
+                if file.tell() + len(chunk) > max_size:
+                    raise ImportTooLarge(f'Import file must not be larger than {max_size} bytes')
+                file.write(chunk)
+                chunk = stream.read(settings.IMPORTS['chunk_size'])
+
+            return file.name, file.tell()
+    except BaseException:
+        os.remove(file.name)
+        raise
+
+
+def fail_interrupted_imports():
+    """
+    Mark imports which were running when the server stopped as failed and remove their spooled files.
+
+    Imports are loaded by threads of worker processes, they are lost when the processes stop. Gunicorn master
+    calls this before it starts workers (see gunicorn.conf.py), so no import is running meanwhile.
+
+    Returns:
+        (int): Number of failed imports
+    """
+    with session_manager() as db_session:
+        failed = db_session.query(Import).filter(
+            Import.status.in_([status.value for status in UNFINISHED_STATUSES])
+        ).update(
+            {
+                'status': ImportStatus.FAILED.value,
+                'error': 'Import was interrupted by restart of the server',
+                'finished_at': datetime.utcnow(),
+            },
+            synchronize_session=False
+        )
+
+    spool_dir = settings.IMPORTS['spool_dir'] or tempfile.gettempdir()
+    for path in glob.glob(os.path.join(spool_dir, f'{SPOOL_PREFIX}*')):
+        os.remove(path)
+
+    return failed
+
+
+def start_import(import_id, path, import_format):
+    """
+    Schedule load of spooled file in background.
+
+    Args:
+        import_id (int): Import ID
+        path (str): Path of spooled file, it is removed when the load ends
+        import_format (ImportFormat): File format
+    """
+    executor.submit(run_import, import_id, path, import_format)
+
+
+def update_import(import_id, **values):
+    """
+    Update import in its own transaction, so progress is visible while the load is running.
+
+    Args:
+        import_id (int): Import ID
+        **values: New values of import columns
+    """
+    with session_manager() as db_session:
+        db_session.query(Import).filter(Import.id == import_id).update(values, synchronize_session=False)
+
+
+def run_import(import_id, path, import_format):
+    """
+    Load spooled file into users, failure of any statement leaves users untouched.
+
+    Args:
+        import_id (int): Import ID
+        path (str): Path of spooled file
+        import_format (ImportFormat): File format
+    """
+    try:
+        fields = read_csv_header(path) if import_format == ImportFormat.CSV else None
+
+        with session_manager() as db_session:
+            load_users(db_session, import_id, path, fields)
+    except Exception as err:  # noqa
+        if not isinstance(err, InvalidImportFile):
+            logger.exception('Import %s failed', import_id)
+
+        update_import(
+            import_id,
+            status=ImportStatus.FAILED.value,
+            error=describe_error(err),
+            finished_at=datetime.utcnow()
+        )
+    finally:
+        os.remove(path)
+
+
+def read_csv_header(path):
+    """
+    Read names of fields from the first line of CSV file.
+
+    Args:
+        path (str): Path of the file
+
+    Returns:
+        (list): Field names in order of CSV columns
+
+    Raises:
+        (InvalidImportFile): Header does not contain exactly the user fields
+    """
+    with open(path, encoding='utf-8-sig', newline='') as file:
+        fields = [name.strip() for name in next(csv.reader([file.readline()]), [])]
+
+    if len(fields) != len(USER_FIELDS) or set(fields) != set(USER_FIELDS):
+        raise InvalidImportFile(f'CSV header must contain columns {", ".join(USER_FIELDS)}')
+
+    return fields
+
+
+def load_users(db_session, import_id, path, fields=None):
+    """
+    Copy file into staging table, validate its rows and merge valid ones into users.
+
+    Args:
+        db_session (Session): DB Session object
+        import_id (int): Import ID
+        path (str): Path of spooled file
+        fields (list): Field names of CSV columns, None for NDJSON file
+    """
+    table = f'import_rows_{import_id}'
+    db_session.execute(
+        f'CREATE TEMP TABLE {table} ('
+        'row_no bigserial, first_name text, last_name text, email text, organisation_id text, errors jsonb'
+        ') ON COMMIT DROP'
+    )
+    update_import(import_id, status=ImportStatus.LOADING.value)
+
+    cursor = db_session.connection().connection.cursor()
+    with open(path, 'rb') as file:
+        if fields:
+            file.readline()
+            cursor.copy_expert(
+                f'COPY {table} ({", ".join(fields)}) FROM STDIN WITH (FORMAT csv)',
+                ProgressFile(file, import_id),
+                size=settings.IMPORTS['chunk_size']
+            )
+            rows_total = cursor.rowcount
+        else:
+            rows_total = copy_ndjson(db_session, cursor, table, ProgressFile(file, import_id))
+
+        bytes_loaded = file.tell()
+
+    update_import(
+        import_id,
+        status=ImportStatus.VALIDATING.value,
+        bytes_loaded=bytes_loaded,
+        rows_total=rows_total
+    )
+    db_session.execute(f'ANALYZE {table}')
+    db_session.execute(
+        text(VALIDATE_USERS.format(table=table)),
+        {
+            'missing': 'Missing data for required field.',
+            'too_long': 'Longer than maximum length 128.',
+            'invalid_email': 'Not a valid email address.',
+            'invalid_integer': 'Not a valid integer.',
+        }
+    )
+
+    update_import(import_id, status=ImportStatus.MERGING.value)
+    # Users are merged by plain SQL, generation of users is bumped in the same transaction, see core.cache
+    mark_changed(db_session, User)
+    rows_imported = db_session.execute(
+        text(MERGE_USERS.format(table=table)),
+        {'state': UserState.ENABLED.value, 'created_at': datetime.utcnow()}
+    ).scalar()
+    rejected = db_session.execute(
+        text(
+            f'SELECT jsonb_agg(jsonb_build_object(\'row\', row_no, \'errors\', errors) ORDER BY row_no) '
+            f'FROM (SELECT row_no, errors FROM {table} WHERE errors IS NOT NULL ORDER BY row_no LIMIT :limit) AS rows'
+        ),
+        {'limit': settings.IMPORTS['rejected_limit']}
+    ).scalar()
+
+    # Result is committed together with merged users
+    db_session.query(Import).filter(Import.id == import_id).update(
+        {
+            'status': ImportStatus.COMPLETED.value,
+            'rows_imported': rows_imported,
+            'rows_rejected': rows_total - rows_imported,
+            'rejected': rejected or [],
+            'finished_at': datetime.utcnow(),
+        },
+        synchronize_session=False
+    )
+
+
+def copy_ndjson(db_session, cursor, table, file):
+    """
+    Copy NDJSON lines into staging table.
+
+    Lines are copied as they are into another temporary table and parsed by PostgreSQL. Characters which never
+    appear in JSON text are used as CSV quote and delimiter, so COPY does not interpret the lines.
+
+    Args:
+        db_session (Session): DB Session object
+        cursor (psycopg2.extensions.cursor): Cursor of the session connection
+        table (str): Name of staging table
+        file: File object
+
+    Returns:
+        (int): Number of copied rows
+    """
+    lines = f'{table}_lines'
+    db_session.execute(f'CREATE TEMP TABLE {lines} (row_no bigserial, line text) ON COMMIT DROP')
+    cursor.copy_expert(
+        f"COPY {lines} (line) FROM STDIN WITH (FORMAT csv, QUOTE E'\\x01', DELIMITER E'\\x02')",
+        file,
+        size=settings.IMPORTS['chunk_size']
+    )
+
+    return db_session.execute(
+        f"""
+        INSERT INTO {table} (row_no, {", ".join(USER_FIELDS)})
+        SELECT row_no, {", ".join(f"document ->> '{field}'" for field in USER_FIELDS)}
+        FROM (SELECT row_no, line::jsonb AS document FROM {lines} WHERE btrim(line) <> '') AS documents
+        """
+    ).rowcount
+
+
+def describe_error(err):
+    """
+    Build error message of failed import, unexpected errors are not described to the client.
+
+    Args:
+        err (Exception): Error which stopped the import
+
+    Returns:
+        (str): Error message
+    """
+    if isinstance(err, InvalidImportFile):
+        return str(err)
+
+    # SQLAlchemy wraps errors of statements it executed, COPY errors come directly from psycopg2
+    err = getattr(err, 'orig', err)
+    if isinstance(err, psycopg2.DataError):
+        return err.diag.message_primary
+
+    return 'Import failed because of unexpected error'
@@ -0,0 +1,42 @@
+from sqlalchemy import BigInteger, Column, DateTime, Integer, Text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from core.db.base import Base
+from imports.enums import ImportFormat, ImportStatus
+
+
+class Import(Base):
+    __tablename__ = 'imports'
+
+    status = Column(Integer, nullable=False, default=ImportStatus.PENDING.value)
+    format = Column(Integer, nullable=False)
+    bytes_total = Column(BigInteger, nullable=False, default=0)
+    bytes_loaded = Column(BigInteger, nullable=False, default=0)
+    rows_total = Column(Integer)
+    rows_imported = Column(Integer)
+    rows_rejected = Column(Integer)
+    # First rejected rows with their errors, the rest is only counted
+    rejected = Column(JSONB)
+    # Reason why the whole import failed
+    error = Column(Text)
+    finished_at = Column(DateTime)
+
+    @property
+    def status_name(self):
+        """
+        Map status to name.
+
+        Returns:
+            (str) status name
+        """
+        return ImportStatus.get_name_by_value(self.status)
+
+    @property
+    def format_name(self):
+        """
+        Map format to name.
+
+        Returns:
+            (str) format name
+        """
+        return ImportFormat.get_name_by_value(self.format)
@@ -0,0 +1,180 @@
+import json
+
+import pytest
+
+from unittest.mock import ANY, patch
+
+from falcon import HTTP_202, HTTP_404, HTTP_413, HTTP_415, HTTP_422
+
+import settings
+from core.tests.base import BaseApiTestCase
+from imports import jobs
+from imports.enums import ImportStatus
+from organisations.models import Organisation
+from users.models import User
+
+
+PATH = '/v2/users/import'
+
+
+@pytest.mark.apiv2
+class UserImportTestCase(BaseApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.organisation = Organisation.create(db_session=self.db_session, name='Die Hard')
+        User.create(
+            db_session=self.db_session,
+            first_name='John',
+            last_name='McClane',
+            email='john@example.com',
+            organisation_id=self.organisation.id
+        )
+
+        # Load imports in the request thread, so they see data of the test transaction
+        patcher = patch('imports.jobs.executor.submit', side_effect=lambda function, *args: function(*args))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def post_import(self, body, content_type, status=HTTP_202):
+        response = self.simulate_post(
+            PATH,
+            body=body,
+            headers={'Accept': 'application/json', 'Content-Type': content_type}
+        )
+        self.assertEqual(response.status, status, response.content)
+
+        return response
+
+    def get_import(self, response):
+        return self.request_get(response.headers['location']).json
+
+    def test_import_csv(self):
+        organisation_id = self.organisation.id
+        response = self.post_import(
+            'email,first_name,last_name,organisation_id\n'
+            f'holly@example.com,Holly,Gennero,{organisation_id}\n'
+            f'"hans@example.com","Hans","Gruber, Jr.",{organisation_id}\n',
+            'text/csv; charset=utf-8'
+        )
+
+        self.assertDictEqual(
+            response.json,
+            {'id': ANY, 'status_name': 'PENDING', 'format_name': 'CSV', 'bytes_total': ANY, 'bytes_loaded': 0,
+             'rows_total': None, 'rows_imported': None, 'rows_rejected': None, 'rejected': None, 'error': None}
+        )
+        self.assertDictEqual(
+            self.get_import(response),
+            {'id': response.json['id'], 'status_name': 'COMPLETED', 'format_name': 'CSV',
+             'bytes_total': response.json['bytes_total'], 'bytes_loaded': response.json['bytes_total'],
+             'rows_total': 2, 'rows_imported': 2, 'rows_rejected': 0, 'rejected': [], 'error': None}
+        )
+        self.assertEqual(
+            [user.name for user in self.db_session.query(User).filter(User.email != 'john@example.com')],
+            ['Holly Gennero', 'Hans Gruber, Jr.']
+        )
+
+    def test_import_ndjson_rejected_rows(self):
+        organisation_id = self.organisation.id
+        rows = [
+            {
+                'first_name': 'Holly', 'last_name': 'Gennero', 'email': 'holly@example.com',
+                'organisation_id': organisation_id
+            },
+            {
+                'first_name': 'Hans', 'last_name': 'Gruber', 'email': 'JOHN@example.com',
+                'organisation_id': organisation_id
+            },
+            {'first_name': 'Karl', 'email': 'karl', 'organisation_id': 999999},
+            {'first_name': 'Theo', 'last_name': 'T', 'email': 'Holly@example.com', 'organisation_id': 'one'},
+        ]
+        response = self.post_import('\n'.join(json.dumps(row) for row in rows), 'application/x-ndjson')
+
+        result = self.get_import(response)
+        self.assertEqual(
+            (result['status_name'], result['rows_total'], result['rows_imported'], result['rows_rejected']),
+            ('COMPLETED', 4, 1, 3)
+        )
+        self.assertListEqual(
+            result['rejected'],
+            [
+                {'row': 2, 'errors': {'email': ['User email JOHN@example.com already exists']}},
+                {'row': 3, 'errors': {
+                    'last_name': ['Missing data for required field.'],
+                    'email': ['Not a valid email address.'],
+                    'organisation_id': ['Organisation with given ID (999999) does not exist'],
+                }},
+                {'row': 4, 'errors': {
+                    'email': ['User email Holly@example.com already exists'],
+                    'organisation_id': ['Not a valid integer.'],
+                }},
+            ]
+        )
+
+    def test_import_email_conflicted_at_merge(self):
+        update_import = jobs.update_import
+
+        def create_user(import_id, **values):
+            update_import(import_id, **values)
+            # Another transaction commits the email after the file was validated
+            if values.get('status') == ImportStatus.MERGING.value:
+                User.create(
+                    db_session=self.db_session, first_name='Holly', last_name='McClane', email='HOLLY@example.com',
+                    organisation_id=self.organisation.id
+                )
+
+        organisation_id = self.organisation.id
+        with patch('imports.jobs.update_import', side_effect=create_user):
+            response = self.post_import(
+                'email,first_name,last_name,organisation_id\n'
+                f'holly@example.com,Holly,Gennero,{organisation_id}\n'
+                f'hans@example.com,Hans,Gruber,{organisation_id}\n',
+                'text/csv'
+            )
+
+        result = self.get_import(response)
+        self.assertEqual(
+            (result['status_name'], result['rows_total'], result['rows_imported'], result['rows_rejected']),
+            ('COMPLETED', 2, 1, 1)
+        )
+        self.assertListEqual(
+            result['rejected'],
+            [{'row': 1, 'errors': {'email': ['User email holly@example.com already exists']}}]
+        )
+
+    def test_import_csv_invalid_header(self):
+        response = self.post_import('first_name,last_name,mail\nHolly,Gennero,holly@example.com\n', 'text/csv')
+
+        result = self.get_import(response)
+        self.assertEqual(result['status_name'], 'FAILED')
+        self.assertEqual(
+            result['error'], 'CSV header must contain columns first_name, last_name, email, organisation_id'
+        )
+
+    def test_import_empty_file(self):
+        response = self.post_import('', 'text/csv', status=HTTP_422)
+
+        self.assertDictEqual(
+            response.json,
+            {'title': '422 Unprocessable Entity', 'errors': {'_schema': ['Import file is empty.']}}
+        )
+
+    def test_import_too_large(self):
+        with patch.dict(settings.IMPORTS, max_size=10), patch('imports.v2.api.spool') as spool:
+            self.post_import('first_name,last_name', 'text/csv', status=HTTP_413)
+
+        spool.assert_not_called()
+
+    def test_import_unsupported_media_type(self):
+        for content_type in ('text/plain', 'text/csvx', 'application/x-ndjson-seq', 'application/json'):
+            with self.subTest(content_type=content_type):
+                self.post_import('first_name,last_name', content_type, status=HTTP_415)
+
+    def test_import_media_type_parameters(self):
+        response = self.post_import(
+            'first_name,last_name,email,organisation_id\n', 'Text/CSV; charset=utf-8', status=HTTP_202
+        )
+
+        self.assertEqual(self.get_import(response)['format_name'], 'CSV')
+
+    def test_get_unexisting_import(self):
+        self.request_get('/v2/imports/999999', status=HTTP_404)
@@ -0,0 +1,58 @@
+import io
+import os
+import tempfile
+from unittest.mock import patch
+
+import settings
+from core.tests.base import BaseDBTestCase
+from imports.enums import ImportFormat, ImportStatus
+from imports.jobs import ImportTooLarge, fail_interrupted_imports, spool
+from imports.models import Import
+
+
+class ImportJobsTestCase(BaseDBTestCase):
+    def setUp(self):
+        super().setUp()
+        spool_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(spool_dir.cleanup)
+        self.spool_dir = spool_dir.name
+
+        patcher = patch.dict(settings.IMPORTS, spool_dir=self.spool_dir, chunk_size=4)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_spool(self):
+        path, size = spool(io.BytesIO(b'0123456789'), max_size=10)
+
+        with open(path, 'rb') as file:
+            self.assertEqual((file.read(), size), (b'0123456789', 10))
+
+    def test_spool_too_large(self):
+        with self.assertRaises(ImportTooLarge):
+            spool(io.BytesIO(b'0123456789'), max_size=9)
+
+        self.assertEqual(os.listdir(self.spool_dir), [])
+
+    def test_fail_interrupted_imports(self):
+        imports = {
+            status: Import.create(self.db_session, status=status.value, format=ImportFormat.CSV.value)
+            for status in ImportStatus
+        }
+        spool(io.BytesIO(b'first_name'), max_size=10)
+
+        self.assertEqual(fail_interrupted_imports(), 4)
+
+        self.db_session.expire_all()
+        self.assertEqual(
+            {status: instance.status for status, instance in imports.items()},
+            {
+                ImportStatus.PENDING: ImportStatus.FAILED.value,
+                ImportStatus.LOADING: ImportStatus.FAILED.value,
+                ImportStatus.VALIDATING: ImportStatus.FAILED.value,
+                ImportStatus.MERGING: ImportStatus.FAILED.value,
+                ImportStatus.COMPLETED: ImportStatus.COMPLETED.value,
+                ImportStatus.FAILED: ImportStatus.FAILED.value,
+            }
+        )
+        self.assertEqual(imports[ImportStatus.LOADING].error, 'Import was interrupted by restart of the server')
+        self.assertEqual(os.listdir(self.spool_dir), [])
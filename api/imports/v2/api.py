@@ -0,0 +1,95 @@
+"""
+    (VERSION 2) Import endpoint resources
+"""
+import os
+
+import falcon
+
+import settings
+from core.errors import HTTPError
+from imports.jobs import IMPORT_FORMATS, ImportTooLarge, spool, start_import
+from imports.models import Import
+
+
+class UserImportResourceV2:
+    """
+    User API method to import users from CSV or NDJSON file in background.
+    """
+    content_types = tuple(IMPORT_FORMATS)
+
+    def on_post(self, req, resp):
+        """
+        Post file with users, it is loaded after the response is sent
+
+        Args:
+            req (falcon.request.Request): Request object
+            resp (falcon.response.Response): Response object
+
+        Raises:
+            (falcon.HTTPUnsupportedMediaType): Media type of uploaded file is not one of IMPORT_FORMATS
+            (falcon.HTTPPayloadTooLarge): Uploaded file is larger than `settings.IMPORTS['max_size']`
+            (HTTPError): Uploaded file is empty
+        """
+        # Media type was parsed by RequireJSON middleware
+        import_format = IMPORT_FORMATS.get(req.context.get('media_type'))
+        if import_format is None:
+            raise falcon.HTTPUnsupportedMediaType(f'Import file must be one of {", ".join(IMPORT_FORMATS)}.')
+        db_session = req.context['db_session']
+
+        max_size = settings.IMPORTS['max_size']
+        if req.content_length is not None and req.content_length > max_size:
+            raise falcon.HTTPPayloadTooLarge(f'Import file must not be larger than {max_size} bytes.')
+
+        # Chunked body has no length, its size is checked while it is spooled
+        try:
+            path, size = spool(req.bounded_stream, max_size)
+        except ImportTooLarge as err:
+            raise falcon.HTTPPayloadTooLarge(f'{err}.')
+        if not size:
+            os.remove(path)
+            raise HTTPError(status=falcon.HTTP_422, errors={'_schema': ['Import file is empty.']})
+
+        instance = Import.create(db_session, format=import_format.value, bytes_total=size)
+        start_import(instance.id, path, import_format)
+
+        resp.status = falcon.HTTP_202
+        resp.location = f'/{req.context["api_version"]}/imports/{instance.id}'
+        resp.media = ImportResourceV2.build_response(instance)
+
+
+class ImportResourceV2:
+    """
+    Import API methods to handle single instance.
+    """
+
+    def on_get(self, req, resp, object_id):
+        """
+        Get Object instance details
+
+        Args:
+            req (falcon.request.Request): Request object
+            resp (falcon.response.Response): Response object
+            object_id: (int): Object instance ID
+
+        Returns:
+            (falcon.response.Response): Import instance details
+        """
+        resp.media = self.build_response(req.context['instance'])
+
+    @staticmethod
+    def build_response(instance):
+        """
+        Create dict with import progress and result.
+
+        Args:
+            instance (Import): Import instance
+
+        Returns:
+            (dict): Import instance details
+        """
+        keys = (
+            'id', 'status_name', 'format_name', 'bytes_total', 'bytes_loaded',
+            'rows_total', 'rows_imported', 'rows_rejected', 'rejected', 'error',
+        )
+
+        return instance.convert_object_to_dict(keys)
@@ -6,17 +6,33 @@ from core.hooks import get_instance
 from core.validators import validate_object_id
 from organisations.models import Organisation
 from organisations.serializers import (
+    OrganisationBulkPostRequestSchema,
+    OrganisationExportRequestSchema,
     OrganisationGetRequestSchema,
+    OrganisationPatchRequestSchema,
+    OrganisationPostRequestSchema,
 )
 from organisations.v1.api import OrganisationCollectionResourceV1, OrganisationResourceV1
-from organisations.v2.api import OrganisationCollectionResourceV2, OrganisationResourceV2
+from organisations.v2.api import (
+    OrganisationBulkResourceV2,
+    OrganisationCollectionResourceV2,
+    OrganisationExportResourceV2,
+    OrganisationResourceV2,
+)
+from users.models import User
 
 
 class OrganisationCollectionResourceProxy:
     """
     OrganisationCollectionResource proxy.
     """
-    @use_args(OrganisationGetRequestSchema)
+    serializers = {
+        'post': OrganisationPostRequestSchema
+    }
+    # Models GET responses are built from, see core.middleware.cache
+    cache_models = (Organisation,)
+
+    @use_args(OrganisationGetRequestSchema, location="query")
     def on_get(self, req, resp, params):
         """
         Get Proxy
@@ -57,12 +73,76 @@ class OrganisationCollectionResourceProxy:
         controller.on_post(req, resp)
 
 
+class OrganisationExportResourceProxy:
+    """
+    OrganisationExportResource proxy. Export is available since version 2
+    """
+
+    @use_args(OrganisationExportRequestSchema, location="query")
+    def on_get(self, req, resp, params):
+        """
+        Get Proxy
+
+        Args:
+            req (falcon.request.Request): Request object
+            resp (falcon.response.Response): Response object
+            params (dict): Query params
+
+        Raises:
+            (HTTPNotFound): Version 1 does not support export
+        """
+        version = req.context['version']
+        if version == 1:
+            raise falcon.HTTPNotFound()
+
+        elif version == 2:
+            controller = OrganisationExportResourceV2()
+
+        controller.on_get(req, resp, params)
+
+
+class OrganisationBulkResourceProxy:
+    """
+    OrganisationBulkResource proxy. Bulk create is available since version 2
+    """
+    serializers = {
+        'post': OrganisationBulkPostRequestSchema
+    }
+
+    def on_post(self, req, resp):
+        """
+        Post proxy
+
+        Args:
+            req (falcon.request.Request): Request object
+            resp (falcon.response.Response): Response object
+
+        Raises:
+            (HTTPNotFound): Version 1 does not support bulk create
+        """
+        version = req.context['version']
+        if version == 1:
+            raise falcon.HTTPNotFound()
+
+        elif version == 2:
+            controller = OrganisationBulkResourceV2()
+
+        controller.on_post(req, resp)
+
+
 @falcon.before(validate_object_id, Organisation)
 @falcon.before(get_instance, Organisation)
 class OrganisationResourceProxy:
     """
     OrganisationResource proxy.
     """
+    serializers = {
+        'patch': OrganisationPatchRequestSchema
+    }
+    # Detail lists users of the organisation
+    cache_models = (Organisation, User)
+    # Model of the instance, its version is the ETag of details, see core.middleware.conditional
+    etag_model = Organisation
 
     def on_get(self, req, resp, object_id):
         """
@@ -1,5 +1,6 @@
-from sqlalchemy import Boolean, Column, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, Column, Index, Integer, String, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from core.db.base import Base
 from organisations.enums import OrganisationStatus
@@ -7,11 +8,24 @@ from organisations.enums import OrganisationStatus
 
 class Organisation(Base):
     __tablename__ = 'organisations'
+    __table_args__ = (
+        Index('ix_organisations_name_trgm', 'name', postgresql_using='gin',
+              postgresql_ops={'name': 'gin_trgm_ops'}),
+        Index('ix_organisations_search_vector', 'search_vector', postgresql_using='gin'),
+    )
 
     name = Column(String(128), nullable=False)
     status = Column(Integer, nullable=False, default=OrganisationStatus.ENABLED.value)
     users = relationship('User')
     enable_user_login = Column(Boolean, default=False)
+    # Maintained by database trigger from name
+    search_vector = deferred(Column(TSVECTOR))
+
+    integrity_errors = {
+        'uq_organisations_lower_name': ('name', 'Organisation name {} already exists'),
+    }
+    # Detail lists users of the organisation
+    version_relationships = ('users',)
 
     @property
     def status_name(self):
@@ -22,3 +36,8 @@ class Organisation(Base):
             (str) status name
         """
         return OrganisationStatus.get_name_by_value(self.status)
+
+
+# Expression indexes serving name sorting and case insensitive name uniqueness
+Index('ix_organisations_lower_name_id', func.lower(Organisation.name), Organisation.id)
+Index('uq_organisations_lower_name', func.lower(Organisation.name), unique=True)
@@ -0,0 +1,10 @@
+from core.projections import compile_projection
+from organisations.enums import OrganisationStatus
+
+
+STATUS_NAME = ('status', OrganisationStatus.names())
+
+organisation_v1 = compile_projection(('id', 'name'))
+organisation_detail_v1 = compile_projection(('id', 'name', 'status_name'), status_name=STATUS_NAME)
+organisation_v2 = compile_projection(('id', 'name', 'status_name'), status_name=STATUS_NAME)
+organisation_detail_v2 = compile_projection(('id', 'name', 'status_name', 'enable_user_login'), status_name=STATUS_NAME)
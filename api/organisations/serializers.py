@@ -1,15 +1,25 @@
 from marshmallow.fields import Integer, String
 from marshmallow.validate import OneOf, Length
 
-from core.serializers import BasePaginatedRequestSchema, BaseSearchSortGetRequestSchema, StrictSchema
+from core.serializers import (
+    BaseBulkSchema,
+    BaseExportRequestSchema,
+    BasePaginatedRequestSchema,
+    BaseSearchSortGetRequestSchema,
+    StrictSchema,
+)
 from organisations.enums import OrganisationStatus
-from organisations.validators import validate_unique_organisation_name
+from organisations.validators import organisation_name_unique
 
 
 class OrganisationGetRequestSchema(BaseSearchSortGetRequestSchema, BasePaginatedRequestSchema):
     pass
 
 
+class OrganisationExportRequestSchema(BaseSearchSortGetRequestSchema, BaseExportRequestSchema):
+    pass
+
+
 class OrganisationPatchRequestSchema(StrictSchema):
     name = String(
         required=True,
@@ -24,5 +34,12 @@ class OrganisationPatchRequestSchema(StrictSchema):
 class OrganisationPostRequestSchema(StrictSchema):
     name = String(
         required=True,
-        validate=[Length(max=128), validate_unique_organisation_name]
+        validate=Length(max=128)
     )
+
+
+class OrganisationBulkPostRequestSchema(BaseBulkSchema, OrganisationPostRequestSchema):
+    # Unique index can not tell which of the inserted rows is the duplicate, names are checked upfront
+    db_checks = {
+        'name': organisation_name_unique,
+    }
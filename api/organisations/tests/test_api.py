@@ -0,0 +1,118 @@
+import pytest
+
+from unittest.mock import ANY
+
+from falcon import HTTP_201, HTTP_204, HTTP_422
+
+from core.tests.base import BaseApiTestCase
+from organisations.models import Organisation
+
+
+PATH = '/v2/organisations'
+
+
+@pytest.mark.apiv2
+class OrganisationUniqueNameTestCase(BaseApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.organisation = Organisation.create(db_session=self.db_session, name='Die Hard')
+
+    def test_create_organisation(self):
+        response = self.request_post(path=PATH, status=HTTP_201, body={'name': 'Nakatomi'})
+
+        self.assertDictEqual(response.json, {'id': ANY, 'name': 'Nakatomi', 'status_name': 'ENABLED'})
+
+    def test_create_organisation_duplicate_name_error(self):
+        response = self.request_post(path=PATH, status=HTTP_422, body={'name': 'die hard'})
+
+        self.assertDictEqual(
+            response.json,
+            {'title': '422 Unprocessable Entity',
+             'errors': {'name': ['Organisation name die hard already exists']}}
+        )
+
+    def test_patch_organisation_duplicate_name_error(self):
+        organisation = Organisation.create(db_session=self.db_session, name='Nakatomi')
+
+        response = self.request_patch(
+            path=f'{PATH}/{organisation.id}',
+            status=HTTP_422,
+            body={'name': 'DIE HARD', 'status': 0}
+        )
+
+        self.assertDictEqual(
+            response.json,
+            {'title': '422 Unprocessable Entity',
+             'errors': {'name': ['Organisation name DIE HARD already exists']}}
+        )
+
+    def test_patch_organisation_same_name(self):
+        self.request_patch(
+            path=f'{PATH}/{self.organisation.id}',
+            status=HTTP_204,
+            body={'name': 'Die Hard', 'status': 0}
+        )
+
+
+@pytest.mark.apiv2
+class OrganisationSearchTestCase(BaseApiTestCase):
+    def test_search_zero(self):
+        Organisation.create(db_session=self.db_session, name='Die Hard')
+
+        for version in ('v1', 'v2'):
+            with self.subTest(version=version):
+                response = self.request_get(path=f'/{version}/organisations', params={'search': '0'})
+
+                self.assertEqual((response.json['data'], response.json['total']), ([], 0))
+
+
+@pytest.mark.apiv2
+class OrganisationBulkPostTestCase(BaseApiTestCase):
+    def test_bulk_create_organisations(self):
+        response = self.request_post(
+            path=f'{PATH}/bulk', status=HTTP_201, body=[{'name': 'Nakatomi'}, {'name': 'Pacific'}]
+        )
+
+        self.assertDictEqual(
+            response.json,
+            {'data': [
+                {'id': ANY, 'name': 'Nakatomi', 'status_name': 'ENABLED'},
+                {'id': ANY, 'name': 'Pacific', 'status_name': 'ENABLED'},
+            ]}
+        )
+
+    def test_bulk_create_organisations_duplicate_name_error(self):
+        Organisation.create(db_session=self.db_session, name='Die Hard')
+
+        response = self.request_post(
+            path=f'{PATH}/bulk',
+            status=HTTP_422,
+            body=[{'name': 'DIE HARD'}, {'name': 'Nakatomi'}, {'name': 'nakatomi'}]
+        )
+
+        self.assertDictEqual(
+            response.json,
+            {'title': '422 Unprocessable Entity',
+             'errors': {
+                 '0': {'name': ['Organisation name DIE HARD already exists']},
+                 '2': {'name': ['Organisation name nakatomi already exists']},
+             }}
+        )
+
+
+@pytest.mark.apiv2
+class OrganisationExportTestCase(BaseApiTestCase):
+    def test_export_organisations_csv(self):
+        organisations = [
+            Organisation.create(db_session=self.db_session, name=name) for name in ('Nakatomi', 'Die Hard', 'Pacific')
+        ]
+
+        response = self.request_get(f'{PATH}/export', params={'format': 'csv', 'sorting': 'name'})
+
+        self.assertEqual(
+            response.text,
+            'id,name,status_name\r\n'
+            f'{organisations[1].id},Die Hard,ENABLED\r\n'
+            f'{organisations[0].id},Nakatomi,ENABLED\r\n'
+            f'{organisations[2].id},Pacific,ENABLED\r\n'
+        )
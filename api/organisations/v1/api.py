@@ -1,11 +1,14 @@
 import falcon
 
-from sqlalchemy import cast, or_, String, func
+from sqlalchemy import func
 
 from core.api import BaseSortingAPI
+from core.enums import SearchTermType
 from core.hooks import get_instance
+from core.utils import get_search_term_type
 from core.validators import validate_object_id
 from organisations.models import Organisation
+from organisations.projections import organisation_detail_v1, organisation_v1
 from organisations.serializers import (
     OrganisationPatchRequestSchema,
     OrganisationPostRequestSchema
@@ -38,12 +41,18 @@ class OrganisationCollectionResourceV1(BaseSortingAPI):
             (dict): Organisation instance list and total number
         """
 
-        paginated_filtered_result, total_objects = self.get_objects(req.context.db_session, params)
+        page = self.get_tagged_objects(req, resp, params, projection=organisation_v1)
+        if page is None:
+            return
 
-        resp.media = self.build_response(
-            total=total_objects,
-            data=paginated_filtered_result
-        )
+        paginated_filtered_result, meta = page
+        # Version 1 responses keep their original keys, the flag is listed only by version 2
+        meta.pop('total_is_cached')
+
+        self.stream_response(resp, self.build_response(
+            data=paginated_filtered_result,
+            **meta
+        ))
 
     def on_post(self, req, resp):
         """
@@ -58,7 +67,7 @@ class OrganisationCollectionResourceV1(BaseSortingAPI):
 
         organisation = self.model.create(db_session, **serializer)
         resp.status = falcon.HTTP_201
-        resp.media = organisation.convert_object_to_dict(('id', 'name', 'status_name'))
+        resp.media = organisation_detail_v1(organisation)
 
     def build_query_filters(self, params):
         """
@@ -78,31 +87,35 @@ class OrganisationCollectionResourceV1(BaseSortingAPI):
         filters = []
 
         for search_term in search_terms:
-            search_term = f'%{search_term.strip()}%'
-            filters.append(or_(*[
-                self.model.name.ilike(search_term),
-                cast(self.model.id, String).ilike(search_term),
-            ]))
+            search_term = search_term.strip()
+            if not search_term:
+                # Empty term matches everything
+                continue
+
+            if get_search_term_type(search_term) == SearchTermType.ID:
+                filters.append(self.build_id_search_filter(search_term))
+            else:
+                filters.append(self.model.name.ilike(f'%{search_term}%'))
 
         return filters
 
     @staticmethod
-    def build_response(total, data):
+    def build_response(data, total, **meta):
         """
         Build response in proper format
 
         Args:
+            data (iterable): Airport instances, they are converted while the response is sent
             total (int): total number of airports
-            data (list): list of Airport instances
+            **meta: Additional pagination data, e.g. next_cursor
 
         Returns:
             (dict) with basic airport data
         """
-        keys = ('id', 'name')
-
         return {
             'total': total,
-            'data': [item.convert_object_to_dict(keys) for item in data]
+            **meta,
+            'data': map(organisation_v1, data)
         }
 
 
@@ -186,8 +199,4 @@ class OrganisationResourceV1:
         Returns:
             (dict): Organisation instance details
         """
-        keys = ('id', 'name', 'status_name')
-
-        response = instance.convert_object_to_dict(keys)
-
-        return response
+        return organisation_detail_v1(instance)
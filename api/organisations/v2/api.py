@@ -1,15 +1,20 @@
 import falcon
 
-from sqlalchemy import cast, or_, String, func
+from sqlalchemy import func
 
 from core.api import BaseSortingAPI
+from core.enums import SearchTermType
 from core.hooks import get_instance
+from core.utils import get_search_term_type
 from core.validators import validate_object_id
 from organisations.models import Organisation
+from organisations.projections import organisation_detail_v2, organisation_v2
 from organisations.serializers import (
+    OrganisationBulkPostRequestSchema,
     OrganisationPatchRequestSchema,
     OrganisationPostRequestSchema
 )
+from users.projections import user_v2
 
 
 class OrganisationCollectionResourceV2(BaseSortingAPI):
@@ -38,12 +43,16 @@ class OrganisationCollectionResourceV2(BaseSortingAPI):
             (dict): Organisation instance list and total number
         """
 
-        paginated_filtered_result, total_objects = self.get_objects(req.context.db_session, params)
+        page = self.get_tagged_objects(req, resp, params, projection=organisation_v2)
+        if page is None:
+            return
 
-        resp.media = self.build_response(
-            total=total_objects,
-            data=paginated_filtered_result
-        )
+        paginated_filtered_result, meta = page
+
+        self.stream_response(resp, self.build_response(
+            data=paginated_filtered_result,
+            **meta
+        ))
 
     def on_post(self, req, resp):
         """
@@ -58,7 +67,7 @@ class OrganisationCollectionResourceV2(BaseSortingAPI):
 
         organisation = self.model.create(db_session, **serializer)
         resp.status = falcon.HTTP_201
-        resp.media = organisation.convert_object_to_dict(('id', 'name', 'status_name'))
+        resp.media = organisation_v2(organisation)
 
     def build_query_filters(self, params):
         """
@@ -78,31 +87,78 @@ class OrganisationCollectionResourceV2(BaseSortingAPI):
         filters = []
 
         for search_term in search_terms:
-            search_term = f'%{search_term.strip()}%'
-            filters.append(or_(*[
-                self.model.name.ilike(search_term),
-                cast(self.model.id, String).ilike(search_term),
-            ]))
+            search_term = search_term.strip()
+            if not search_term:
+                # Empty term matches everything
+                continue
+
+            if get_search_term_type(search_term) == SearchTermType.ID:
+                filters.append(self.build_id_search_filter(search_term))
+            else:
+                filters.append(self.model.name.ilike(f'%{search_term}%'))
 
         return filters
 
     @staticmethod
-    def build_response(total, data):
+    def build_response(data, total, **meta):
         """
         Build response in proper format
 
         Args:
+            data (iterable): Airport instances, they are converted while the response is sent
             total (int): total number of airports
-            data (list): list of Airport instances
+            **meta: Additional pagination data, e.g. next_cursor
 
         Returns:
             (dict) with basic airport data
         """
-        keys = ('id', 'name', 'status_name')
-
         return {
             'total': total,
-            'data': [item.convert_object_to_dict(keys) for item in data]
+            **meta,
+            'data': map(organisation_v2, data)
+        }
+
+
+class OrganisationExportResourceV2(OrganisationCollectionResourceV2):
+    """
+    Organisation API method to export all filtered and sorted instances.
+    """
+
+    def on_get(self, req, resp, params):
+        """
+        Get stream of all Organisations as NDJSON or CSV
+
+        Args:
+            req (falcon.request.Request): Request object
+            resp (falcon.response.Response): Response object
+            params (dict): Query params
+        """
+        self.export(resp, params, organisation_v2)
+
+
+class OrganisationBulkResourceV2:
+    """
+    Organisation API method to create many instances at once.
+    """
+    serializers = {
+        'post': OrganisationBulkPostRequestSchema
+    }
+
+    def on_post(self, req, resp):
+        """
+        Post create Organisation instances in one transaction
+
+        Args:
+            req (falcon.request.Request): Request object
+            resp (falcon.response.Response): Response object
+        """
+        serializer = req.context['serializer']
+        db_session = req.context['db_session']
+
+        organisations = Organisation.bulk_create(db_session, serializer)
+        resp.status = falcon.HTTP_201
+        resp.media = {
+            'data': [organisation_v2(organisation) for organisation in organisations]
         }
 
 
@@ -186,13 +242,8 @@ class OrganisationResourceV2:
         Returns:
             (dict): Organisation instance details
         """
-        keys = ('id', 'name', 'status_name', 'enable_user_login')
-
-        response = instance.convert_object_to_dict(keys)
+        response = organisation_detail_v2(instance)
 
-        response['users'] = [
-            item.convert_object_to_dict(('id', 'name', 'email', 'state_name'))
-            for item in instance.users
-        ]
+        response['users'] = [user_v2(item) for item in instance.users]
 
         return response
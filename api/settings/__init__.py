@@ -17,6 +17,52 @@ POSTGRESQL = {
 SQLALCHEMY = {
     "sessionmaker": {"expire_on_commit": False},
     "debug": False,  # choose between False, True, 'debug'
+    "baked_queries": 1000,  # cached list, detail and exists queries, see core.db.baked
+    "autocommit_reads": True,  # GET and HEAD requests run without transaction, see SQLAlchemySessionManager
+}
+
+
+PREPARED_STATEMENTS = {
+    "enabled": False,  # execute hot statements as server-side prepared statements, see core.db.engine
+    "cache_size": 256,  # prepared statements kept by one connection
+    "schema_check_interval": 10,  # seconds between checks of alembic revision
+}
+
+
+RESPONSE_CACHE = {
+    "enabled": True,  # serve repeated GET requests from in-process cache, see core.cache
+    "size": 1000,  # cached responses
+    "ttl": 30,  # seconds, bounds staleness of responses after writes which bypass the ORM and mark_changed
+}
+
+
+COUNT_CACHE = {
+    "enabled": True,  # reuse totals of the same search while its pages are walked, see BaseSortingAPI.get_objects
+    "size": 1000,  # cached totals
+    "ttl": 60,  # seconds, bounds staleness of totals after writes which bypass the ORM and mark_changed
+}
+
+
+COMPRESSION = {
+    "enabled": True,  # compress responses negotiated by Accept-Encoding, see core.middleware.compression
+    "encodings": ("br", "gzip"),  # in order of preference, br is used only when brotli is installed
+    "levels": {"br": 4, "gzip": 6},  # see benchmarks.compression
+    "min_size": 1024,  # bytes, smaller bodies are sent uncompressed
+}
+
+
+JSON = {
+    "codecs": ("orjson", "ujson", "json"),  # the first installed one is used, see core.json_codec
+}
+
+
+IMPORTS = {
+    "workers": 2,  # background threads loading imports
+    "spool_dir": None,  # directory of uploaded files waiting for load, system temp dir by default
+    "max_size": 1024 * 1024 * 1024,  # bytes, larger uploads are refused with 413 before they are spooled
+    "chunk_size": 1024 * 1024,  # bytes read at once from request body and sent to COPY
+    "progress_interval": 16 * 1024 * 1024,  # bytes loaded between progress updates
+    "rejected_limit": 100,  # rejected rows reported with their errors
 }
 
 
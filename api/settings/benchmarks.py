@@ -0,0 +1,5 @@
+BASE_URL = 'https://localhost:8081'
+
+POSTGRESQL = {
+    'db_name': 'benchmark_interview',
+}
@@ -3,12 +3,24 @@ import falcon
 from webargs.falconparser import use_args
 
 from core.hooks import get_instance
+from organisations.models import Organisation
 from users.models import User
-from users.serializers import UserGetRequestSchema, UserPatchRequestSchema, UserPostRequestSchema
+from users.serializers import (
+    UserBulkPostRequestSchema,
+    UserExportRequestSchema,
+    UserGetRequestSchema,
+    UserPatchRequestSchema,
+    UserPostRequestSchema,
+)
 from core.validators import validate_object_id
 
 from users.v1.api import UserCollectionResourceV1, UserResourceV1
-from users.v2.api import UserCollectionResourceV2, UserResourceV2
+from users.v2.api import (
+    UserBulkResourceV2,
+    UserCollectionResourceV2,
+    UserExportResourceV2,
+    UserResourceV2,
+)
 
 
 class UserCollectionResourceProxy:
@@ -18,6 +30,8 @@ class UserCollectionResourceProxy:
     serializers = {
         'post': UserPostRequestSchema
     }
+    # Models GET responses are built from, see core.middleware.cache
+    cache_models = (User,)
 
     @use_args(UserGetRequestSchema, location="query")
     def on_get(self, req, resp, params):
@@ -55,6 +69,63 @@ class UserCollectionResourceProxy:
         controller.on_post(req, resp)
 
 
+class UserExportResourceProxy:
+    """
+    UserExportResource Proxy. Export is available since version 2
+    """
+
+    @use_args(UserExportRequestSchema, location="query")
+    def on_get(self, req, resp, params):
+        """
+        Get UserExport Proxy
+
+        Args:
+            req (falcon.request.Request): Request object
+            resp (falcon.response.Response): Response object
+            params (dict): Query params
+
+        Raises:
+            (HTTPNotFound): Version 1 does not support export
+        """
+        version = req.context['version']
+        if not version or version == 1:
+            raise falcon.HTTPNotFound()
+
+        elif version == 2:
+            controller = UserExportResourceV2()
+
+        controller.on_get(req, resp, params)
+
+
+class UserBulkResourceProxy:
+    """
+    UserBulkResource Proxy. Bulk create is available since version 2
+    """
+    serializers = {
+        'post': UserBulkPostRequestSchema
+    }
+
+    def on_post(self, req, resp):
+        """
+        Post UserBulk Proxy
+
+        Args:
+            req (falcon.request.Request): Request object
+            resp (falcon.response.Response): Response object
+
+        Raises:
+            (HTTPNotFound): Version 1 does not support bulk create
+        """
+        version = req.context['version']
+        if not version or version == 1:
+            raise falcon.HTTPNotFound()
+
+        elif version == 2:
+            controller = UserBulkResourceV2()
+
+        controller.on_post(req, resp)
+
+
 @falcon.before(validate_object_id, User)
 @falcon.before(get_instance, User)
 class UserResourceProxy:
@@ -64,6 +135,10 @@ class UserResourceProxy:
     serializers = {
         'patch': UserPatchRequestSchema
     }
+    # Detail contains name of user's organisation
+    cache_models = (User, Organisation)
+    # Model of the instance, its version is the ETag of details, see core.middleware.conditional
+    etag_model = User
 
     def on_get(self, req, resp, object_id):
         """
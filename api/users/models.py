@@ -2,10 +2,13 @@ from sqlalchemy import (
     Boolean,
     Column,
     ForeignKey,
+    Index,
     Integer,
     String,
+    func,
 )
-from sqlalchemy.orm import Session, relationship
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Session, deferred, relationship
 
 from core.db.base import Base
 from users.enums import UserState
@@ -13,13 +16,30 @@ from users.enums import UserState
 
 class User(Base):
     __tablename__ = 'users'
+    __table_args__ = (
+        Index('ix_users_first_name_trgm', 'first_name', postgresql_using='gin',
+              postgresql_ops={'first_name': 'gin_trgm_ops'}),
+        Index('ix_users_last_name_trgm', 'last_name', postgresql_using='gin',
+              postgresql_ops={'last_name': 'gin_trgm_ops'}),
+        Index('ix_users_email_trgm', 'email', postgresql_using='gin',
+              postgresql_ops={'email': 'gin_trgm_ops'}),
+        Index('ix_users_search_vector', 'search_vector', postgresql_using='gin'),
+    )
 
     first_name = Column(String(128), nullable=True)
     last_name = Column(String(128), nullable=True)
     email = Column(String(128))
-    organisation_id = Column(Integer, ForeignKey('organisations.id'))
+    organisation_id = Column(Integer, ForeignKey('organisations.id'), index=True)
     organisation = relationship('Organisation', back_populates='users')
     state = Column(Integer, default=UserState.ENABLED.value)
+    # Maintained by database trigger from first_name, last_name and email
+    search_vector = deferred(Column(TSVECTOR))
+
+    integrity_errors = {
+        'uq_users_lower_email': ('email', 'User email {} already exists'),
+    }
+    # Detail contains name of user's organisation
+    version_relationships = ('organisation',)
 
     @property
     def name(self):
@@ -34,3 +54,9 @@ class User(Base):
             (str) state name
         """
         return UserState.get_name_by_value(self.state)
+
+
+# Expression indexes serving sorting_mapper keys, ID is the tie-breaker of every ordering
+Index('ix_users_lower_first_name_id', func.lower(User.first_name), User.id)
+Index('ix_users_lower_last_name_id', func.lower(User.last_name), User.id)
+Index('uq_users_lower_email', func.lower(User.email), unique=True)
@@ -0,0 +1,9 @@
+from core.projections import compile_projection
+from users.enums import UserState
+
+
+# Same value as User.name, computed from columns so it works with column queries too
+NAME = '{first_name} {last_name}'
+
+user_v1 = compile_projection(('id', 'name', 'email'), name=NAME)
+user_v2 = compile_projection(('id', 'name', 'email', 'state_name'), name=NAME, state_name=('state', UserState.names()))
@@ -1,16 +1,30 @@
 from marshmallow.fields import Email, Integer, String
 from marshmallow import validate
 
-from core.serializers import BasePaginatedRequestSchema, BaseSearchSortGetRequestSchema, StrictSchema
-from organisations.validators import validate_organisation_exists
-from users.validators import validate_unique_user_email
+from core.serializers import (
+    BaseBulkSchema,
+    BaseExportRequestSchema,
+    BasePaginatedRequestSchema,
+    BaseSearchSortGetRequestSchema,
+    StrictSchema,
+)
+from organisations.validators import organisation_exists
+from users.validators import user_email_unique
 
 
 class UserGetRequestSchema(BaseSearchSortGetRequestSchema, BasePaginatedRequestSchema):
     pass
 
 
+class UserExportRequestSchema(BaseSearchSortGetRequestSchema, BaseExportRequestSchema):
+    pass
+
+
 class UserPostRequestSchema(StrictSchema):
+    db_checks = {
+        'organisation_id': organisation_exists,
+    }
+
     first_name = String(
         required=True,
         validate=validate.Length(max=128)
@@ -21,16 +35,19 @@ class UserPostRequestSchema(StrictSchema):
     )
     email = Email(
         required=True,
-        validate=[validate.Length(max=254), validate.Email(), validate_unique_user_email],
+        validate=[validate.Length(max=254), validate.Email()],
         allow_none=False
     )
     organisation_id = Integer(
-        required=True,
-        validate=validate_organisation_exists
+        required=True
     )
 
 
 class UserPatchRequestSchema(StrictSchema):
+    db_checks = {
+        'organisation_id': organisation_exists,
+    }
+
     first_name = String(
         required=True,
         validate=validate.Length(max=128)
@@ -40,6 +57,13 @@ class UserPatchRequestSchema(StrictSchema):
         validate=validate.Length(max=128)
     )
     organisation_id = Integer(
-        required=True,
-        validate=validate_organisation_exists
+        required=True
     )
+
+
+class UserBulkPostRequestSchema(BaseBulkSchema, UserPostRequestSchema):
+    # Unique index can not tell which of the inserted rows is the duplicate, emails are checked upfront
+    db_checks = {
+        'organisation_id': organisation_exists,
+        'email': user_email_unique,
+    }
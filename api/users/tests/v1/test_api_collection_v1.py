@@ -250,3 +250,16 @@ class UserGetTestCase(BaseUserTestCase):
             response.json,
             {'data': [], 'total': 0}
         )
+
+    def test_list_users_cached_total(self):
+        organisation = self.create_organisation('Die Hard')
+        self.create_user(organisation.id)
+        self.create_user(organisation.id, first_name='Hans', last_name='Gruber', email='hans@example.com')
+
+        self.request_get(path=PATH, status=HTTP_200, params={'size': 1, 'page': 0})
+        # Total of the second page is reused from count cache
+        response = self.request_get(path=PATH, status=HTTP_200, params={'size': 1, 'page': 1})
+        self.assertDictEqual(
+            response.json,
+            {'data': [{'email': 'hans@example.com', 'id': ANY, 'name': 'Hans Gruber'}], 'total': 2}
+        )
@@ -0,0 +1,108 @@
+"""
+    (VERSION 2) User bulk resource tests
+"""
+import pytest
+
+from unittest.mock import ANY
+from sqlalchemy import event
+
+from falcon import HTTP_201, HTTP_404, HTTP_422
+
+from users.models import User
+from users.tests.test_api import BaseUserTestCase
+
+
+PATH = '/v2/users/bulk'
+
+
+@pytest.mark.apiv2
+class UserBulkPostTestCase(BaseUserTestCase):
+    def setUp(self):
+        super().setUp()
+        self.organisation = self.create_organisation('Die Hard')
+
+    def build_user(self, email, organisation_id=None):
+        return {
+            'first_name': 'John',
+            'last_name': 'McClane',
+            'email': email,
+            'organisation_id': organisation_id or self.organisation.id
+        }
+
+    def test_bulk_create_users(self):
+        response = self.request_post(
+            path=PATH,
+            status=HTTP_201,
+            body=[self.build_user('john@example.com'), self.build_user('holly@example.com')]
+        )
+
+        self.assertDictEqual(
+            response.json,
+            {'data': [
+                {'id': ANY, 'name': 'John McClane', 'email': 'john@example.com', 'state_name': 'ENABLED'},
+                {'id': ANY, 'name': 'John McClane', 'email': 'holly@example.com', 'state_name': 'ENABLED'},
+            ]}
+        )
+        self.assertEqual(
+            self.db_session.query(User.email).filter(
+                User.id.in_([item['id'] for item in response.json['data']])
+            ).count(),
+            2
+        )
+
+    def test_bulk_create_users_validation_queries(self):
+        statements = []
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(self.db_session.get_bind(), 'before_cursor_execute', listener)
+        try:
+            self.request_post(
+                path=PATH,
+                status=HTTP_201,
+                body=[self.build_user(f'user{i}@example.com') for i in range(50)]
+            )
+        finally:
+            event.remove(self.db_session.get_bind(), 'before_cursor_execute', listener)
+
+        # One query per checked field, bump of cache generations and one INSERT
+        self.assertEqual(len(statements), 4)
+
+    def test_bulk_create_users_item_errors(self):
+        self.create_user(self.organisation.id, email='john@example.com')
+
+        response = self.request_post(
+            path=PATH,
+            status=HTTP_422,
+            body=[
+                self.build_user('holly@example.com'),
+                self.build_user('JOHN@example.com'),
+                self.build_user('karl@example.com', organisation_id=999999),
+                self.build_user('Holly@example.com'),
+                {'first_name': 'Argyle', 'email': 'argyle@example.com', 'organisation_id': self.organisation.id},
+            ]
+        )
+
+        self.assertDictEqual(
+            response.json,
+            {'title': '422 Unprocessable Entity',
+             'errors': {
+                 '1': {'email': ['User email JOHN@example.com already exists']},
+                 '2': {'organisation_id': ['Organisation with given ID (999999) does not exist']},
+                 '3': {'email': ['User email Holly@example.com already exists']},
+                 '4': {'last_name': ['Missing data for required field.']},
+             }}
+        )
+
+    def test_bulk_create_users_too_many_items(self):
+        response = self.request_post(
+            path=PATH,
+            status=HTTP_422,
+            body=[self.build_user('john@example.com')] * 10001
+        )
+
+        self.assertDictEqual(
+            response.json,
+            {'title': '422 Unprocessable Entity', 'errors': {'_schema': ['Longer than maximum length 10000.']}}
+        )
+
+    def test_bulk_create_users_not_available_in_v1(self):
+        self.request_post(path='/v1/users/bulk', status=HTTP_404, body=[self.build_user('john@example.com')])
@@ -3,11 +3,16 @@
 """
 import pytest
 
-from unittest.mock import ANY
+from unittest.mock import ANY, patch
 
-from falcon import HTTP_200, HTTP_201, HTTP_422
+from falcon import HTTP_200, HTTP_201, HTTP_304, HTTP_422
 
+import settings
+from core.utils import encode_cursor
 from users.tests.test_api import BaseUserTestCase
+from users.models import User
+from users.projections import user_v2
+from users.v2.api import UserCollectionResourceV2
 
 
 VERSION_URL = 'v2'
@@ -34,6 +39,21 @@ class UserPostTestCase(BaseUserTestCase):
             {"id": ANY, "name": "John McClane", "email": "john@example.com", "state_name": "ENABLED"}
         )
 
+    def test_create_user_validation_uses_request_session(self):
+        organisation = self.create_organisation('Die Hard')
+
+        with patch('core.validators.session_manager', side_effect=AssertionError('Second session opened')):
+            self.request_post(
+                path=PATH,
+                status=HTTP_201,
+                body={
+                    'first_name': 'John',
+                    'last_name': 'McClane',
+                    'email': 'john@example.com',
+                    'organisation_id': organisation.id
+                }
+            )
+
     def test_create_user_unexisting_organisation_error(self):
         """ User of a non existing organisation """
         response = self.request_post(
@@ -55,6 +75,30 @@ class UserPostTestCase(BaseUserTestCase):
              }
         )
 
+    def test_create_user_duplicate_email_error(self):
+        """ User with email of another user """
+        organisation = self.create_organisation('Die Hard')
+        self.create_user(organisation.id)
+
+        response = self.request_post(
+            path=PATH,
+            status=HTTP_422,
+            body={
+                'first_name': 'Hans',
+                'last_name': 'Gruber',
+                'email': 'John@Example.com',
+                'organisation_id': organisation.id
+            }
+        )
+        self.assertDictEqual(
+            response.json,
+            {"title": "422 Unprocessable Entity",
+             "errors": {
+                "email": ["User email John@Example.com already exists"]
+                }
+             }
+        )
+
     def test_create_user_null_values_error(self):
         """ User with None values """
         response = self.request_post(
@@ -125,7 +169,8 @@ class UserGetTestCase(BaseUserTestCase):
                         {'email': 'holly@example.com', 'id': ANY, 'name': 'Holly Genaro', 'state_name': 'ENABLED'},
                         {'email': 'zeus@example.com', 'id': ANY, 'name': 'Zeus Carver', 'state_name': 'ENABLED'}
                      ],
-             'total': 4
+             'total': 4,
+             'total_is_cached': False
              }
         )
 
@@ -147,10 +192,26 @@ class UserGetTestCase(BaseUserTestCase):
                         {'email': 'john@example.com', 'id': ANY, 'name': 'John McClane', 'state_name': 'ENABLED'},
                         {'email': 'hans@example.com', 'id': ANY, 'name': 'Hans Gruber', 'state_name': 'ENABLED'}
                      ],
-             'total': 4
+             'total': 4,
+             'total_is_cached': False
              }
         )
 
+    def test_list_user_paging_after_last_page(self):
+        organisation = self.create_organisation('Die Hard')
+        self.create_user(organisation.id)
+        self.create_user(organisation.id, first_name='Hans', last_name='Gruber', email='hans@example.com')
+
+        response = self.request_get(
+            path=PATH,
+            status=HTTP_200,
+            params={'size': 2, 'page': 3}
+        )
+        self.assertDictEqual(
+            response.json,
+            {'data': [], 'total': 2, 'total_is_cached': False}
+        )
+
     def test_list_user_search(self):
         organisation = self.create_organisation('Die Hard')
         self.create_user(organisation.id)
@@ -168,7 +229,75 @@ class UserGetTestCase(BaseUserTestCase):
             {'data': [
                         {'email': 'hans@example.com', 'id': ANY, 'name': 'Hans Gruber', 'state_name': 'ENABLED'}
                      ],
-             'total': 1
+             'total': 1,
+             'total_is_cached': False
+             }
+        )
+
+    def test_list_user_search_id(self):
+        organisation = self.create_organisation('Die Hard')
+        user = self.create_user(organisation.id)
+        self.create_user(organisation.id, first_name='Hans', last_name='Gruber', email='hans@example.com')
+
+        response = self.request_get(
+            path=PATH,
+            status=HTTP_200,
+            params={'search': str(user.id)}
+        )
+        self.assertEqual([item['id'] for item in response.json['data']], [user.id])
+
+    def test_list_user_search_id_leading_zero(self):
+        organisation = self.create_organisation('Die Hard')
+        user = self.create_user(organisation.id)
+
+        response = self.request_get(
+            path=PATH,
+            status=HTTP_200,
+            params={'search': f'0{user.id}'}
+        )
+        self.assertDictEqual(response.json, {'data': [], 'total': 0, 'total_is_cached': False})
+
+    def test_list_user_search_zero(self):
+        organisation = self.create_organisation('Die Hard')
+        self.create_user(organisation.id)
+
+        response = self.request_get(
+            path=PATH,
+            status=HTTP_200,
+            params={'search': '0'}
+        )
+        self.assertDictEqual(response.json, {'data': [], 'total': 0, 'total_is_cached': False})
+
+    def test_list_user_search_non_ascii_digit(self):
+        organisation = self.create_organisation('Die Hard')
+        self.create_user(organisation.id)
+
+        for search in ('²', '٣'):
+            with self.subTest(search=search):
+                response = self.request_get(
+                    path=PATH,
+                    status=HTTP_200,
+                    params={'search': search}
+                )
+                self.assertDictEqual(response.json, {'data': [], 'total': 0, 'total_is_cached': False})
+
+    def test_list_user_search_email(self):
+        organisation = self.create_organisation('Die Hard')
+        self.create_user(organisation.id)
+        self.create_user(organisation.id, first_name='Hans', last_name='Gruber', email='hans@example.com')
+
+        response = self.request_get(
+            path=PATH,
+            status=HTTP_200,
+            params={'search': 'hans@'}
+        )
+        self.assertDictEqual(
+            response.json,
+            {'data': [
+                        {'email': 'hans@example.com', 'id': ANY, 'name': 'Hans Gruber', 'state_name': 'ENABLED'}
+                     ],
+             'total': 1,
+             'total_is_cached': False
              }
         )
 
@@ -186,7 +315,7 @@ class UserGetTestCase(BaseUserTestCase):
         )
         self.assertDictEqual(
             response.json,
-            {'data': [], 'total': 0}
+            {'data': [], 'total': 0, 'total_is_cached': False}
         )
 
     def test_list_user_sorting_first_name(self):
@@ -209,7 +338,8 @@ class UserGetTestCase(BaseUserTestCase):
                         {'email': 'john@example.com', 'id': ANY, 'name': 'John McClane', 'state_name': 'ENABLED'},
                         {'email': 'zeus@example.com', 'id': ANY, 'name': 'Zeus Carver', 'state_name': 'ENABLED'}
                      ],
-             'total': 4
+             'total': 4,
+             'total_is_cached': False
              }
         )
 
@@ -235,7 +365,8 @@ class UserGetTestCase(BaseUserTestCase):
                         {'email': 'hans@example.com', 'id': ANY, 'name': 'Hans Gruber', 'state_name': 'ENABLED'},
                         {'email': 'john@example.com', 'id': ANY, 'name': 'John McClane', 'state_name': 'ENABLED'},
                      ],
-             'total': 4
+             'total': 4,
+             'total_is_cached': False
              }
         )
 
@@ -249,5 +380,354 @@ class UserGetTestCase(BaseUserTestCase):
         )
         self.assertDictEqual(
             response.json,
-            {'data': [], 'total': 0}
+            {'data': [], 'total': 0, 'total_is_cached': False}
+        )
+
+
+@pytest.mark.apiv2
+class UserGetCursorTestCase(BaseUserTestCase):
+    def setUp(self):
+        super().setUp()
+        organisation = self.create_organisation('Die Hard')
+        self.create_user(organisation.id)
+        self.create_user(organisation.id, first_name='Hans', last_name='Gruber', email='hans@example.com')
+        self.create_user(organisation.id, first_name='Holly', last_name='Genaro', email='holly@example.com')
+        self.create_user(organisation.id, first_name='Zeus', last_name='Carver', email='zeus@example.com')
+        self.create_user(organisation.id, first_name=None, last_name=None, email='nobody@example.com')
+
+    def walk_pages(self, params):
+        """
+        Follow `next_cursor` until the last page and return emails of all listed users.
+        """
+        params = dict(params, pagination='cursor', size=2)
+        emails = []
+        while True:
+            response = self.request_get(path=PATH, status=HTTP_200, params=params)
+            self.assertEqual(response.json['total'], 5)
+            emails.extend(item['email'] for item in response.json['data'])
+            if response.json['next_cursor'] is None:
+                return emails
+            params['cursor'] = response.json['next_cursor']
+
+    def test_list_users_cursor(self):
+        self.assertEqual(
+            self.walk_pages({}),
+            ['john@example.com', 'hans@example.com', 'holly@example.com', 'zeus@example.com', 'nobody@example.com']
         )
+
+    def test_list_users_cursor_sorting_first_name(self):
+        self.assertEqual(
+            self.walk_pages({'sorting': 'first_name'}),
+            ['hans@example.com', 'holly@example.com', 'john@example.com', 'zeus@example.com', 'nobody@example.com']
+        )
+
+    def test_list_users_cursor_sorting_last_name_descending(self):
+        self.assertEqual(
+            self.walk_pages({'sorting': '-last_name'}),
+            ['nobody@example.com', 'john@example.com', 'hans@example.com', 'holly@example.com', 'zeus@example.com']
+        )
+
+    def test_list_users_invalid_cursor(self):
+        response = self.request_get(path=PATH, status=HTTP_422, params={'cursor': 'invalid'})
+        self.assertEqual(response.json['errors'], {'query': {'cursor': ['Not a valid cursor.']}})
+
+    def test_list_users_malformed_cursor(self):
+        cursors = (
+            [None, 1],
+            [1, 'john', 1],
+            [None, 'john', '1'],
+            [None, 'john', True],
+            [None, 'john', 1.5],
+            ['first_name', {'a': 1}, 1],
+            ['first_name', True, 1],
+            {'sorting': None},
+        )
+        for values in cursors:
+            with self.subTest(cursor=values):
+                response = self.request_get(path=PATH, status=HTTP_422, params={'cursor': encode_cursor(values)})
+                self.assertEqual(response.json['errors'], {'query': {'cursor': ['Not a valid cursor.']}})
+
+    def test_list_users_cursor_key_type_mismatch(self):
+        for sorting, key in (('first_name', 5), ('-last_name', 1.5)):
+            with self.subTest(sorting=sorting):
+                response = self.request_get(
+                    path=PATH,
+                    status=HTTP_422,
+                    params={'cursor': encode_cursor([sorting, key, 1]), 'sorting': sorting}
+                )
+                self.assertEqual(response.json['errors'], {'cursor': ['Cursor does not match sorting.']})
+
+    def test_list_users_cursor_sorting_mismatch(self):
+        response = self.request_get(path=PATH, status=HTTP_200, params={'pagination': 'cursor', 'size': 2})
+
+        response = self.request_get(
+            path=PATH,
+            status=HTTP_422,
+            params={'cursor': response.json['next_cursor'], 'sorting': 'first_name'}
+        )
+        self.assertEqual(response.json['errors'], {'cursor': ['Cursor does not match sorting.']})
+
+
+@pytest.mark.apiv2
+class UserGetCountTestCase(BaseUserTestCase):
+    def setUp(self):
+        super().setUp()
+        organisation = self.create_organisation('Die Hard')
+        self.create_user(organisation.id)
+        self.create_user(organisation.id, first_name='Hans', last_name='Gruber', email='hans@example.com')
+        self.create_user(organisation.id, first_name='Holly', last_name='Genaro', email='holly@example.com')
+        self.create_user(organisation.id, first_name='Zeus', last_name='Carver', email='zeus@example.com')
+
+    def test_list_users_count_capped(self):
+        with patch.object(UserCollectionResourceV2, 'count_limit', 3):
+            response = self.request_get(path=PATH, status=HTTP_200, params={'size': 1, 'count': 'capped'})
+
+        self.assertEqual(response.json['total'], 3)
+        self.assertTrue(response.json['total_is_lower_bound'])
+        self.assertEqual(len(response.json['data']), 1)
+
+    def test_list_users_count_capped_below_limit(self):
+        response = self.request_get(path=PATH, status=HTTP_200, params={'count': 'capped'})
+
+        self.assertEqual(response.json['total'], 4)
+        self.assertFalse(response.json['total_is_lower_bound'])
+
+    def test_list_users_count_estimate(self):
+        self.db_session.execute('ANALYZE users')
+
+        response = self.request_get(path=PATH, status=HTTP_200, params={'count': 'estimate'})
+
+        self.assertEqual(response.json['total'], 4)
+        self.assertTrue(response.json['total_is_estimate'])
+
+    def test_list_users_count_estimate_with_search(self):
+        response = self.request_get(path=PATH, status=HTTP_200, params={'count': 'estimate', 'search': 'hans'})
+
+        self.assertEqual(response.json['total'], 1)
+        self.assertFalse(response.json['total_is_estimate'])
+
+    def test_list_users_count_mode_resource_default(self):
+        with patch.object(UserCollectionResourceV2, 'count_mode', 'capped'):
+            response = self.request_get(path=PATH, status=HTTP_200)
+
+        self.assertEqual(response.json['total'], 4)
+        self.assertFalse(response.json['total_is_lower_bound'])
+
+
+@pytest.mark.apiv2
+class UserGetFulltextTestCase(BaseUserTestCase):
+    def setUp(self):
+        super().setUp()
+        organisation = self.create_organisation('Die Hard')
+        self.create_user(organisation.id)
+        self.create_user(organisation.id, first_name='Hans', last_name='Gruber', email='hans@example.com')
+        self.create_user(organisation.id, first_name='Holly', last_name='Gennero', email='holly@example.com')
+        self.create_user(organisation.id, first_name='Hans', last_name='Hans', email='hans.hans@example.com')
+
+    def test_list_users_fulltext_search(self):
+        response = self.request_get(
+            path=PATH,
+            status=HTTP_200,
+            params={'search_mode': 'fulltext', 'search': 'gru han'}
+        )
+        self.assertDictEqual(
+            response.json,
+            {'data': [
+                        {'email': 'hans@example.com', 'id': ANY, 'name': 'Hans Gruber', 'state_name': 'ENABLED'}
+                     ],
+             'total': 1,
+             'total_is_cached': False
+             }
+        )
+
+    def test_list_users_fulltext_search_ranking(self):
+        response = self.request_get(
+            path=PATH,
+            status=HTTP_200,
+            params={'search_mode': 'fulltext', 'search': 'hans'}
+        )
+        self.assertEqual(
+            [item['email'] for item in response.json['data']],
+            ['hans.hans@example.com', 'hans@example.com']
+        )
+
+    def test_list_users_fulltext_search_sorting(self):
+        response = self.request_get(
+            path=PATH,
+            status=HTTP_200,
+            params={'search_mode': 'fulltext', 'search': 'h', 'sorting': 'last_name'}
+        )
+        self.assertEqual(
+            [item['email'] for item in response.json['data']],
+            ['holly@example.com', 'hans@example.com', 'hans.hans@example.com']
+        )
+
+    def test_list_users_fulltext_search_cursor(self):
+        params = {'search_mode': 'fulltext', 'search': 'hans', 'pagination': 'cursor', 'size': 1}
+        response = self.request_get(path=PATH, status=HTTP_200, params=params)
+        self.assertEqual([item['email'] for item in response.json['data']], ['hans.hans@example.com'])
+
+        params['cursor'] = response.json['next_cursor']
+        response = self.request_get(path=PATH, status=HTTP_200, params=params)
+        self.assertEqual([item['email'] for item in response.json['data']], ['hans@example.com'])
+        self.assertIsNone(response.json['next_cursor'])
+
+
+@pytest.mark.apiv2
+class UserGetProjectionTestCase(BaseUserTestCase):
+    def setUp(self):
+        super().setUp()
+        organisation = self.create_organisation('Die Hard')
+        self.create_user(organisation.id)
+        self.create_user(organisation.id, first_name='Hans', last_name='Gruber', email='hans@example.com')
+        self.create_user(organisation.id, first_name=None, last_name=None, email='nobody@example.com')
+        self.db_session.expunge_all()
+        self.resource = UserCollectionResourceV2()
+
+    def test_rows_converted_as_instances(self):
+        for params in (
+            {'count': 'exact'},
+            {'count': 'capped'},
+            {'pagination': 'cursor'},
+            {'sorting': '-first_name', 'count': 'exact'},
+        ):
+            params = dict(params, page=0, size=2)
+            with self.subTest(params=params):
+                objects, meta = self.resource.get_objects(self.db_session, params)
+                rows, projected_meta = self.resource.get_objects(self.db_session, params, projection=user_v2)
+                rows = list(rows)
+
+                self.assertEqual([user_v2(row) for row in rows], [user_v2(instance) for instance in objects])
+                # Total of the same search is counted once
+                self.assertEqual(projected_meta, {**meta, 'total_is_cached': True})
+                self.assertFalse(any(isinstance(row, User) for row in rows))
+
+    def test_only_projected_columns_selected(self):
+        rows, _ = self.resource.get_objects(self.db_session, {'page': 0, 'size': 10}, projection=user_v2)
+
+        self.assertEqual(set(next(rows).keys()), {'id', 'first_name', 'last_name', 'email', 'state'})
+        self.assertEqual(len(self.db_session.identity_map), 0)
+
+
+@pytest.mark.apiv2
+class UserGetCountCacheTestCase(BaseUserTestCase):
+    def setUp(self):
+        super().setUp()
+        self.organisation = self.create_organisation('Die Hard')
+        self.create_user(self.organisation.id)
+        self.create_user(self.organisation.id, first_name='Hans', last_name='Gruber', email='hans@example.com')
+        self.create_user(self.organisation.id, first_name='Holly', last_name='Genaro', email='holly@example.com')
+        self.resource = UserCollectionResourceV2()
+
+    def get_meta(self, **params):
+        objects, meta = self.resource.get_objects(self.db_session, dict({'page': 0, 'size': 1}, **params))
+
+        return [instance.email for instance in objects], meta
+
+    def test_total_counted_once_for_all_pages(self):
+        for count in ('exact', 'capped'):
+            with self.subTest(count=count):
+                self.assertEqual(
+                    self.get_meta(count=count, search=['an']),
+                    (['john@example.com'], {'total': 2, 'total_is_cached': False, **({
+                        'total_is_lower_bound': False
+                    } if count == 'capped' else {})})
+                )
+
+                with patch.object(self.resource, 'count_objects', side_effect=AssertionError('Counted again')):
+                    emails, meta = self.get_meta(count=count, search=[' an', ''], page=1, sorting='-first_name')
+
+                self.assertEqual((emails, meta['total'], meta['total_is_cached']), (['hans@example.com'], 2, True))
+
+    def test_total_counted_for_different_search(self):
+        self.get_meta(search=['h'])
+
+        self.assertEqual(self.get_meta(search=['hans'])[1], {'total': 1, 'total_is_cached': False})
+        self.assertEqual(self.get_meta(search=['h'], search_mode='fulltext')[1]['total_is_cached'], False)
+
+    def test_total_counted_after_write(self):
+        self.get_meta(pagination='cursor')
+        self.assertEqual(self.get_meta(pagination='cursor')[1]['total_is_cached'], True)
+
+        self.create_user(self.organisation.id, first_name='Zeus', last_name='Carver', email='zeus@example.com')
+
+        self.assertEqual(
+            self.get_meta(pagination='cursor')[1],
+            {'total': 4, 'total_is_cached': False, 'next_cursor': ANY}
+        )
+
+
+@pytest.mark.apiv2
+class UserGetConditionalTestCase(BaseUserTestCase):
+    def setUp(self):
+        super().setUp()
+        # Conditional requests are answered by resources, not by response cache
+        patcher = patch.dict(settings.RESPONSE_CACHE, enabled=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.organisation = self.create_organisation('Die Hard')
+        self.user = self.create_user(self.organisation.id)
+        self.create_user(self.organisation.id, first_name='Hans', last_name='Gruber', email='hans@example.com')
+        self.params = {'page': 0, 'size': 1}
+
+    def get_etag(self):
+        return self.request_get(PATH, params=self.params).headers['etag']
+
+    def test_tag_independent_of_cached_total(self):
+        # The first request counts total, the second one reuses it from count cache
+        first = self.request_get(PATH, params=self.params)
+        second = self.request_get(PATH, params=self.params)
+
+        self.assertEqual((first.json['total_is_cached'], second.json['total_is_cached']), (False, True))
+        self.assertEqual(first.headers['etag'], second.headers['etag'])
+
+    def test_page_streamed(self):
+        chunks = []
+        encode_response = UserCollectionResourceV2.encode_response
+
+        def record_chunks(resource, serialize, response):
+            # Page objects are loaded from the query while the body is encoded
+            self.assertNotIsInstance(response['data'], list)
+            for chunk in encode_response(resource, serialize, response):
+                chunks.append(chunk)
+                yield chunk
+
+        with patch.object(UserCollectionResourceV2, 'stream_batch_size', 1), \
+                patch.object(UserCollectionResourceV2, 'encode_response', record_chunks):
+            response = self.request_get(PATH, params={'size': 2})
+
+        self.assertEqual(response.headers['etag'], self.request_get(PATH, params={'size': 2}).headers['etag'])
+        self.assertNotIn('content-length', response.headers)
+        # Head, the first user, separator, the second user and end of the body
+        self.assertEqual(len(chunks), 5)
+        self.assertEqual(len(response.json['data']), 2)
+
+    def test_not_modified(self):
+        etag = self.get_etag()
+
+        with patch.object(UserCollectionResourceV2, 'build_response', side_effect=AssertionError('Page loaded')):
+            response = self.request_get(PATH, params=self.params, status=HTTP_304, headers={'If-None-Match': etag})
+
+        self.assertEqual((response.content, response.headers['etag']), (b'', etag))
+
+    def test_modified_after_update_of_page_object(self):
+        etag = self.get_etag()
+
+        self.user.update(self.db_session, first_name='Holly')
+
+        response = self.request_get(PATH, params=self.params, headers={'If-None-Match': etag})
+        self.assertEqual(response.json['data'][0]['name'], 'Holly McClane')
+
+    def test_modified_after_create_outside_of_page(self):
+        etag = self.get_etag()
+
+        self.create_user(self.organisation.id, first_name='Holly', last_name='Genaro', email='holly@example.com')
+
+        self.assertEqual(self.request_get(PATH, params=self.params, headers={'If-None-Match': etag}).json['total'], 3)
+
+    def test_pages_tagged_separately(self):
+        etag = self.get_etag()
+        self.params['page'] = 1
+
+        self.assertNotEqual(self.get_etag(), etag)
@@ -0,0 +1,71 @@
+"""
+    (VERSION 2) User export resource tests
+"""
+import json
+
+import pytest
+
+from unittest.mock import patch
+
+from falcon import HTTP_404, HTTP_422
+
+from users.tests.test_api import BaseUserTestCase
+from users.v2.api import UserExportResourceV2
+
+
+PATH = '/v2/users/export'
+
+
+@pytest.mark.apiv2
+class UserExportTestCase(BaseUserTestCase):
+    def setUp(self):
+        super().setUp()
+        organisation = self.create_organisation('Die Hard')
+        self.users = [
+            self.create_user(organisation.id, first_name=first_name, last_name=last_name, email=email)
+            for first_name, last_name, email in (
+                ('John', 'McClane', 'john@example.com'),
+                ('Hans', 'Gruber', 'hans@example.com'),
+                ('Holly', 'Gennero', 'holly@example.com'),
+                ('Karl', 'Vreski', 'karl@example.com'),
+                ('Theo', 'Gruber, Jr.', 'theo@example.com'),
+            )
+        ]
+
+    def test_export_users_ndjson(self):
+        response = self.request_get(PATH)
+
+        self.assertEqual(response.headers['content-type'], 'application/x-ndjson')
+        self.assertListEqual(
+            [json.loads(line) for line in response.text.splitlines()],
+            [
+                {'id': user.id, 'name': user.name, 'email': user.email, 'state_name': 'ENABLED'}
+                for user in self.users
+            ]
+        )
+
+    def test_export_users_csv(self):
+        response = self.request_get(PATH, params={'format': 'csv', 'search': 'Gruber', 'sorting': '-first_name'})
+
+        self.assertEqual(response.headers['content-type'], 'text/csv')
+        self.assertEqual(
+            response.text,
+            'id,name,email,state_name\r\n'
+            f'{self.users[4].id},"Theo Gruber, Jr.",theo@example.com,ENABLED\r\n'
+            f'{self.users[1].id},Hans Gruber,hans@example.com,ENABLED\r\n'
+        )
+
+    def test_export_users_in_chunks(self):
+        with patch.object(UserExportResourceV2, 'export_batch_size', 2):
+            response = self.request_get(PATH, params={'sorting': 'last_name'})
+
+        self.assertListEqual(
+            [json.loads(line)['email'] for line in response.text.splitlines()],
+            ['holly@example.com', 'hans@example.com', 'theo@example.com', 'john@example.com', 'karl@example.com']
+        )
+
+    def test_export_users_invalid_format(self):
+        self.request_get(PATH, params={'format': 'xml'}, status=HTTP_422)
+
+    def test_export_users_not_available_in_v1(self):
+        self.request_get('/v1/users/export', status=HTTP_404)
@@ -4,10 +4,12 @@
 
 import pytest
 
-from unittest.mock import ANY
+from unittest.mock import ANY, patch
 
-from falcon import HTTP_200, HTTP_204, HTTP_404, HTTP_422
+from falcon import HTTP_200, HTTP_204, HTTP_304, HTTP_404, HTTP_422
 
+import settings
+from users.models import User
 from users.tests.test_api import BaseUserTestCase
 
 
@@ -165,3 +167,65 @@ class UserGetTestCase(BaseUserTestCase):
             response.json,
             {"title": "404 Not Found"}
         )
+
+
+@pytest.mark.apiv2
+class UserConditionalGetTestCase(BaseUserTestCase):
+    def setUp(self):
+        super().setUp()
+        # Conditional requests are answered by resources, not by response cache
+        patcher = patch.dict(settings.RESPONSE_CACHE, enabled=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.organisation = self.create_organisation('Die Hard')
+        self.user = self.create_user(self.organisation.id)
+        self.path = f'{PATH}/{self.user.id}'
+
+    def test_not_modified(self):
+        etag = self.request_get(self.path).headers['etag']
+
+        with patch.object(User, 'get_by_id', side_effect=AssertionError('Instance loaded')):
+            response = self.request_get(self.path, status=HTTP_304, headers={'If-None-Match': etag})
+
+        self.assertEqual((response.content, response.headers['etag']), (b'', etag))
+        self.request_get(self.path, status=HTTP_304, headers={'If-None-Match': f'"other", W/{etag}'})
+        self.request_get(self.path, status=HTTP_304, headers={'If-None-Match': '*'})
+
+    def test_modified_after_update(self):
+        etag = self.request_get(self.path).headers['etag']
+
+        self.request_patch(self.path, status=HTTP_204, body={
+            'first_name': 'Hans', 'last_name': 'McClane', 'organisation_id': self.organisation.id
+        })
+
+        response = self.request_get(self.path, headers={'If-None-Match': etag})
+        self.assertNotEqual(response.headers['etag'], etag)
+        self.assertEqual(response.json['name'], 'Hans McClane')
+
+    def test_modified_after_update_of_organisation(self):
+        etag = self.request_get(self.path).headers['etag']
+
+        self.organisation.update(self.db_session, name='Nakatomi')
+
+        self.assertEqual(self.request_get(self.path, headers={'If-None-Match': etag}).json['organisation'], 'Nakatomi')
+
+    def test_versions_tagged_separately(self):
+        self.assertNotEqual(
+            self.request_get(f'/v1/users/{self.user.id}').headers['etag'],
+            self.request_get(self.path).headers['etag']
+        )
+
+    def test_organisation_modified_after_new_user(self):
+        path = f'/v2/organisations/{self.organisation.id}'
+        etag = self.request_get(path).headers['etag']
+        self.request_get(path, status=HTTP_304, headers={'If-None-Match': etag})
+
+        self.create_user(self.organisation.id, first_name='Hans', last_name='Gruber', email='hans@example.com')
+
+        self.assertEqual(len(self.request_get(path, headers={'If-None-Match': etag}).json['users']), 2)
+
+    def test_unexisting_user(self):
+        response = self.request_get(f'{PATH}/{self.user.id + 1}', status=HTTP_404, headers={'If-None-Match': '*'})
+
+        self.assertNotIn('etag', response.headers)
@@ -3,10 +3,13 @@
 """
 import falcon
 
-from sqlalchemy import cast, or_, String, func
+from sqlalchemy import or_, func
 
 from core.api import BaseSortingAPI
+from core.enums import SearchTermType
+from core.utils import get_search_term_type
 from users.models import User
+from users.projections import user_v1
 from users.serializers import UserPatchRequestSchema, UserPostRequestSchema
 
 
@@ -31,14 +34,18 @@ class UserCollectionResourceV1(BaseSortingAPI):
             req (falcon.request.Request): Request object
             resp (falcon.response.Response): Response object
         """
-        paginated_filtered_result, total_objects = self.get_objects(
-            req.context.db_session, params
-        )
+        page = self.get_tagged_objects(req, resp, params, projection=user_v1)
+        if page is None:
+            return
 
-        resp.media = self.build_response(
-            total=total_objects,
-            data=paginated_filtered_result
-        )
+        paginated_filtered_result, meta = page
+        # Version 1 responses keep their original keys, the flag is listed only by version 2
+        meta.pop('total_is_cached')
+
+        self.stream_response(resp, self.build_response(
+            data=paginated_filtered_result,
+            **meta
+        ))
 
     def on_post(self, req, resp):
         """
@@ -53,9 +60,8 @@ class UserCollectionResourceV1(BaseSortingAPI):
 
         user = self.model.create(db_session, **serializer)
         resp.status = falcon.HTTP_201
-        keys = ('id', 'name', 'email')
 
-        resp.media = user.convert_object_to_dict(keys)
+        resp.media = user_v1(user)
 
     def build_query_filters(self, params):
         """
@@ -69,30 +75,40 @@ class UserCollectionResourceV1(BaseSortingAPI):
         filters = []
 
         for search_term in search_terms:
-            search_term = f'%{search_term.strip()}%'
-            filters.append(or_(*[
-                self.model.last_name.ilike(search_term),
-                self.model.first_name.ilike(search_term),
-                self.model.email.ilike(search_term),
-                cast(self.model.id, String).ilike(search_term),
-            ]))
+            search_term = search_term.strip()
+            if not search_term:
+                # Empty term matches everything
+                continue
+
+            search_term_type = get_search_term_type(search_term)
+            pattern = f'%{search_term}%'
+
+            if search_term_type == SearchTermType.ID:
+                filters.append(self.build_id_search_filter(search_term))
+            elif search_term_type == SearchTermType.EMAIL:
+                filters.append(self.model.email.ilike(pattern))
+            else:
+                filters.append(or_(
+                    self.model.last_name.ilike(pattern),
+                    self.model.first_name.ilike(pattern),
+                ))
 
         return filters
 
     @staticmethod
-    def build_response(total, data):
+    def build_response(data, total, **meta):
         """
         Build response in proper format
 
         Args:
+            data (iterable): Airport instances, they are converted while the response is sent
             total (int): total number of airports
-            data (list): list of Airport instances
+            **meta: Additional pagination data, e.g. next_cursor
         """
-        keys = ('id', 'name', 'email')
-
         return {
             'total': total,
-            'data': [item.convert_object_to_dict(keys) for item in data]
+            **meta,
+            'data': map(user_v1, data)
         }
 
 
@@ -166,8 +182,6 @@ class UserResourceV1:
         Returns:
             (dict): User instance details
         """
-        keys = ('id', 'name', 'email')
-
-        response = instance.convert_object_to_dict(keys)
+        response = user_v1(instance)
         response['organisation'] = instance.organisation.name
         return response
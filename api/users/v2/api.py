@@ -3,11 +3,14 @@
 """
 import falcon
 
-from sqlalchemy import cast, or_, String, func
+from sqlalchemy import or_, func
 
 from core.api import BaseSortingAPI
+from core.enums import SearchTermType
+from core.utils import get_search_term_type
 from users.models import User
-from users.serializers import UserPatchRequestSchema, UserPostRequestSchema
+from users.projections import user_v2
+from users.serializers import UserBulkPostRequestSchema, UserPatchRequestSchema, UserPostRequestSchema
 
 
 class UserCollectionResourceV2(BaseSortingAPI):
@@ -31,14 +34,16 @@ class UserCollectionResourceV2(BaseSortingAPI):
             req (falcon.request.Request): Request object
             resp (falcon.response.Response): Response object
         """
-        paginated_filtered_result, total_objects = self.get_objects(
-            req.context.db_session, params
-        )
+        page = self.get_tagged_objects(req, resp, params, projection=user_v2)
+        if page is None:
+            return
 
-        resp.media = self.build_response(
-            total=total_objects,
-            data=paginated_filtered_result
-        )
+        paginated_filtered_result, meta = page
+
+        self.stream_response(resp, self.build_response(
+            data=paginated_filtered_result,
+            **meta
+        ))
 
     def on_post(self, req, resp):
         """
@@ -53,9 +58,8 @@ class UserCollectionResourceV2(BaseSortingAPI):
 
         user = self.model.create(db_session, **serializer)
         resp.status = falcon.HTTP_201
-        keys = ('id', 'name', 'email', 'state_name')
 
-        resp.media = user.convert_object_to_dict(keys)
+        resp.media = user_v2(user)
 
     def build_query_filters(self, params):
         """
@@ -69,33 +73,85 @@ class UserCollectionResourceV2(BaseSortingAPI):
         filters = []
 
         for search_term in search_terms:
-            search_term = f'%{search_term.strip()}%'
-            filters.append(or_(*[
-                self.model.last_name.ilike(search_term),
-                self.model.first_name.ilike(search_term),
-                self.model.email.ilike(search_term),
-                cast(self.model.id, String).ilike(search_term),
-            ]))
+            search_term = search_term.strip()
+            if not search_term:
+                # Empty term matches everything
+                continue
+
+            search_term_type = get_search_term_type(search_term)
+            pattern = f'%{search_term}%'
+
+            if search_term_type == SearchTermType.ID:
+                filters.append(self.build_id_search_filter(search_term))
+            elif search_term_type == SearchTermType.EMAIL:
+                filters.append(self.model.email.ilike(pattern))
+            else:
+                filters.append(or_(
+                    self.model.last_name.ilike(pattern),
+                    self.model.first_name.ilike(pattern),
+                ))
 
         return filters
 
     @staticmethod
-    def build_response(total, data):
+    def build_response(data, total, **meta):
         """
         Build response in proper format
 
         Args:
+            data (iterable): Airport instances, they are converted while the response is sent
             total (int): total number of airports
-            data (list): list of Airport instances
+            **meta: Additional pagination data, e.g. next_cursor
         """
-        keys = ('id', 'name', 'email', 'state_name')
-
         return {
             'total': total,
-            'data': [item.convert_object_to_dict(keys) for item in data]
+            **meta,
+            'data': map(user_v2, data)
         }
 
 
+class UserExportResourceV2(UserCollectionResourceV2):
+    """
+    User API method to export all filtered and sorted instances.
+    """
+
+    def on_get(self, req, resp, params):
+        """
+        Get stream of all Users as NDJSON or CSV
+
+        Args:
+            req (falcon.request.Request): Request object
+            resp (falcon.response.Response): Response object
+            params (dict): Query params
+        """
+        self.export(resp, params, user_v2)
+
+
+class UserBulkResourceV2:
+    """
+    User API method to create many instances at once.
+    """
+    serializers = {
+        'post': UserBulkPostRequestSchema
+    }
+
+    def on_post(self, req, resp):
+        """
+        Post create User instances in one transaction
+
+        Args:
+            req (falcon.request.Request): Request object
+            resp (falcon.response.Response): Response object
+        """
+        serializer = req.context['serializer']
+        db_session = req.context['db_session']
+
+        users = User.bulk_create(db_session, serializer)
+        resp.status = falcon.HTTP_201
+
+        resp.media = {'data': [user_v2(user) for user in users]}
+
+
 class UserResourceV2:
     """
     Organisation API methods to handle single instance.
@@ -166,8 +222,6 @@ class UserResourceV2:
         Returns:
             (dict): User instance details
         """
-        keys = ('id', 'name', 'email', 'state_name')
-
-        response = instance.convert_object_to_dict(keys)
+        response = user_v2(instance)
         response['organisation'] = instance.organisation.name
         return response
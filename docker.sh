@@ -18,6 +18,7 @@ Containers:
 Tests:
     ipdb                            allow to use ipdb (run all containers and attach to api container)
     pytests [options]               run python tests
+    benchmark <name>                run benchmark from api/benchmarks against separate database
 
 Utils:
     shell                           Run ipython console with loaded models and created session under "db_session" variable
@@ -44,6 +45,9 @@ case "$1" in
     pytests)
         docker-compose run -e API_ENV=tests --rm api pytest -s ${@:2}
         ;;
+    benchmark)
+        docker-compose run -e API_ENV=benchmarks --rm api python -m benchmarks.$2
+        ;;
     coverage)
         docker-compose run -e API_ENV=tests --rm api pytest --cov=api
         ;;